@@ -0,0 +1,183 @@
+import hashlib
+import json
+import mmap
+import os
+
+import pygame
+import settings
+import tracer
+
+# Version of the baked asset format, bumped whenever the layout changes
+BAKE_FORMAT_VERSION = 1
+
+# Process-wide cache of loaded sprites. Every car created from the same
+# image, size and alpha mode shares one decoded surface and mask
+_sprite_cache = {}
+
+
+class SpriteAsset:
+    """
+    Decoded and scaled sprite image with its collision mask (None when
+    masks aren't used). Instances are shared between sprites, so they must
+    be treated as read-only
+    """
+
+    def __init__(self, image, mask=None, with_mask=True):
+        self.image = image
+        if mask is None and with_mask:
+            mask = pygame.mask.from_surface(image)
+        self.mask = mask
+
+
+def car_image_size(original_size, width):
+    original_width, original_height = original_size
+
+    # Calculate image aspect ratio
+    aspect_ratio = original_height / original_width
+
+    # Fit the image to the target width while maintaining aspect ratio
+    return width, width * aspect_ratio
+
+
+def road_image_size(original_size, width):
+    original_width, original_height = original_size
+
+    # Calculate image aspect ratio
+    aspect_ratio = original_width / original_height
+
+    # Fit the road to the screen width
+    return width, width * aspect_ratio
+
+
+def load_sprite(
+    image_path, width, placeholder_size, placeholder_colour, alpha=True
+):
+    # Collision masks are only built when collisions are checked by pixel
+    with_mask = settings.COLLISION_MODE == "mask"
+
+    # Return the cached asset if this sprite has already been loaded
+    key = (
+        image_path,
+        width,
+        alpha,
+        placeholder_size,
+        placeholder_colour,
+        with_mask,
+    )
+    asset = _sprite_cache.get(key)
+    if asset is not None:
+        return asset
+
+    # Decoding and scaling can stall a frame, so it shows in the trace
+    with tracer.span("load_sprite", "io", {"path": image_path}):
+        asset = _load_sprite_asset(
+            image_path, width, placeholder_size, placeholder_colour, alpha,
+            with_mask,
+        )
+    _sprite_cache[key] = asset
+    return asset
+
+
+def _load_sprite_asset(
+    image_path, width, placeholder_size, placeholder_colour, alpha, with_mask
+):
+    # Prefer the pre-scaled blob and mask written by bake_assets.py
+    baked = load_baked(image_path, width, alpha, with_mask)
+    if baked is not None:
+        return SpriteAsset(*baked, with_mask=with_mask)
+    try:
+        image = _decode_scaled_image(image_path, width, car_image_size, alpha)
+    # If there is an error loading the image, fall back to a placeholder
+    except (pygame.error, FileNotFoundError):
+        print(
+            f"Warning: Could not load image {image_path}. Using placeholder."
+        )
+        image = pygame.Surface(placeholder_size, pygame.SRCALPHA)
+        image.fill(placeholder_colour)
+    return SpriteAsset(image, with_mask=with_mask)
+
+
+def clear_cache():
+    # Drop every cached sprite (e.g. after the display has been recreated)
+    _sprite_cache.clear()
+
+
+def load_scaled_image(image_path, width, size_rule, alpha=True):
+    # Use the baked copy if there is an up-to-date one
+    baked = load_baked(image_path, width, alpha)
+    if baked is not None:
+        return baked[0]
+    return _decode_scaled_image(image_path, width, size_rule, alpha)
+
+
+def _decode_scaled_image(image_path, width, size_rule, alpha):
+    # Load the image and convert it to the display format, if there is one
+    image = pygame.image.load(image_path)
+    if pygame.display.get_surface() is not None:
+        image = image.convert_alpha() if alpha else image.convert()
+
+    # Transform image to its in-game size
+    return pygame.transform.scale(
+        image, size_rule(image.get_size(), width)
+    )
+
+
+def baked_name(image_path, width, alpha):
+    # File name stem for a baked asset, unique per source, size and alpha mode
+    stem = os.path.splitext(os.path.basename(image_path))[0]
+    return f"{stem}-{width}-{'alpha' if alpha else 'opaque'}"
+
+
+def source_hash(image_path):
+    # Hash the source file contents so edited images invalidate the bake
+    with open(image_path, "rb") as source:
+        return hashlib.sha256(source.read()).hexdigest()
+
+
+def load_baked(image_path, width, alpha=True, with_mask=True):
+    """
+    Load a baked image (and mask, for alpha sprites, unless with_mask is
+    False) from the asset cache. Returns None if there is no bake or the
+    source image has changed
+    """
+    manifest_path = os.path.join(
+        settings.ASSET_CACHE_DIR,
+        baked_name(image_path, width, alpha) + ".json",
+    )
+    try:
+        with open(manifest_path, "r") as manifest_file:
+            manifest = json.load(manifest_file)
+        if (
+            manifest["version"] != BAKE_FORMAT_VERSION
+            or manifest["sha256"] != source_hash(image_path)
+        ):
+            print(
+                f"Warning: Baked asset for {image_path} is out of date."
+                f" Run bake_assets.py to refresh it."
+            )
+            return None
+
+        size = tuple(manifest["size"])
+        image = _map_surface(manifest["pixels"], size, manifest["format"])
+        mask = None
+        if with_mask and manifest.get("mask"):
+            # The mask is stored as white (set) and black (unset) pixels
+            mask_surface = _map_surface(manifest["mask"], size, "RGB")
+            mask = pygame.mask.from_threshold(
+                mask_surface, settings.WHITE, (1, 1, 1, 255)
+            )
+    except (OSError, ValueError, KeyError, pygame.error):
+        return None
+
+    # Convert to the display format when there is a display to match
+    if pygame.display.get_surface() is not None:
+        image = image.convert_alpha() if alpha else image.convert()
+    return image, mask
+
+
+def _map_surface(file_name, size, pixel_format):
+    # Memory-map a raw pixel blob and wrap it in a surface without copying
+    blob_path = os.path.join(settings.ASSET_CACHE_DIR, file_name)
+    with open(blob_path, "rb") as blob:
+        pixels = mmap.mmap(blob.fileno(), 0, access=mmap.ACCESS_READ)
+    return pygame.image.frombuffer(pixels, size, pixel_format)
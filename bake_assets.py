@@ -0,0 +1,106 @@
+import argparse
+import json
+import os
+
+import pygame
+import assets
+import settings
+
+
+def baked_assets():
+    """
+    Every image the game loads, with the width and alpha mode it is used at
+    """
+    return [
+        (
+            settings.PLAYER_IMAGE_PATH,
+            settings.PLACEHOLDER_CAR_WIDTH,
+            assets.car_image_size,
+            True,
+        ),
+        (
+            settings.NPC_IMAGE_PATH,
+            settings.PLACEHOLDER_CAR_WIDTH,
+            assets.car_image_size,
+            True,
+        ),
+        (
+            settings.ROAD_IMAGE_PATH,
+            settings.SCREEN_WIDTH,
+            assets.road_image_size,
+            False,
+        ),
+    ]
+
+
+def bake_asset(image_path, width, size_rule, alpha, force=False):
+    name = assets.baked_name(image_path, width, alpha)
+    manifest_path = os.path.join(settings.ASSET_CACHE_DIR, name + ".json")
+    digest = assets.source_hash(image_path)
+
+    # Skip assets whose source image hasn't changed since the last bake
+    if not force and os.path.exists(manifest_path):
+        with open(manifest_path, "r") as manifest_file:
+            manifest = json.load(manifest_file)
+        if (
+            manifest.get("version") == assets.BAKE_FORMAT_VERSION
+            and manifest.get("sha256") == digest
+        ):
+            return False
+
+    # Decode and scale the image exactly as the game would
+    image = pygame.image.load(image_path)
+    image = pygame.transform.scale(
+        image, size_rule(image.get_size(), width)
+    )
+    pixel_format = "RGBA" if alpha else "RGB"
+
+    manifest = {
+        "version": assets.BAKE_FORMAT_VERSION,
+        "source": image_path,
+        "sha256": digest,
+        "size": list(image.get_size()),
+        "format": pixel_format,
+        "pixels": name + ".raw",
+        "mask": None,
+    }
+    raw_path = os.path.join(settings.ASSET_CACHE_DIR, name + ".raw")
+    with open(raw_path, "wb") as raw:
+        raw.write(pygame.image.tobytes(image, pixel_format))
+
+    # Only sprites need a collision mask
+    if alpha:
+        mask_surface = pygame.mask.from_surface(image).to_surface(
+            setcolor=settings.WHITE, unsetcolor=settings.BLACK
+        )
+        manifest["mask"] = name + ".mask"
+        mask_path = os.path.join(settings.ASSET_CACHE_DIR, name + ".mask")
+        with open(mask_path, "wb") as mask_file:
+            mask_file.write(pygame.image.tobytes(mask_surface, "RGB"))
+
+    # Write the manifest last so a partial bake is never picked up
+    with open(manifest_path, "w") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+    return True
+
+
+def main():
+    """Pre-scales every game image into the asset cache"""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="rebake assets even if their source hasn't changed",
+    )
+    args = parser.parse_args()
+
+    os.makedirs(settings.ASSET_CACHE_DIR, exist_ok=True)
+    for image_path, width, size_rule, alpha in baked_assets():
+        if bake_asset(image_path, width, size_rule, alpha, args.force):
+            print(f"Baked {image_path}")
+        else:
+            print(f"Up to date: {image_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+import argparse
+import time
+
+import numpy as np
+import rules
+import settings
+
+from car import car_asset, collision_table
+from spawn_scheduler import TIME_EPSILON
+
+# Columns of the actions array passed to BatchEnv.step
+ACCELERATE = 0
+BRAKE = 1
+LEFT = 2
+RIGHT = 3
+ACTION_COUNT = 4
+
+
+class BatchEnv:
+    """
+    Runs many independent races in lockstep. Each race is a row of NumPy
+    arrays and step() advances all of them at once, using the same rules
+    as World. Finished races start again automatically
+    """
+
+    def __init__(self, race_count, seed=None):
+        self.race_count = race_count
+        self.screen_width = settings.SCREEN_WIDTH
+        self.screen_height = settings.SCREEN_HEIGHT
+        # Length of one simulation step in seconds
+        self.dt = 1.0 / settings.SIMULATION_HZ
+        self.rng = np.random.default_rng(seed)
+
+        # Car sizes come from the same images the game draws
+        self.player_width, self.player_height = car_asset(
+            settings.PLAYER_IMAGE_PATH
+        ).image.get_size()
+        npc_asset = car_asset(settings.NPC_IMAGE_PATH, is_npc=True)
+        self.npc_width, self.npc_height = npc_asset.image.get_size()
+        # In mask collision mode, the same table of touching offsets as
+        # the World, so races here crash exactly where the game's do
+        self.collision_hits = None
+        if npc_asset.mask is not None:
+            self.collision_hits = collision_table(
+                car_asset(settings.PLAYER_IMAGE_PATH).mask, npc_asset.mask
+            )
+
+        # The player only moves sideways
+        self.player_top = settings.PLAYER_Y_POS - self.player_height // 2
+        self.player_bottom = self.player_top + self.player_height
+        # Left edge of an NPC in each lane
+        self.npc_lane_lefts = (
+            np.array(settings.LANE_POSITIONS) - self.npc_width // 2
+        )
+
+        # Per-race state
+        self.road_offset = np.zeros(race_count)
+        self.road_speed = np.zeros(race_count)
+        self.player_x = np.zeros(race_count)
+        self.horizontal_speed = np.zeros(race_count)
+        self.score = np.zeros(race_count, dtype=np.int64)
+        self.done = np.zeros(race_count, dtype=bool)
+        # Simulated time until each race's next NPC spawn
+        self.time_until_spawn = np.zeros(race_count)
+        # Score each race finished with, kept after it restarts
+        self.final_score = np.zeros(race_count, dtype=np.int64)
+
+        # Per-race NPC slots, as (race, slot) arrays
+        slots = (race_count, settings.MAX_NPCS)
+        self.npc_y = np.zeros(slots)
+        self.npc_speed = np.zeros(slots)
+        self.npc_lane = np.zeros(slots, dtype=np.int64)
+        self.npc_alive = np.zeros(slots, dtype=bool)
+        self.npc_passed = np.zeros(slots, dtype=bool)
+
+        self.reset()
+
+    def reset(self, races=None):
+        # Start the given races (a boolean mask, all races by default)
+        # from the beginning
+        if races is None:
+            races = np.ones(self.race_count, dtype=bool)
+        self.road_offset[races] = 0.0
+        self.road_speed[races] = 0.0
+        self.player_x[races] = settings.PLAYER_START_X_POS
+        self.horizontal_speed[races] = 0.0
+        self.score[races] = 0
+        self.time_until_spawn[races] = self._spawn_gaps(
+            np.count_nonzero(races)
+        )
+        self.npc_alive[races] = False
+        self.npc_passed[races] = False
+
+    def step(self, actions):
+        """
+        Advance every race by one step. actions is a (race_count,
+        ACTION_COUNT) array of held controls. Returns the points scored
+        and the done flag of every race
+        """
+        actions = np.asarray(actions, dtype=bool)
+        self._spawn_npcs()
+
+        # Change road speed based on accelerate/brake input
+        self.road_speed = rules.throttle(
+            self.road_speed,
+            actions[:, ACCELERATE],
+            actions[:, BRAKE],
+            self.dt,
+        )
+        # Steer left, then right, like the World does
+        self._steer(actions[:, LEFT], -1)
+        self._steer(actions[:, RIGHT], 1)
+
+        # Move the road, and keep the player on the screen
+        self.road_offset += self.road_speed * self.dt
+        half_width = self.player_width // 2
+        np.clip(
+            self.player_x,
+            half_width,
+            self.screen_width - self.player_width + half_width,
+            out=self.player_x,
+        )
+
+        # Move the NPCs and despawn the ones that left the screen
+        self.npc_y = rules.move_npc(
+            self.npc_y, self.road_speed[:, None], self.npc_speed, self.dt
+        )
+        npc_tops = rules.whole_pixels(self.npc_y)
+        self.npc_alive &= ~rules.off_screen(npc_tops, self.screen_height)
+        self.npc_passed &= self.npc_alive
+
+        # A race is over once its player hits an NPC
+        player_left = rules.whole_pixels(np.round(self.player_x)) - half_width
+        npc_lefts = self.npc_lane_lefts[self.npc_lane]
+        if self.collision_hits is None:
+            touching = rules.overlaps(
+                npc_lefts,
+                npc_tops,
+                self.npc_width,
+                self.npc_height,
+                player_left[:, None],
+                self.player_top,
+                self.player_width,
+                self.player_height,
+            )
+        else:
+            touching = rules.mask_overlaps(
+                self.collision_hits,
+                player_left[:, None],
+                self.player_top,
+                npc_lefts,
+                npc_tops,
+                self.npc_width,
+                self.npc_height,
+            )
+        hits = self.npc_alive & touching
+        done = hits.any(axis=1)
+
+        # Score NPCs passed for the first time
+        newly_passed = (
+            self.npc_alive
+            & ~self.npc_passed
+            & rules.passed(npc_tops, self.player_bottom)
+        )
+        self.npc_passed |= newly_passed
+        rewards = newly_passed.sum(axis=1) * rules.PASS_SCORE
+        self.score += rewards
+
+        # Restart finished races
+        self.done = done
+        if done.any():
+            self.final_score[done] = self.score[done]
+            self.reset(done)
+        return rewards, done
+
+    def _steer(self, held, direction):
+        # Speed up sideways where the direction is held, and stop moving
+        # that way where it isn't
+        steered = rules.steer(
+            self.horizontal_speed,
+            direction,
+            settings.HORIZONTAL_ACCELERATION_CONSTANT,
+            self.dt,
+        )
+        stopped = np.where(
+            self.horizontal_speed * direction > 0, 0.0, self.horizontal_speed
+        )
+        self.horizontal_speed = np.where(held, steered, stopped)
+        self.player_x += np.where(held, self.horizontal_speed * self.dt, 0.0)
+
+    def _spawn_gaps(self, count):
+        # Seconds until the next spawn for count races, chosen the same
+        # way as the World's SpawnScheduler
+        interval = settings.NPC_SPAWN_INTERVAL
+        if settings.NPC_SPAWN_MODE == "jittered":
+            jitter = settings.NPC_SPAWN_JITTER
+            return interval * (1 + self.rng.uniform(-jitter, jitter, count))
+        if settings.NPC_SPAWN_MODE == "poisson":
+            return self.rng.exponential(interval, count)
+        return np.full(count, float(interval))
+
+    def _spawn_npcs(self):
+        # Each race spawns at most one NPC per step, when its next spawn
+        # falls due
+        self.time_until_spawn -= self.dt
+        due = self.time_until_spawn <= TIME_EPSILON
+        if not due.any():
+            return
+        self.time_until_spawn[due] += self._spawn_gaps(np.count_nonzero(due))
+
+        # Find the lanes with an NPC too close to the top of the screen
+        lane_count = len(settings.LANE_POSITIONS)
+        blocking = self.npc_alive & rules.blocks_spawn(
+            rules.whole_pixels(self.npc_y), self.screen_height
+        )
+        blocked = np.zeros((self.race_count, lane_count), dtype=bool)
+        race_ids, slots = np.nonzero(blocking)
+        blocked[race_ids, self.npc_lane[race_ids, slots]] = True
+
+        # Spawn in races with a free slot and at least one open lane
+        free = ~self.npc_alive
+        spawning = due & free.any(axis=1) & ~blocked.all(axis=1)
+        race_ids = np.nonzero(spawning)[0]
+        if len(race_ids) == 0:
+            return
+
+        # Pick a random open lane in each race
+        lane_scores = self.rng.random((len(race_ids), lane_count))
+        lane_scores[blocked[race_ids]] = -1.0
+        lanes = lane_scores.argmax(axis=1)
+
+        # Put the NPC, centred one car height above the screen, in the
+        # first free slot
+        slots = free[race_ids].argmax(axis=1)
+        self.npc_y[race_ids, slots] = (
+            -settings.PLACEHOLDER_CAR_HEIGHT - self.npc_height // 2
+        )
+        self.npc_speed[race_ids, slots] = self.rng.integers(
+            settings.NPC_MIN_SPEED,
+            settings.NPC_MAX_SPEED,
+            size=len(race_ids),
+            endpoint=True,
+        )
+        self.npc_lane[race_ids, slots] = lanes
+        self.npc_alive[race_ids, slots] = True
+        self.npc_passed[race_ids, slots] = False
+
+
+def main():
+    # Measure how many race steps per second the batch runs at
+    parser = argparse.ArgumentParser(
+        description="Benchmark stepping many races at once."
+    )
+    parser.add_argument("--races", type=int, default=4096)
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    env = BatchEnv(args.races, seed=args.seed)
+    # Accelerate everywhere, with a random mix of steering
+    actions = np.zeros((args.races, ACTION_COUNT), dtype=bool)
+    actions[:, ACCELERATE] = True
+    actions[:, LEFT] = env.rng.random(args.races) < 0.3
+    actions[:, RIGHT] = env.rng.random(args.races) < 0.3
+
+    start = time.perf_counter()
+    for _ in range(args.steps):
+        env.step(actions)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{args.races * args.steps / elapsed:,.0f} race steps per second"
+        f" ({args.races} races x {args.steps} steps in {elapsed:.2f}s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# Compare the cost of the player's collision check as NPC traffic grows,
+# scanning every NPC against the World's own lane-indexed check.
+# Run from the repository root: python benchmarks/bench_collisions.py
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+
+# Load the car images without a window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# Let the benchmark import the game's modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rules
+import settings
+from car import car_asset
+from npc_manager import NPCManager
+from world import World
+
+
+def build_traffic(npc_count, rng):
+    # Spread NPCs over every lane, queued up the road above the screen,
+    # sized from the same image the game's NPCs use
+    width, height = car_asset(
+        settings.NPC_IMAGE_PATH, is_npc=True
+    ).image.get_size()
+    lane_count = len(settings.LANE_POSITIONS)
+    npcs = NPCManager(npc_count, width, height, lane_count)
+    road_length = max(npc_count, lane_count) * height * 2
+    for _ in range(npc_count):
+        lane_id = int(rng.integers(lane_count))
+        y_pos = float(rng.uniform(-road_length, settings.SCREEN_HEIGHT))
+        npcs.spawn(settings.LANE_POSITIONS[lane_id], y_pos, 0, lane_id)
+    # Build the lane index, as a world step would
+    npcs.update(0, settings.SCREEN_HEIGHT, 1)
+    return npcs
+
+
+def full_scan(npcs, rect):
+    # Test every NPC's rect against rect, as before the lane index
+    return rules.overlaps(
+        npcs.lefts(),
+        npcs.tops(),
+        npcs.car_width,
+        npcs.car_height,
+        rect.left,
+        rect.top,
+        rect.width,
+        rect.height,
+    ).any()
+
+
+def time_call(function, repeats):
+    # Best time per call in microseconds
+    timer = timeit.Timer(function)
+    loops, _ = timer.autorange()
+    best = min(timer.repeat(repeats, loops))
+    return best / loops * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark collision checks against NPC count."
+    )
+    parser.add_argument(
+        "--counts",
+        type=int,
+        nargs="+",
+        default=[5, 50, 100, 250, 500, 1000, 5000],
+    )
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    # The World's real player car, at its starting position
+    world = World(seed=args.seed)
+    player = world.player_car.rect
+
+    print(f"{'NPCs':>6} {'full scan (us)':>15} {'lane index (us)':>16}")
+    for count in args.counts:
+        npcs = build_traffic(count, rng)
+        world.npcs = npcs
+        full = time_call(lambda: full_scan(npcs, player), args.repeats)
+        indexed = time_call(world._check_collisions, args.repeats)
+        print(f"{count:>6} {full:>15.2f} {indexed:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
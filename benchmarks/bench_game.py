@@ -0,0 +1,261 @@
+# Benchmark the real Game loop headlessly with scripted, seeded input.
+# Each scenario runs in a fresh process and reports loop iterations per
+# second, per-phase timings of the frames drawn, idle wakeups, CPU time
+# and peak memory as JSON.
+# Run from the repository root: python benchmarks/bench_game.py
+# Compare against a stored run with --baseline results.json
+import argparse
+import concurrent.futures
+import contextlib
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+
+# Draw into the SDL dummy driver, without a window or sound
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+# Only the JSON report goes to stdout, so it can be saved as a baseline
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+# Let the benchmark import the game's modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import settings
+
+from game import Game
+from profiler import FrameProfiler
+from tournament import apply_settings
+from world import InputState
+
+# Key presses used by the scripts
+ANY_KEY = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
+RESTART_KEY = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_r)
+
+
+class StepClock:
+    """
+    Stands in for pygame's clock, reporting exactly one simulation step
+    per frame. Frames run as fast as they can, and the simulation (and so
+    the traffic) is the same on every run
+    """
+
+    def __init__(self):
+        self.frames = 0
+        self.start = time.perf_counter()
+
+    def tick(self, framerate=0):
+        self.frames += 1
+        return 1000 / settings.SIMULATION_HZ
+
+    def get_fps(self):
+        elapsed = time.perf_counter() - self.start
+        return self.frames / elapsed if elapsed else 0.0
+
+    def get_time(self):
+        return 1000 / settings.SIMULATION_HZ
+
+
+def idle_script(frame, game):
+    # Leave the instructions screen up
+    return InputState(), []
+
+
+def cruise_script(frame, game):
+    # Start the game, then hold the accelerator
+    events = [ANY_KEY] if game.show_instructions else []
+    return InputState(accelerate=True), events
+
+
+def reset_script(frame, game):
+    # Drive into traffic, then restart each time the game ends
+    if game.game_over:
+        return InputState(), [RESTART_KEY]
+    if game.show_instructions:
+        return InputState(), [ANY_KEY]
+    return InputState(accelerate=True), []
+
+
+# name: (script, settings overrides, whether the player survives crashes)
+SCENARIOS = {
+    "idle_instructions": (idle_script, {"IDLE_WAIT_TIMEOUT_MS": 1}, False),
+    "max_speed_cruise": (cruise_script, {"NPC_SPAWN_INTERVAL": 10**6}, False),
+    "dense_traffic": (
+        cruise_script,
+        {"NPC_SPAWN_INTERVAL": 0.05, "MAX_NPCS": 200},
+        True,
+    ),
+    "game_over_reset": (
+        reset_script,
+        {"NPC_SPAWN_INTERVAL": 0.25, "IDLE_WAIT_TIMEOUT_MS": 1},
+        False,
+    ),
+}
+
+
+def run_scenario(name, frames, seed):
+    """
+    Play one scenario for the given number of frames and return its
+    results
+    """
+    script, overrides, survive = SCENARIOS[name]
+    high_score_path = os.path.join(tempfile.mkdtemp(), "highscore.txt")
+    apply_settings(dict(overrides, HIGH_SCORE_FILE_PATH=high_score_path))
+
+    game = Game(seed=seed)
+    game.clock = StepClock()
+    game.profiler = FrameProfiler(frames)
+    # Keep the timings in memory rather than writing them on exit
+    game._dump_profile = lambda: None
+
+    if survive:
+        # Collisions are still checked, but never end the game
+        world = game.world
+        check_collisions = world._check_collisions
+
+        def check_without_crashing():
+            check_collisions()
+            world.game_over = False
+
+        world._check_collisions = check_without_crashing
+
+    # Feed the script's input to the game in place of the keyboard
+    handle_events = game._handle_events
+    played = []
+
+    def scripted_events(events):
+        inputs, script_events = script(len(played), game)
+        game._read_inputs = lambda: inputs
+        handle_events(list(events) + script_events)
+        played.append(inputs)
+        if len(played) >= frames:
+            game.running = False
+
+    game._handle_events = scripted_events
+
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    game.run()
+    cpu_seconds = time.process_time() - cpu_start
+    elapsed = time.perf_counter() - start
+
+    # Only frames that redraw reach the profiler, so an idle screen that
+    # just wakes up and goes back to sleep is counted separately
+    drawn_frames = game.profiler.frame_count
+    if drawn_frames == 0:
+        raise RuntimeError(
+            f"{name}: no frames were profiled in {len(played)} loop"
+            " iterations, so there are no phase timings to report"
+        )
+
+    return {
+        "scenario": name,
+        "seed": seed,
+        # Loop iterations, drawn or not
+        "frames": len(played),
+        "seconds": elapsed,
+        "fps": len(played) / elapsed,
+        "drawn_frames": drawn_frames,
+        "idle_wakeups": len(played) - drawn_frames,
+        "cpu_seconds": cpu_seconds,
+        "cpu_percent": 100 * cpu_seconds / elapsed,
+        "phases_ms": game.profiler.stats(),
+        # Kilobytes on Linux
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "score": game.world.score,
+        "npcs_spawned": game.world.npcs.next_id,
+    }
+
+
+def run_quietly(name, frames, seed):
+    # Run a scenario with anything the game prints sent to stderr, so it
+    # can't get mixed into the report
+    with contextlib.redirect_stdout(sys.stderr):
+        return run_scenario(name, frames, seed)
+
+
+def find_regressions(results, baseline, tolerance):
+    """
+    Compare results with a baseline run, returning a message for each
+    scenario that got slower or used more memory by more than tolerance
+    """
+    previous = {result["scenario"]: result for result in baseline}
+    regressions = []
+    for result in results:
+        old = previous.get(result["scenario"])
+        if old is None:
+            continue
+        name = result["scenario"]
+        if result["fps"] < old["fps"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: fps {old['fps']:.0f} -> {result['fps']:.0f}"
+            )
+        old_p95 = old["phases_ms"].get("frame", {}).get("p95")
+        new_p95 = result["phases_ms"].get("frame", {}).get("p95")
+        if old_p95 and new_p95 and new_p95 > old_p95 * (1 + tolerance):
+            regressions.append(
+                f"{name}: frame p95 {old_p95:.3f} ms -> {new_p95:.3f} ms"
+            )
+        old_cpu = old.get("cpu_seconds")
+        if old_cpu and result["cpu_seconds"] > old_cpu * (1 + tolerance):
+            regressions.append(
+                f"{name}: CPU time {old_cpu:.2f} s"
+                f" -> {result['cpu_seconds']:.2f} s"
+            )
+        if result["peak_rss_kb"] > old["peak_rss_kb"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: peak memory {old['peak_rss_kb']} kB"
+                f" -> {result['peak_rss_kb']} kB"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark scripted scenarios of the real game."
+    )
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=sorted(SCENARIOS), default=None
+    )
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="file to write the results to")
+    parser.add_argument("--baseline", help="results file to compare with")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="allowed slowdown before a regression is flagged (0.1 = 10%%)",
+    )
+    args = parser.parse_args()
+
+    # One process per scenario, so each starts clean and has its own
+    # peak memory
+    results = []
+    for name in args.scenarios or SCENARIOS:
+        with concurrent.futures.ProcessPoolExecutor(1) as pool:
+            future = pool.submit(run_quietly, name, args.frames, args.seed)
+            results.append(future.result())
+
+    report = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            output_file.write(report + "\n")
+    else:
+        print(report)
+
+    if args.baseline:
+        with open(args.baseline, "r") as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = find_regressions(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
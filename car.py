@@ -1,53 +1,45 @@
 import pygame
+import assets
+import rules
 import settings
 
 
-class Car(pygame.sprite.Sprite):
-    def __init__(self, car_image, x_pos, y_pos, speed=0, is_npc=False):
-        super().__init__()
+def car_asset(car_image, is_npc=False):
+    # Get the shared image and mask for a car from the asset cache
+    colour = settings.BLUE if is_npc else settings.RED
+    return assets.load_sprite(
+        car_image,
+        settings.PLACEHOLDER_CAR_WIDTH,
+        (settings.PLACEHOLDER_CAR_WIDTH, settings.PLACEHOLDER_CAR_HEIGHT),
+        colour,
+    )
 
-        # Set speed variable
-        self.speed = speed
 
-        try:
-            # Load the image for the car
-            self.image = pygame.image.load(car_image).convert_alpha()
+def collision_table(mask, other_mask):
+    """
+    Boolean array, indexed by [x, y], of every offset at which a car with
+    other_mask touches a car with mask, for rules.mask_overlaps. Index
+    (other_mask width - 1, other_mask height - 1) is the offset (0, 0)
+    """
+    overlaps = mask.convolve(other_mask).to_surface()
+    return pygame.surfarray.array_red(overlaps) > 0
 
-            original_width, original_height = self.image.get_size()
 
-            # Calculate image aspect ratio
-            aspect_ratio = original_height / original_width
+class Car(pygame.sprite.DirtySprite):
+    def __init__(self, car_image, x_pos, y_pos, speed=0, is_npc=False):
+        super().__init__()
 
-            # Transform image to fit screen while maintaining aspect ratio
-            self.image = pygame.transform.scale(
-                self.image,
-                (
-                    settings.PLACEHOLDER_CAR_WIDTH,
-                    settings.PLACEHOLDER_CAR_WIDTH * aspect_ratio,
-                ),
-            )
+        # Set speed variable
+        self.speed = speed
 
-        # If there is an error loading the image, fall back to a placeholder
-        except (pygame.error, FileNotFoundError):
-            print(
-                f"Warning: Could not load image {car_image}."
-                f" Using placeholder."
-            )
-            colour = settings.BLUE if is_npc else settings.RED
-            self.image = pygame.Surface(
-                (
-                    settings.PLACEHOLDER_CAR_WIDTH,
-                    settings.PLACEHOLDER_CAR_HEIGHT,
-                ),
-                pygame.SRCALPHA,
-            )
-            self.image.fill(colour)
+        asset = car_asset(car_image, is_npc)
+        self.image = asset.image
+        self.mask = asset.mask
 
-        # Set variables for the rect and create image mask
+        # Set variables for the rect
         self.rect = self.image.get_rect()
         self.rect.centerx = x_pos
         self.rect.centery = y_pos
-        self.mask = pygame.mask.from_surface(self.image)
 
     def update(self, *args, **kwargs):
         """
@@ -59,6 +51,30 @@ class Car(pygame.sprite.Sprite):
         # Draw the car sprite onto the screen
         screen.blit(self.image, self.rect)
 
+    def move_to(self, left, top):
+        # Move the drawn sprite, flagging it for redrawing if it moved
+        if self.rect.left != left or self.rect.top != top:
+            self.rect.topleft = (left, top)
+            self.dirty = 1
+
+
+class CarView(pygame.sprite.DirtySprite):
+    """
+    Drawing view of a simulated car. It has its own rect, so it can be
+    drawn part of the way between steps without moving the car's rect
+    """
+
+    def __init__(self, car):
+        super().__init__()
+        self.image = car.image
+        self.rect = car.rect.copy()
+
+    def move_to(self, left, top):
+        # Move the drawn sprite, flagging it for redrawing if it moved
+        if self.rect.left != left or self.rect.top != top:
+            self.rect.topleft = (left, top)
+            self.dirty = 1
+
 
 class PlayerCar(Car):
     def __init__(
@@ -73,40 +89,54 @@ class PlayerCar(Car):
         )
         self.horizontal_speed = 0
 
+        # Setup floats for the centre x position, now and at the start of
+        # the last simulation step, to keep sub-pixel movement
+        self.x_float = float(self.rect.centerx)
+        self.previous_x_float = self.x_float
+
     def update(self, screen_width):
         # If player is off the edge of the screen,
         # move back onto the screen
         if self.rect.left < 0:
             self.rect.left = 0
+            self.x_float = float(self.rect.centerx)
+            self.dirty = 1
         if self.rect.right > screen_width:
             self.rect.right = screen_width
+            self.x_float = float(self.rect.centerx)
+            self.dirty = 1
 
-    def move_horizontal(self, direction):
+    def move_horizontal(self, direction, dt):
         # Moves the player horizontally (direction == -1 for left, 1 for right)
-        self.horizontal_speed += (
-            direction * self.horizontal_acceleration_constant
+        # for dt seconds
+        self.horizontal_speed = float(
+            rules.steer(
+                self.horizontal_speed,
+                direction,
+                self.horizontal_acceleration_constant,
+                dt,
+            )
         )
-        if self.horizontal_speed > settings.MAX_HORIZONTAL_SPEED:
-            self.horizontal_speed = settings.MAX_HORIZONTAL_SPEED
-        if self.horizontal_speed < -settings.MAX_HORIZONTAL_SPEED:
-            self.horizontal_speed = -settings.MAX_HORIZONTAL_SPEED
-        self.rect.centerx += self.horizontal_speed
+        self.x_float += self.horizontal_speed * dt
+        self.rect.centerx = round(self.x_float)
+        # Flag the sprite for redrawing if it moved
+        if self.horizontal_speed:
+            self.dirty = 1
 
     def reset_position(self):
         # Reset cars position to initial settings
         self.rect.centerx = self.initial_x_pos
         self.rect.centery = self.initial_y_pos
+        self.x_float = float(self.rect.centerx)
+        self.previous_x_float = self.x_float
+        self.dirty = 1
 
 
 class NPCCar(Car):
+    """
+    Drawing view of one NPC. Its position is owned by the NPCManager
+    """
+
     def __init__(self, npc_image_path, x_pos, y_pos, speed, lane_id):
         super().__init__(npc_image_path, x_pos, y_pos, speed, is_npc=True)
-        pass
-
-    def update(self, road_speed, screen_height):
-        # Change Y position by road speed - car speed
-        self.rect.y += road_speed - self.speed
-
-        # Kill NPC once it has left the screen
-        if self.rect.top > screen_height:
-            self.kill()
+        self.lane_id = lane_id
@@ -0,0 +1,144 @@
+import numpy as np
+import rules
+import settings
+
+from world import World, InputState
+
+# Order of the controls in an action
+ACTIONS = ("accelerate", "brake", "left", "right")
+
+
+class RacingEnv:
+    """
+    reset/step/render environment around the World, for bots and training.
+    Nothing touches pygame.display unless a render_mode is chosen
+    """
+
+    # "human" opens the game window, "rgb_array" draws off-screen and
+    # returns the frame's pixels
+    render_modes = ("human", "rgb_array")
+
+    def __init__(self, render_mode=None, max_steps=None):
+        if render_mode is not None and render_mode not in self.render_modes:
+            raise ValueError(f"Unsupported render mode: {render_mode}")
+        self.render_mode = render_mode
+        # Steps before an episode is cut short (None for no limit)
+        self.max_steps = max_steps
+
+        self.world = World()
+        # Game used for drawing, created on the first render
+        self.game = None
+
+        self.steps = 0
+
+        # Lanes, then player position, sideways speed and road speed
+        self.observation_size = len(settings.LANE_POSITIONS) * 2 + 3
+
+    def reset(self, seed=None):
+        """
+        Start a new episode. Returns the first observation and an info dict
+        """
+        self.world.reset(seed)
+        self.steps = 0
+        return self._observation(), self._info()
+
+    def step(self, action):
+        """
+        Advance one simulation step. action holds accelerate, brake, left
+        and right (in ACTIONS order). Returns the observation, reward,
+        terminated and truncated flags, and an info dict
+        """
+        score = self.world.score
+        self.world.step(InputState(*(bool(held) for held in action)))
+        self.steps += 1
+
+        # The reward is the points scored for passing NPCs this step
+        reward = self.world.score - score
+        terminated = self.world.game_over
+        truncated = self.max_steps is not None and self.steps >= self.max_steps
+        return self._observation(), reward, terminated, truncated, self._info()
+
+    def _observation(self):
+        """
+        For each lane, whether an NPC is ahead of (or beside) the player
+        and the gap to the nearest one as a fraction of the screen height,
+        followed by the player's x position, sideways speed and road speed
+        """
+        world = self.world
+        npcs = world.npcs
+        lane_count = len(settings.LANE_POSITIONS)
+        player_rect = world.player_car.rect
+
+        # Bottom edge of the nearest NPC in each lane not yet passed
+        tops = npcs.tops()
+        ahead = ~rules.passed(tops, player_rect.bottom)
+        nearest = np.full(lane_count, -np.inf)
+        np.maximum.at(
+            nearest,
+            npcs.lane[: len(npcs)][ahead],
+            tops[ahead] + npcs.car_height,
+        )
+        occupied = nearest > -np.inf
+        gaps = np.where(
+            occupied,
+            np.clip((player_rect.top - nearest) / world.screen_height, 0, 1),
+            1.0,
+        )
+
+        player_state = [
+            world.player_car.x_float / world.screen_width,
+            world.player_car.horizontal_speed / settings.MAX_HORIZONTAL_SPEED,
+            world.current_road_speed / settings.MAX_SPEED,
+        ]
+        return np.concatenate([occupied, gaps, player_state]).astype(
+            np.float32
+        )
+
+    def _info(self):
+        return {
+            "score": self.world.score,
+            "steps": self.steps,
+            "seed": self.world.seed,
+        }
+
+    def render(self):
+        """
+        Draw the current state. Returns an (height, width, 3) pixel array
+        in "rgb_array" mode, and None otherwise
+        """
+        if self.render_mode is None:
+            return None
+
+        # pygame's display is only loaded when rendering is asked for
+        import pygame
+        from game import Game
+
+        if self.game is None:
+            if self.render_mode == "rgb_array":
+                screen = pygame.Surface(
+                    (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+                )
+                self.game = Game(screen=screen, world=self.world)
+            else:
+                self.game = Game(world=self.world)
+            self.game.show_instructions = False
+
+        # Show the latest step rather than blending with the one before
+        self.game.accumulator = self.world.dt
+        self.game.game_over = self.world.game_over
+        self.game._draw_elements()
+
+        if self.render_mode == "human":
+            pygame.display.flip()
+            # Keep the window responsive
+            pygame.event.pump()
+            return None
+        return pygame.surfarray.array3d(self.game.screen).swapaxes(0, 1)
+
+    def close(self):
+        # Close the window, if one was opened
+        if self.game is not None:
+            import pygame
+
+            pygame.quit()
+            self.game = None
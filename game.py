@@ -1,10 +1,15 @@
 import pygame
-import random
 import settings
+import tracer
 
-from car import PlayerCar, NPCCar
+from car import CarView
+from memory_watchdog import DisabledWatchdog, MemoryWatchdog
+from npc_pool import NPCPool
+from perf_overlay import PerfOverlay
+from profiler import DisabledProfiler, FrameProfiler
 from road import Road
 from ui_manager import UIManager
+from world import World, InputState
 
 
 class Game:
@@ -12,102 +17,247 @@ class Game:
     Manages the main game loop/game states
     """
 
-    def __init__(self):
-        # Initialise the game and sound
-        pygame.init()
-        pygame.mixer.init()
+    def __init__(self, screen=None, world=None, seed=None):
+        if screen is None:
+            # Initialise the game and sound
+            pygame.init()
+            pygame.mixer.init()
 
-        # Setup the screen, caption, and clock
-        self.screen = pygame.display.set_mode(
-            (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
-        )
+            # Setup the screen and caption
+            self.screen = pygame.display.set_mode(
+                (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+            )
+            pygame.display.set_caption("Car Racing Game")
+        else:
+            # Draw off-screen into the given surface, without a window
+            # or sound
+            pygame.font.init()
+            self.screen = screen
 
         self.screen_width = self.screen.get_width()
         self.screen_height = self.screen.get_height()
 
-        pygame.display.set_caption("Car Racing Game")
+        # Setup the clock
         self.clock = pygame.time.Clock()
 
         # Set game states
         self.running = True
         self.game_over = False
         self.show_instructions = True  # Show instructions at the start
-
-        # Initialise Road, Car, and UI classes
+        # State shown by the last frame drawn (None forces the first draw)
+        self.drawn_state = None
+        # Road position in the last frame drawn, and whether the next
+        # dirty-rect frame has to repaint the whole screen
+        self.drawn_road_top = None
+        self.repaint_all = True
+
+        # Initialise Road and UI classes
         self.road = Road(
             settings.ROAD_IMAGE_PATH,
             settings.SCREEN_WIDTH,
             settings.SCREEN_HEIGHT,
         )
-        self.player_car = PlayerCar(
-            settings.PLAYER_IMAGE_PATH,
-            settings.PLAYER_START_X_POS,
-            settings.PLAYER_Y_POS,
-            settings.HORIZONTAL_ACCELERATION_CONSTANT,
-        )
         self.ui_manager = UIManager()
 
         # Assign sprite to Pygame groups
-        self.all_sprites = pygame.sprite.Group()
-        self.npc_cars = pygame.sprite.Group()
-
-        # Create Pygame groups for each lane
-        self.lane_groups = []
-        for n in range(len(settings.LANE_POSITIONS)):
-            self.lane_groups.append(pygame.sprite.Group())
-
-        self.all_sprites.add(self.player_car)
-
-        # Set score and load high score
-        self.score = 0
+        if settings.RENDER_MODE == "dirty":
+            # Tracks which sprites moved so only changed areas are redrawn
+            self.all_sprites = pygame.sprite.LayeredDirty()
+            # Never fall back to full-screen drawing on its own
+            self.all_sprites.set_timing_threshold(float("inf"))
+            # HUD text is drawn above the cars
+            self.all_sprites.add(
+                self.ui_manager.score_text,
+                self.ui_manager.high_score_text,
+                layer=1,
+            )
+        else:
+            self.all_sprites = pygame.sprite.Group()
+
+        # The simulation owns every car; NPC sprites are views of its
+        # traffic arrays, kept by NPC id
+        self.world = world if world is not None else World(seed)
+        # The player is drawn by its own view, so drawing it between steps
+        # never moves the rect the simulation collides with
+        self.player_sprite = CarView(self.world.player_car)
+        self.all_sprites.add(self.player_sprite)
+        self.npc_sprites = {}
+        # NPC sprites are reused rather than made for every spawn
+        self.npc_pool = NPCPool(self.all_sprites)
+        # Controls held down, read once per frame
+        self.inputs = InputState()
+        # Time (seconds) the simulation still has to catch up on
+        self.accumulator = 0.0
+
+        # Load high score
         self.high_score = 0
         self._load_high_score()
 
-        # Set to hold passed NPC cars
-        self.passed_npcs = set()
-
-        # Set road speed
-        self.current_road_speed = 0
-
-        # Define the NPC spawning event
-        self.NPC_SPAWN_EVENT = pygame.USEREVENT + 1
-        pygame.time.set_timer(
-            self.NPC_SPAWN_EVENT, int(settings.NPC_SPAWN_INTERVAL * 1000)
-        )
+        # Frame phase timings, if profiling is turned on
+        if settings.PROFILE_FRAMES:
+            self.profiler = FrameProfiler(settings.PROFILE_BUFFER_FRAMES)
+        else:
+            self.profiler = DisabledProfiler()
+
+        # Periodic memory snapshots, if the watchdog is turned on
+        if settings.MEMORY_WATCHDOG:
+            self.memory_watchdog = MemoryWatchdog(
+                settings.MEMORY_CHECK_INTERVAL,
+                settings.MEMORY_LOG_PATH,
+                settings.MEMORY_TOP_SITES,
+                settings.MEMORY_DUMP_THRESHOLD_KB,
+                settings.MEMORY_DUMP_PATH,
+                settings.MEMORY_TRACE_ALLOCATIONS,
+            )
+        else:
+            self.memory_watchdog = DisabledWatchdog()
+
+        # Performance overlay, shown with F3
+        self.perf_overlay = PerfOverlay()
+        # Its lines of text (None until next shown), and when they were
+        # last worked out
+        self.perf_lines = None
+        self.perf_lines_updated = 0
+        # When the window caption's FPS was last updated
+        self.caption_updated = 0
+        # Called with the game after each restart (None for nothing), so
+        # whoever runs it can report the new race's seed
+        self.on_reset = None
 
     def run(self):
+        profiler = self.profiler
         while self.running:
-            # Runs the game at the desired FPS
-            self.clock.tick(settings.TARGET_FPS)
+            with tracer.span("wait"):
+                events = self._next_frame_events()
+            # Snapshot memory if it's time to (otherwise just a clock check)
+            self.memory_watchdog.check()
+            # Time spent waiting for the next frame isn't profiled
+            profiler.begin_frame()
 
             # Handles input evets (keypresses)
-            # and game events (spawning NPC cars)
-            self._handle_events()
+            with tracer.span("events"):
+                self._handle_events(events)
+            profiler.mark("events")
 
             # Update game state (only if game is active)
-            self._update_game_state()
+            with tracer.span("update"):
+                self._update_game_state()
+            profiler.mark("update")
+
+            # Only redraw an idle screen after input or a state change
+            if not self._needs_redraw(events):
+                continue
 
             # Draw elements based on current game state
-            self._draw_elements()
+            with tracer.span("draw"):
+                changed_rects = self._draw_elements()
+            profiler.mark("draw")
+
+            with tracer.span("present"):
+                self._present(changed_rects)
+            profiler.mark("present")
+            profiler.end_frame()
 
-            # Updates the display
+        # Save the frame timings before quitting
+        self._dump_profile()
+        self.memory_watchdog.close()
+
+        # When self.running is False, quit the game
+        pygame.quit()
+
+    def _next_frame_events(self):
+        # Wait for the next frame and return the events that arrived
+        if self._is_idle():
+            # Nothing on screen can change without input, so sleep
+            # until an event arrives instead of ticking at full rate
+            events = self._wait_for_events()
+            # Time spent waiting isn't simulated
+            self.clock.tick()
+            self.accumulator = 0.0
+            return events
+
+        # Cap the frame rate, and give the time since the last frame to
+        # the simulation
+        frame_time = self.clock.tick(settings.TARGET_FPS) / 1000
+        self.accumulator += min(frame_time, settings.MAX_FRAME_TIME)
+        if self.perf_overlay.visible:
+            self.perf_overlay.record_frame(frame_time * 1000)
+        return pygame.event.get()
+
+    def _present(self, changed_rects):
+        # Updates the display (only the changed areas, if known)
+        if changed_rects is None:
             pygame.display.flip()
-            # Sets window caption to display FPS
-            # (for testing purposes, to be changed later)
+        else:
+            pygame.display.update(changed_rects)
+        # Show the FPS in the window caption, at most once a second as
+        # each change goes through the window manager
+        now = pygame.time.get_ticks()
+        if now - self.caption_updated >= settings.CAPTION_UPDATE_MS:
+            self.caption_updated = now
             pygame.display.set_caption(
                 f"Car Racing Game - FPS: {self.clock.get_fps():.2f}"
             )
 
-        # When self.running is False, quit the game
-        pygame.quit()
+    def _dump_profile(self):
+        # Write the profiler's buffered frames to the dump file
+        if not self.profiler.enabled:
+            return
+        self.profiler.dump(settings.PROFILE_DUMP_PATH)
+        print(
+            f"Saved {min(self.profiler.frame_count, self.profiler.capacity)}"
+            f" frame timings to {settings.PROFILE_DUMP_PATH}"
+        )
+
+    def _is_idle(self):
+        # The instructions and game over screens are static
+        return self.show_instructions or self.game_over
+
+    def _wait_for_events(self):
+        # Block until an event arrives or the idle timeout runs out
+        event = pygame.event.wait(settings.IDLE_WAIT_TIMEOUT_MS)
+        if event.type == pygame.NOEVENT:
+            return []
+        # Collect anything else that queued up alongside it
+        return [event] + pygame.event.get()
+
+    def _needs_redraw(self, events):
+        # Snapshot of everything an idle screen displays
+        drawn_state = (
+            self.show_instructions,
+            self.game_over,
+            self.world.score,
+            self.high_score,
+        )
+        state_changed = drawn_state != self.drawn_state
+        self.drawn_state = drawn_state
+
+        if not self._is_idle() or state_changed:
+            return True
+        # Otherwise only input can change an idle screen
+        return bool(events)
+
+    def _handle_events(self, events=None):
+        # Read the event queue unless events were already collected
+        if events is None:
+            events = pygame.event.get()
 
-    def _handle_events(self):
         # Check to see if user has quit the game
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
                 return  # Exit immediately if quitting
 
+            # F2 saves the frame timings, whatever screen is showing
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F2:
+                self._dump_profile()
+                continue
+            # F3 shows or hides the performance overlay
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.perf_overlay.toggle()
+                self.perf_lines = None
+                continue
+
             # Handle instruction screen dismissal
             if self.show_instructions:
                 if event.type == pygame.KEYDOWN:
@@ -124,46 +274,97 @@ class Game:
                 # Don't process other game events if game is over
                 continue
 
-            else:
-                if event.type == self.NPC_SPAWN_EVENT:
-                    self._spawn_npc_car()
-
-        # Handle continuous key presses for player movement
+        # Read held keys for player movement
         if not self.show_instructions and not self.game_over:
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_UP] or keys[pygame.K_w]:
-                self.current_road_speed += settings.ACCELERATION_CONSTANT
-            elif keys[pygame.K_DOWN] or keys[pygame.K_s]:
-                self.current_road_speed -= settings.BRAKING_CONSTANT
-
-            self.current_road_speed = max(
-                0, min(self.current_road_speed, settings.MAX_SPEED)
-            )
-
-            if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-                self.player_car.move_horizontal(-1)
-            # If the player is moving left and not pressing left arrow,
-            # set horizontal speed to 0
-            elif self.player_car.horizontal_speed < 0:
-                self.player_car.horizontal_speed = 0
-
-            if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-                self.player_car.move_horizontal(1)
-            # If the player is moving right and not pressing right arrow,
-            # set horizontal speed to 0
-            elif self.player_car.horizontal_speed > 0:
-                self.player_car.horizontal_speed = 0
+            self.inputs = self._read_inputs()
+
+    def _read_inputs(self):
+        # Turn the keyboard state into controls for the simulation
+        keys = pygame.key.get_pressed()
+        return InputState(
+            accelerate=keys[pygame.K_UP] or keys[pygame.K_w],
+            brake=keys[pygame.K_DOWN] or keys[pygame.K_s],
+            left=keys[pygame.K_LEFT] or keys[pygame.K_a],
+            right=keys[pygame.K_RIGHT] or keys[pygame.K_d],
+        )
 
     def _update_game_state(self):
         # Only update game state if game is active
         if not self.game_over and not self.show_instructions:
-            self.road.update(self.current_road_speed)
-            self.player_car.update(self.screen_width)
-            self.npc_cars.update(self.current_road_speed, self.screen_height)
-            self._check_collisions()
-            self._update_score()
+            # Run as many fixed-length steps as the elapsed time covers
+            while self.accumulator >= self.world.dt:
+                self.world.step(self.inputs)
+                self.accumulator -= self.world.dt
+
+                # If the player crashed, the game is over
+                if self.world.game_over:
+                    self.game_over = True
+                    # Save high score
+                    self._save_high_score()
+                    break
+
+    def _interpolation_alpha(self):
+        # How far the clock is between the last step and the next one.
+        # Idle screens show the latest state
+        if self._is_idle():
+            return 1.0
+        return min(self.accumulator / self.world.dt, 1.0)
+
+    def _sync_views(self):
+        # Draw the road and cars part of the way between their positions
+        # at the last two steps, so motion is smooth at any frame rate
+        alpha = self._interpolation_alpha()
+        world = self.world
+
+        road_offset = world.previous_road_offset + (
+            (world.road_offset - world.previous_road_offset) * alpha
+        )
+        self.road.scroll_to(road_offset)
+
+        player_car = world.player_car
+        x_pos = player_car.previous_x_float + (
+            (player_car.x_float - player_car.previous_x_float) * alpha
+        )
+        self.player_sprite.move_to(
+            round(x_pos) - player_car.rect.width // 2, player_car.rect.top
+        )
+
+        self._sync_npc_sprites(alpha)
+
+    def _sync_npc_sprites(self, alpha=1.0):
+        # Move the NPC sprites to where the simulation has put the cars
+        npcs = self.world.npcs
+        live_ids = set()
+        for npc_id, left, top, lane_id in zip(
+            npcs.ids[: len(npcs)].tolist(),
+            npcs.lefts().tolist(),
+            npcs.drawn_tops(alpha).tolist(),
+            npcs.lane[: len(npcs)].tolist(),
+        ):
+            live_ids.add(npc_id)
+            sprite = self.npc_sprites.get(npc_id)
+            if sprite is None:
+                # Take a sprite from the pool for a newly spawned NPC
+                self.npc_sprites[npc_id] = self.npc_pool.acquire(
+                    lane_id, left, top
+                )
+            else:
+                sprite.move_to(left, top)
+
+        # Return the sprites of NPCs that have despawned to the pool
+        for npc_id in list(self.npc_sprites):
+            if npc_id not in live_ids:
+                self.npc_pool.release(self.npc_sprites.pop(npc_id))
 
     def _draw_elements(self):
+        # Bring the road and car views up to date with the simulation
+        self._sync_views()
+
+        # Dirty-rect rendering only redraws the parts of the screen that
+        # changed, and reports them back to run()
+        if settings.RENDER_MODE == "dirty":
+            return self._draw_dirty_elements()
+
         # Set screen colour to black
         self.screen.fill(settings.BLACK)
         # Draw the road on the screen
@@ -176,83 +377,90 @@ class Game:
         elif self.game_over:
             # Display score and high score typically part of game over screen
             # or can be shown underneath
-            self.ui_manager.display_score(self.screen, self.score)
+            self.ui_manager.display_score(self.screen, self.world.score)
             self.ui_manager.display_high_score(self.screen, self.high_score)
             self.ui_manager.display_game_over(
-                self.screen, self.score, self.high_score
+                self.screen, self.world.score, self.high_score
             )
         else:  # Game is running
-            self.ui_manager.display_score(self.screen, self.score)
+            self.ui_manager.display_score(self.screen, self.world.score)
             self.ui_manager.display_high_score(self.screen, self.high_score)
 
-    def _spawn_npc_car(self):
-        # If there are fewer cars than the maximum on screen
-        if len(self.npc_cars) < settings.MAX_NPCS:
-            while True:
-                # Set x pos to random choice of lane positions
-                lane_id = random.randint(0, (len(settings.LANE_POSITIONS) - 1))
-                # Assume the lane is valid for spawning
-                valid_lane = True
-                # Loop through all NPC's in selected lane
-                for npc in self.lane_groups[lane_id]:
-                    # If NPC is too close to top of screen,
-                    # flag lane as not valid and run loop again
-                    if npc.rect.top < (self.screen_height // 2):
-                        valid_lane = False
-                        break
-
-                # If lane hasn't been flagged as invalid, break the loop
-                if valid_lane:
-                    break
+        if self.perf_overlay.visible:
+            self.perf_overlay.draw(self.screen, self._perf_lines())
+
+    def _draw_dirty_elements(self):
+        # The road covers the whole screen, so its visible part is the
+        # background that moved sprites are erased with
+        background = self.road.visible_surface()
+        road_moved = self.road.area.top != self.drawn_road_top
+        self.drawn_road_top = self.road.area.top
+
+        # Repaint everything if the road scrolled, an overlay is showing,
+        # or the last frame had an overlay that needs erasing
+        overlay_shown = self._is_idle() or self.perf_overlay.visible
+        full_frame = road_moved or self.repaint_all or overlay_shown
+        if full_frame:
+            self.all_sprites.repaint_rect(self.screen.get_rect())
+        self.repaint_all = overlay_shown
+
+        # The HUD is hidden behind the instructions screen
+        self.ui_manager.update_hud(
+            self.world.score,
+            self.high_score,
+            visible=not self.show_instructions,
+        )
 
-            # Set NPC x position based on the selected lane
-            npc_x_pos = settings.LANE_POSITIONS[lane_id]
+        # Draw the background, cars and HUD wherever something changed
+        changed_rects = self.all_sprites.draw(self.screen, background)
 
-            # Set y pos based on height of car
-            npc_y_pos = -settings.PLACEHOLDER_CAR_HEIGHT
-            # Set random speed in between defined min and max speed
-            npc_speed = random.randint(
-                settings.NPC_MIN_SPEED, settings.NPC_MAX_SPEED
-            )
-
-            # Create a new instance of NPCCar
-            npc = NPCCar(
-                settings.NPC_IMAGE_PATH,
-                npc_x_pos,
-                npc_y_pos,
-                npc_speed,
-                lane_id,
+        if self.show_instructions:
+            self.ui_manager.display_instructions(self.screen)
+        elif self.game_over:
+            self.ui_manager.display_game_over(
+                self.screen, self.world.score, self.high_score
             )
 
-            # Add new npc instance to sprite groups
-            self.all_sprites.add(npc)
-            self.npc_cars.add(npc)
-            self.lane_groups[lane_id].add(npc)
-
-    def _check_collisions(self):
-        # If player collides with an NPC car
-        if pygame.sprite.spritecollideany(self.player_car, self.npc_cars):
-            # Set game over to true
-            self.game_over = True
-            # Save high score
-            self._save_high_score()
-
-    def _update_score(self):
-        # Iterate through all spawned NPCs
-        for npc in list(self.npc_cars):
-            # If player has passed npc
-            if (
-                npc.rect.top > self.player_car.rect.bottom
-                and npc not in self.passed_npcs
-            ):
-                # Increase score
-                self.score += 10
-                # Add npc to list of passed NPCs
-                self.passed_npcs.add(npc)
-
-            # Remove despawned NPCs from passed_npc list
-            if not npc.alive() and npc in self.passed_npcs:
-                self.passed_npcs.remove(npc)
+        if self.perf_overlay.visible:
+            self.perf_overlay.draw(self.screen, self._perf_lines())
+
+        if full_frame:
+            return None
+        return changed_rects
+
+    def _perf_lines(self):
+        # Text shown under the performance overlay's frame time graph.
+        # The profiler's percentiles cover every buffered frame, so they
+        # are worked out at most as often as the caption's FPS
+        now = pygame.time.get_ticks()
+        if (
+            self.perf_lines is None
+            or now - self.perf_lines_updated >= settings.CAPTION_UPDATE_MS
+        ):
+            self.perf_lines = self._build_perf_lines()
+            self.perf_lines_updated = now
+        return self.perf_lines
+
+    def _build_perf_lines(self):
+        lines = [f"FPS {self.clock.get_fps():.1f}"]
+        stats = self.profiler.stats()
+        if stats:
+            for phase, phase_stats in stats.items():
+                lines.append(
+                    f"{phase} p50 {phase_stats['p50']:.2f}"
+                    f" p99 {phase_stats['p99']:.2f}"
+                    f" max {phase_stats['max']:.2f} ms"
+                )
+        else:
+            lines.append("phase times: run with --profile")
+        lines.append(
+            f"sprites {len(self.all_sprites)} NPCs {len(self.world.npcs)}"
+        )
+        pool = self.npc_pool
+        lines.append(
+            f"pool free {len(pool)} hits {pool.hits} misses {pool.misses}"
+        )
+        return lines
 
     def _load_high_score(self):
         try:
@@ -267,33 +475,28 @@ class Game:
 
     def _save_high_score(self):
         # If score is greater than high score
-        if self.score > self.high_score:
+        if self.world.score > self.high_score:
             # Update high score
-            self.high_score = self.score
+            self.high_score = self.world.score
             try:
                 # Open file and write high score
-                with open(settings.HIGH_SCORE_FILE_PATH, "w") as high_score:
-                    high_score.write(str(self.high_score))
+                with tracer.span("save_high_score", "io"):
+                    with open(
+                        settings.HIGH_SCORE_FILE_PATH, "w"
+                    ) as high_score:
+                        high_score.write(str(self.high_score))
             # If write fails, print error message
             except IOError:
                 print("Error: Could not save high score to file.")
 
     def _reset_game(self):
-        # Reset variables back to starting values
+        # Reset the simulation back to starting values
         self.game_over = False
-        self.score = 0
-        self.passed_npcs.clear()
+        self.world.reset()
+        self.inputs = InputState()
+        self.accumulator = 0.0
         self._load_high_score()
 
-        # Reset player position and road speed
-        self.player_car.reset_position()
-        self.player_car.horizontal_speed = 0
-        self.current_road_speed = 0
-
-        # Clear NPC cars
-        for npc in self.npc_cars:
-            npc.kill()
-
         # Reset road
         self.road = Road(
             settings.ROAD_IMAGE_PATH,
@@ -303,3 +506,6 @@ class Game:
 
         # Show instructions for the new game
         self.show_instructions = True
+
+        if self.on_reset is not None:
+            self.on_reset(self)
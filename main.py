@@ -1,10 +1,66 @@
+import argparse
+
+import settings
+import tracer
+
 from game import Game
 
 
+def print_seed(game):
+    # Show the traffic seed, so the race can be replayed with --seed
+    print(f"Traffic seed: {game.world.seed}")
+
+
 def main():
     """Initializes and runs the game"""
-    game_instance = Game()
-    game_instance.run()
+    parser = argparse.ArgumentParser(description="Car Racing Game")
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="seed for the NPC traffic, to replay the same race",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="time each phase of every frame (F2 saves the timings)",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help=f"record a timeline of the game to {settings.TRACE_PATH}",
+    )
+    parser.add_argument(
+        "--memory-watchdog",
+        action="store_true",
+        help=f"log memory growth to {settings.MEMORY_LOG_PATH}",
+    )
+    parser.add_argument(
+        "--trace-allocations",
+        action="store_true",
+        help="run the memory watchdog with tracemalloc (slower)",
+    )
+    args = parser.parse_args()
+    if args.profile:
+        settings.PROFILE_FRAMES = True
+    if args.memory_watchdog:
+        settings.MEMORY_WATCHDOG = True
+    if args.trace_allocations:
+        settings.MEMORY_WATCHDOG = True
+        settings.MEMORY_TRACE_ALLOCATIONS = True
+    if args.trace:
+        # Start tracing before the game loads, so asset loads are in it
+        tracer.start(settings.TRACE_PATH, settings.TRACE_BUFFER_EVENTS)
+
+    try:
+        game_instance = Game(seed=args.seed)
+        print_seed(game_instance)
+        # Every restarted race has a new seed
+        game_instance.on_reset = print_seed
+        game_instance.run()
+    finally:
+        # Finish the trace file, even if the game crashed
+        tracer.stop()
 
 
 if __name__ == "__main__":
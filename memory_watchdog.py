@@ -0,0 +1,176 @@
+import gc
+import itertools
+import time
+import tracemalloc
+
+import pygame
+import tracer
+
+from car import Car
+
+# Objects counted in every snapshot, by the name they are logged under
+WATCHED_TYPES = {
+    "Car": Car,
+    "Surface": pygame.Surface,
+    "Rect": pygame.Rect,
+    "Mask": pygame.mask.Mask,
+}
+
+
+def count_objects(types=WATCHED_TYPES):
+    """
+    Count the live objects of each of the given types. Surfaces, rects and
+    masks aren't tracked by the garbage collector, so the objects it does
+    track are searched for references to them too
+    """
+    counts = dict.fromkeys(types, 0)
+    # Name each object's type is counted under (None if it isn't
+    # watched), worked out once per type rather than once per object
+    type_names = {}
+    seen = set()
+    tracked = gc.get_objects()
+    for obj in itertools.chain(tracked, gc.get_referents(*tracked)):
+        obj_type = type(obj)
+        if obj_type not in type_names:
+            type_names[obj_type] = next(
+                (
+                    name
+                    for name, watched_type in types.items()
+                    if issubclass(obj_type, watched_type)
+                ),
+                None,
+            )
+        name = type_names[obj_type]
+        if name is not None and id(obj) not in seen:
+            seen.add(id(obj))
+            counts[name] += 1
+    return counts
+
+
+class MemoryWatchdog:
+    """
+    Every interval seconds, counts live cars, surfaces, rects and masks,
+    and appends the change since the last count to log_path. The count
+    searches every object the garbage collector tracks, so the frame it
+    runs in takes tens of milliseconds longer. With trace_allocations,
+    tracemalloc runs too, and the sites that grew most since the last
+    snapshot are logged. If traced memory grew by more than
+    dump_threshold_kb, the whole snapshot is also written to dump_path
+    for tracemalloc to load later
+    """
+
+    enabled = True
+
+    def __init__(
+        self,
+        interval,
+        log_path,
+        top_sites=10,
+        dump_threshold_kb=1024,
+        dump_path="memory_snapshot_{}.tracemalloc",
+        trace_allocations=False,
+    ):
+        self.interval = interval
+        self.log_path = log_path
+        self.top_sites = top_sites
+        self.dump_threshold_kb = dump_threshold_kb
+        # Formatted with the snapshot number
+        self.dump_path = dump_path
+        # tracemalloc slows down every allocation, so it only runs when
+        # allocation sites are wanted
+        self.trace_allocations = trace_allocations
+
+        # When the next snapshot is due (None until the first check)
+        self.next_check = None
+        self.snapshot = None
+        self.counts = None
+        self.snapshot_count = 0
+        # Whether this watchdog started tracemalloc, and so should stop it
+        self.started_tracing = False
+
+    def check(self, now=None):
+        # Called every frame; does nothing until a snapshot is due
+        if now is None:
+            now = time.monotonic()
+        if self.next_check is not None and now < self.next_check:
+            return
+        self.next_check = now + self.interval
+
+        with tracer.span("memory snapshot", "memory"):
+            self._take_snapshot()
+
+    def _take_snapshot(self):
+        snapshot = None
+        if self.trace_allocations:
+            # Allocations are only traced from the first check onwards
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self.started_tracing = True
+
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                # Leave out the watchdog's own allocations
+                (
+                    tracemalloc.Filter(False, tracemalloc.__file__),
+                    tracemalloc.Filter(False, __file__),
+                )
+            )
+        counts = count_objects()
+        self.snapshot_count += 1
+
+        if self.counts is not None:
+            self._log_growth(snapshot, counts)
+        self.snapshot = snapshot
+        self.counts = counts
+
+    def _log_growth(self, snapshot, counts):
+        # Compare with the previous check and log what grew
+        lines = [
+            f"snapshot {self.snapshot_count} at {time.strftime('%X')}:",
+            "objects "
+            + " ".join(
+                f"{name} {count} ({count - self.counts[name]:+d})"
+                for name, count in counts.items()
+            ),
+        ]
+        if snapshot is not None:
+            differences = snapshot.compare_to(self.snapshot, "lineno")
+            growth = sum(difference.size_diff for difference in differences)
+            lines[0] += f" traced memory {growth / 1024:+.1f} KiB"
+            growing = [
+                difference
+                for difference in differences
+                if difference.size_diff > 0
+            ]
+            for difference in growing[: self.top_sites]:
+                lines.append(f"  {difference}")
+            if growth > self.dump_threshold_kb * 1024:
+                dump_path = self.dump_path.format(self.snapshot_count)
+                snapshot.dump(dump_path)
+                lines.append(
+                    f"  grew more than {self.dump_threshold_kb} KiB,"
+                    f" full snapshot saved to {dump_path}"
+                )
+
+        with open(self.log_path, "a") as log_file:
+            log_file.write("\n".join(lines) + "\n\n")
+
+    def close(self):
+        # Stop tracing allocations, if the watchdog started it
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+
+
+class DisabledWatchdog:
+    """
+    Stands in for MemoryWatchdog when it is off, so the game loop can
+    call it unconditionally
+    """
+
+    enabled = False
+
+    def check(self, now=None):
+        pass
+
+    def close(self):
+        pass
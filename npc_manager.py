@@ -0,0 +1,279 @@
+import numpy as np
+import rules
+
+# Lane top for a lane with no NPC in it
+NO_CAR = np.iinfo(np.int64).max
+
+
+class NPCManager:
+    """
+    Stores every NPC car as a slot in parallel NumPy arrays, so the whole
+    traffic can be moved, despawned and collision checked in bulk.
+    Live NPCs always fill slots 0 to count - 1
+    """
+
+    def __init__(self, capacity, car_width, car_height, lane_count):
+        # Size of every NPC car (they all share one image)
+        self.car_width = car_width
+        self.car_height = car_height
+
+        # Number of live NPCs
+        self.count = 0
+        # Id given to the next NPC spawned, so views can follow a car
+        # while it moves between slots
+        self.next_id = 0
+
+        # Per-NPC data, one slot per car
+        capacity = max(capacity, 1)
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        # y at the start of the last update, for drawing between updates
+        self.previous_y = np.zeros(capacity, dtype=np.float64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        self.lane = np.zeros(capacity, dtype=np.int64)
+        self.alive = np.zeros(capacity, dtype=bool)
+        # Whether the player has passed the NPC, set once when it happens
+        self.passed = np.zeros(capacity, dtype=bool)
+
+        # Whole-pixel top of the highest NPC in each lane, so free lanes
+        # can be found without scanning the traffic. Lowered on each spawn
+        # and emptied on clear; after an update, when every NPC has moved,
+        # it is read from the lane sort the collision checks use
+        self.lane_top = np.full(lane_count, NO_CAR, dtype=np.int64)
+
+        # Live slots sorted by lane and then y, the sorted y values, and
+        # where each lane's run starts, so collision checks only look at
+        # nearby NPCs in the lanes the player is in. Rebuilt after each
+        # update, and on the next check after a spawn or clear
+        self.lane_order = np.zeros(0, dtype=np.int64)
+        self.lane_sorted_y = np.zeros(0, dtype=np.float64)
+        self.lane_starts = np.zeros(lane_count + 1, dtype=np.int64)
+        self.lane_order_stale = False
+
+        # Player bottom edge at the last pass check (None to check every
+        # NPC next time), the furthest any NPC can have moved down since,
+        # and the slowest NPC speed, so each pass check only looks at the
+        # NPCs that can have just gone below the player
+        self.pass_line = None
+        self.pass_drop = 0.0
+        self.min_speed = np.inf
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self):
+        # Double the capacity of every array, keeping the live slots
+        capacity = len(self.ids) * 2
+        names = (
+            "ids", "x", "y", "previous_y", "speed", "lane", "alive", "passed"
+        )
+        for name in names:
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[: self.count] = old[: self.count]
+            setattr(self, name, new)
+
+    def spawn(self, x_pos, y_pos, speed, lane_id):
+        """
+        Add an NPC centred on (x_pos, y_pos) and return its id
+        """
+        if self.count == len(self.ids):
+            self._grow()
+
+        slot = self.count
+        npc_id = self.next_id
+        self.next_id += 1
+
+        # Store the top left corner, like a sprite's rect
+        self.ids[slot] = npc_id
+        self.x[slot] = x_pos - self.car_width // 2
+        self.y[slot] = y_pos - self.car_height // 2
+        self.previous_y[slot] = self.y[slot]
+        self.speed[slot] = speed
+        self.lane[slot] = lane_id
+        self.alive[slot] = True
+        self.passed[slot] = False
+        self.count += 1
+        self.lane_order_stale = True
+
+        top = int(rules.whole_pixels(self.y[slot]))
+        self.lane_top[lane_id] = min(self.lane_top[lane_id], top)
+        self.min_speed = min(self.min_speed, speed)
+        # An NPC spawned already past the player isn't near the pass line,
+        # so look at every NPC in the next pass check
+        if self.pass_line is not None and rules.passed(top, self.pass_line):
+            self.pass_line = None
+        return npc_id
+
+    def update(self, road_speed, screen_height, dt):
+        """
+        Move every NPC by (road speed - car speed) for dt seconds and remove
+        the ones that have left the bottom of the screen. Returns the
+        despawned ids
+        """
+        n = self.count
+        self.previous_y[:n] = self.y[:n]
+        self.y[:n] = rules.move_npc(self.y[:n], road_speed, self.speed[:n], dt)
+        # No NPC moves down faster than the slowest one
+        self.pass_drop += max(0.0, (road_speed - self.min_speed) * dt)
+
+        # Kill NPCs once they have left the screen
+        self.alive[:n] = ~rules.off_screen(self.tops(), screen_height)
+        if self.alive[:n].all():
+            self._index_lanes()
+            return self.ids[:0]
+
+        # Compact the live NPCs down to the front of the arrays
+        keep = self.alive[:n]
+        despawned = self.ids[:n][~keep]
+        kept = int(keep.sum())
+        for array in (
+            self.ids,
+            self.x,
+            self.y,
+            self.previous_y,
+            self.speed,
+            self.lane,
+            self.passed,
+        ):
+            array[:kept] = array[:n][keep]
+        self.alive[:kept] = True
+        self.alive[kept:n] = False
+        self.count = kept
+        self._index_lanes()
+        return despawned
+
+    def _index_lanes(self):
+        # Every NPC has just moved, so re-sort the lanes and read the
+        # highest NPC in each lane off the front of its sorted run
+        self._sort_lanes()
+        starts = self.lane_starts[:-1]
+        occupied = starts < self.lane_starts[1:]
+        self.lane_top[:] = NO_CAR
+        self.lane_top[occupied] = rules.whole_pixels(
+            self.lane_sorted_y[starts[occupied]]
+        )
+
+    def _sort_lanes(self):
+        # Order the live slots by lane, then from the top of the screen down
+        n = self.count
+        self.lane_order = np.lexsort((self.y[:n], self.lane[:n]))
+        self.lane_sorted_y = self.y[:n][self.lane_order]
+        self.lane_starts = np.searchsorted(
+            self.lane[:n][self.lane_order], np.arange(len(self.lane_top) + 1)
+        )
+        self.lane_order_stale = False
+
+    def lefts(self):
+        # Whole-pixel left edge of every live NPC
+        return rules.whole_pixels(self.x[: self.count])
+
+    def tops(self):
+        # Whole-pixel top edge of every live NPC
+        return rules.whole_pixels(self.y[: self.count])
+
+    def drawn_tops(self, alpha):
+        # Top edge of every live NPC, blended alpha of the way from its
+        # previous position to its current one
+        n = self.count
+        y = self.previous_y[:n] + (self.y[:n] - self.previous_y[:n]) * alpha
+        return rules.whole_pixels(y)
+
+    def mark_passed(self, player_bottom):
+        """
+        Flag the NPCs that have just been passed by a player whose bottom
+        edge is at player_bottom, and return their ids. Each NPC is only
+        returned once. Only the NPCs that can have crossed the player's
+        bottom edge since the last check are looked at, found by binary
+        search in each lane's y order
+        """
+        if self.pass_line != player_bottom:
+            # The player has moved, so any NPC could be newly passed
+            slots = np.flatnonzero(rules.passed(self.tops(), player_bottom))
+        else:
+            slots = self._crossed_slots(player_bottom)
+        slots = np.sort(slots[~self.passed[slots]])
+
+        self.passed[slots] = True
+        self.pass_line = player_bottom
+        self.pass_drop = 0.0
+        return self.ids[slots]
+
+    def _crossed_slots(self, player_bottom):
+        # Slots of the NPCs whose top has gone from at or above
+        # player_bottom to below it, if none moved down by more than
+        # pass_drop. Whole-pixel tops below player_bottom start at y =
+        # player_bottom + 1, and a pixel more is allowed for rounding
+        if self.lane_order_stale:
+            self._sort_lanes()
+
+        low = player_bottom + 1
+        high = low + self.pass_drop + 1
+        found = []
+        for lane_id in range(len(self.lane_top)):
+            start = self.lane_starts[lane_id]
+            end = self.lane_starts[lane_id + 1]
+            y = self.lane_sorted_y[start:end]
+            first = start + np.searchsorted(y, low, side="left")
+            last = start + np.searchsorted(y, high, side="left")
+            if first < last:
+                found.append(self.lane_order[first:last])
+        if not found:
+            return self.lane_order[:0]
+        return np.concatenate(found)
+
+    def candidates(self, rect, lane_ids):
+        """
+        Return the slots of the NPCs in lane_ids whose rect overlaps rect.
+        Only the NPCs level with rect are looked at, found by binary search
+        in each lane's y order
+        """
+        if self.lane_order_stale:
+            self._sort_lanes()
+
+        found = []
+        for lane_id in lane_ids:
+            start = self.lane_starts[lane_id]
+            end = self.lane_starts[lane_id + 1]
+            # Whole-pixel tops from rect.top - car_height + 1 up to
+            # rect.bottom - 1 can overlap rect
+            y = self.lane_sorted_y[start:end]
+            first = start + np.searchsorted(
+                y, rect.top - self.car_height + 1, side="left"
+            )
+            last = start + np.searchsorted(y, rect.bottom, side="left")
+            if first == last:
+                continue
+
+            slots = self.lane_order[first:last]
+            hits = rules.overlaps(
+                rules.whole_pixels(self.x[slots]),
+                rules.whole_pixels(self.y[slots]),
+                self.car_width,
+                self.car_height,
+                rect.left,
+                rect.top,
+                rect.width,
+                rect.height,
+            )
+            found.append(slots[hits])
+        if not found:
+            return self.lane_order[:0]
+        return np.concatenate(found)
+
+    def free_lanes(self, screen_height):
+        # Ids of the lanes an NPC can spawn in
+        return np.flatnonzero(
+            ~rules.blocks_spawn(self.lane_top, screen_height)
+        )
+
+    def clear(self):
+        # Remove every NPC
+        self.alive[: self.count] = False
+        self.count = 0
+        self.lane_top[:] = NO_CAR
+        self.lane_order_stale = True
+        self.pass_line = None
+        self.pass_drop = 0.0
+        self.min_speed = np.inf
@@ -0,0 +1,54 @@
+import settings
+
+from car import NPCCar
+
+
+class NPCPool:
+    """
+    Keeps NPC sprites for reuse, so spawning and despawning NPCs doesn't
+    create and throw away sprites. Starts with MAX_NPCS sprites ready,
+    and makes more if traffic ever needs them
+    """
+
+    def __init__(self, *groups, size=None):
+        # Groups a sprite joins while it is in use
+        self.groups = groups
+        if size is None:
+            size = settings.MAX_NPCS
+        self.free = [self._new_sprite() for _ in range(size)]
+
+        # Sprites handed out from the pool, and ones that had to be made
+        # because it was empty
+        self.hits = 0
+        self.misses = 0
+
+    def _new_sprite(self):
+        return NPCCar(settings.NPC_IMAGE_PATH, 0, 0, 0, 0)
+
+    def acquire(self, lane_id, left, top):
+        """
+        Return a sprite for an NPC at (left, top), added to the pool's
+        groups
+        """
+        if self.free:
+            sprite = self.free.pop()
+            self.hits += 1
+        else:
+            sprite = self._new_sprite()
+            self.misses += 1
+
+        # Set the sprite up for its new NPC
+        sprite.lane_id = lane_id
+        sprite.rect.topleft = (left, top)
+        sprite.dirty = 1
+        sprite.add(*self.groups)
+        return sprite
+
+    def release(self, sprite):
+        # Take the sprite out of its groups and keep it for the next NPC
+        sprite.kill()
+        self.free.append(sprite)
+
+    def __len__(self):
+        # Number of sprites ready to be handed out
+        return len(self.free)
@@ -0,0 +1,115 @@
+import numpy as np
+import pygame
+import settings
+
+# Frames shown in the frame time graph
+GRAPH_FRAMES = 120
+# Size of the graph, and the frame time at its top edge
+GRAPH_HEIGHT = 40
+GRAPH_MAX_MS = 50
+
+# Colours of the panel, the graph and the target frame time line
+PANEL_COLOUR = (0, 0, 0, 160)
+GRAPH_COLOUR = (0, 255, 0)
+TARGET_COLOUR = (255, 255, 0)
+
+# Space around the panel's contents
+PADDING = 4
+
+
+class PerfOverlay:
+    """
+    Toggleable panel showing a frame time graph and lines of performance
+    text. Text is put together from cached single-character surfaces into
+    one surface, which is reused until the lines change
+    """
+
+    def __init__(self, font_size=20):
+        self.font_size = font_size
+        self.visible = False
+        # Loaded the first time the overlay is shown
+        self.font = None
+        # Rendered surface for each character used so far
+        self.glyphs = {}
+        self.panel = None
+        # Lines of text last drawn, and the surface they were drawn to
+        self.lines = None
+        self.text = None
+
+        # Ring buffer of recent frame times in milliseconds
+        self.frame_times = np.zeros(GRAPH_FRAMES)
+        self.frame_index = 0
+
+    def toggle(self):
+        self.visible = not self.visible
+
+    def record_frame(self, frame_ms):
+        # Add a frame time to the graph
+        self.frame_times[self.frame_index % GRAPH_FRAMES] = frame_ms
+        self.frame_index += 1
+
+    def _glyph(self, char):
+        glyph = self.glyphs.get(char)
+        if glyph is None:
+            glyph = self.font.render(char, True, settings.WHITE)
+            self.glyphs[char] = glyph
+        return glyph
+
+    def _render_lines(self, lines, line_height):
+        # Blit the lines into a new surface, one cached character at a time
+        glyph_lines = [[self._glyph(char) for char in line] for line in lines]
+        width = max(
+            (sum(glyph.get_width() for glyph in line) for line in glyph_lines),
+            default=0,
+        )
+        text = pygame.Surface(
+            (max(width, 1), max(line_height * len(lines), 1)),
+            pygame.SRCALPHA,
+        )
+        for row, line in enumerate(glyph_lines):
+            x = 0
+            for glyph in line:
+                text.blit(glyph, (x, row * line_height))
+                x += glyph.get_width()
+        return text
+
+    def draw(self, screen, lines):
+        """
+        Draw the panel in the top left corner of the screen, with the
+        graph above the given lines of text. Returns the panel's rect
+        """
+        if self.font is None:
+            self.font = pygame.font.Font(None, self.font_size)
+        line_height = self.font.get_linesize()
+
+        # The translucent background is made once, at its full size
+        width = GRAPH_FRAMES * 2 + PADDING * 2
+        height = GRAPH_HEIGHT + line_height * len(lines) + PADDING * 3
+        if self.panel is None or self.panel.get_size() != (width, height):
+            self.panel = pygame.Surface((width, height), pygame.SRCALPHA)
+            self.panel.fill(PANEL_COLOUR)
+        screen.blit(self.panel, (0, 0))
+
+        # Frame time graph, oldest frame on the left
+        bottom = PADDING + GRAPH_HEIGHT
+        recent = np.roll(self.frame_times, -self.frame_index % GRAPH_FRAMES)
+        heights = np.minimum(recent / GRAPH_MAX_MS, 1) * GRAPH_HEIGHT
+        for column, bar in enumerate(heights.astype(int).tolist()):
+            if bar:
+                x = PADDING + column * 2
+                pygame.draw.line(
+                    screen, GRAPH_COLOUR, (x, bottom), (x, bottom - bar)
+                )
+        # Line at the frame time of the target frame rate
+        target = bottom - int(
+            GRAPH_HEIGHT * 1000 / settings.TARGET_FPS / GRAPH_MAX_MS
+        )
+        pygame.draw.line(
+            screen, TARGET_COLOUR, (PADDING, target), (width - PADDING, target)
+        )
+
+        if lines != self.lines:
+            self.lines = list(lines)
+            self.text = self._render_lines(lines, line_height)
+        screen.blit(self.text, (PADDING, bottom + PADDING))
+        return pygame.Rect(0, 0, width, height)
@@ -0,0 +1,109 @@
+import time
+
+import numpy as np
+
+# Parts of a frame that are timed, in the order they run
+PHASES = ("events", "update", "draw", "present")
+
+# Percentiles reported for each phase
+PERCENTILES = (50, 95, 99)
+
+
+class FrameProfiler:
+    """
+    Times each phase of every frame with perf_counter_ns, keeping the
+    last capacity frames in a ring buffer
+    """
+
+    enabled = True
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        # Nanoseconds spent in each phase, one row per frame
+        self.samples = np.zeros((capacity, len(PHASES)), dtype=np.int64)
+        # Frames recorded so far (the next row is frame_count % capacity)
+        self.frame_count = 0
+
+        self._current = np.zeros(len(PHASES), dtype=np.int64)
+        self._last = 0
+
+    def begin_frame(self):
+        # Start timing a frame from now
+        self._current[:] = 0
+        self._last = time.perf_counter_ns()
+
+    def mark(self, phase):
+        # Record the time since the last mark as the given phase
+        now = time.perf_counter_ns()
+        self._current[PHASES.index(phase)] += now - self._last
+        self._last = now
+
+    def end_frame(self):
+        # Store the frame, overwriting the oldest once the buffer is full
+        self.samples[self.frame_count % self.capacity] = self._current
+        self.frame_count += 1
+
+    def recent(self):
+        # Recorded frames, oldest first
+        if self.frame_count <= self.capacity:
+            return self.samples[: self.frame_count]
+        start = self.frame_count % self.capacity
+        return np.concatenate(
+            (self.samples[start:], self.samples[:start])
+        )
+
+    def stats(self):
+        """
+        Rolling p50/p95/p99/max in milliseconds for each phase and for the
+        whole frame, over the frames in the buffer
+        """
+        recent = self.recent()
+        if len(recent) == 0:
+            return {}
+        columns = dict(zip(PHASES, recent.T))
+        columns["frame"] = recent.sum(axis=1)
+
+        stats = {}
+        for name, values in columns.items():
+            ms = values / 1e6
+            stats[name] = {
+                f"p{percentile}": float(np.percentile(ms, percentile))
+                for percentile in PERCENTILES
+            }
+            stats[name]["max"] = float(ms.max())
+        return stats
+
+    def dump(self, path):
+        # Write the buffered frames to a CSV file, oldest first
+        first_frame = max(self.frame_count - self.capacity, 0)
+        with open(path, "w") as dump_file:
+            dump_file.write(
+                "frame," + ",".join(f"{phase}_ns" for phase in PHASES) + "\n"
+            )
+            for frame, row in enumerate(self.recent().tolist(), first_frame):
+                dump_file.write(f"{frame}," + ",".join(map(str, row)) + "\n")
+
+
+class DisabledProfiler:
+    """
+    Stands in for FrameProfiler when profiling is off, so the game loop
+    can call it unconditionally at almost no cost
+    """
+
+    enabled = False
+    frame_count = 0
+
+    def begin_frame(self):
+        pass
+
+    def mark(self, phase):
+        pass
+
+    def end_frame(self):
+        pass
+
+    def stats(self):
+        return {}
+
+    def dump(self, path):
+        pass
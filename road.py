@@ -1,4 +1,7 @@
+import math
+
 import pygame
+import assets
 import settings
 
 
@@ -10,31 +13,14 @@ class Road:
 
         # Try to load road image
         try:
-            # Load image and convert
-            self.image = pygame.image.load(road_image).convert()
-
-            # Get image dimensions
-            original_width, original_height = self.image.get_size()
-
-            # Calculate image aspect ratio
-            aspect_ratio = original_width / original_height
-
-            # Transform image to fit screen while maintaining aspect ratio
-            self.image = pygame.transform.scale(
-                self.image,
-                (self.screen_width, self.screen_width * aspect_ratio),
+            # Load the image scaled to fit the screen width
+            self.image = assets.load_scaled_image(
+                road_image,
+                self.screen_width,
+                assets.road_image_size,
+                alpha=False,
             )
 
-            self.image_height = self.image.get_height()
-
-            # Setup floats for y position to make scrolling more accurate
-            self.y1_float = 0.0
-            self.y2_float = 0.0 - self.image_height
-
-            # Create two rectangles for scrolling
-            self.rect1 = self.image.get_rect(topleft=(0, int(self.y1_float)))
-            self.rect2 = self.image.get_rect(topleft=(0, int(self.y2_float)))
-
         # If image fails to load
         except (pygame.error, FileNotFoundError):
             print(
@@ -42,28 +28,46 @@ class Road:
                 f" Creating placeholder."
             )
 
-            # Create a placeholder surface
-            self.image_original = pygame.Surface(
+            # Create a placeholder tile the size of the screen
+            self.image = pygame.Surface(
                 (self.screen_width, self.screen_height)
             )
-            self.image_original.fill(settings.BLACK)
+            self.image.fill(settings.BLACK)
+
+        self.image_height = self.image.get_height()
+
+        # Stack the tile enough times to cover the screen plus one tile,
+        # so the road can be drawn at any scroll offset with a single blit
+        tile_count = math.ceil(self.screen_height / self.image_height) + 1
+        self.strip = pygame.Surface(
+            (self.screen_width, self.image_height * tile_count)
+        )
+        for n in range(tile_count):
+            self.strip.blit(self.image, (0, n * self.image_height))
+
+        # Setup float for the scroll offset to make scrolling more accurate
+        self.offset_float = 0.0
+
+        # Area of the strip that is visible on screen
+        self.area = pygame.Rect(
+            0, self.image_height, self.screen_width, self.screen_height
+        )
 
     def update(self, current_road_speed):
-        # Move rects based on road speed
-        self.y1_float += current_road_speed
-        self.y2_float += current_road_speed
-        self.rect1.y = int(self.y1_float)
-        self.rect2.y = int(self.y2_float)
+        # Move the road on from its current position
+        self.scroll_to(self.offset_float + current_road_speed)
+
+    def scroll_to(self, road_offset):
+        # Wrap the total distance travelled around a single tile
+        self.offset_float = road_offset % self.image_height
 
-        # Scrolling functionality
-        if self.rect1.top >= self.screen_height:
-            self.y1_float = self.y2_float - self.image_height
-            self.rect1.y = int(self.y1_float)
-        elif self.rect2.top >= self.screen_height:
-            self.y2_float = self.y1_float - self.image_height
-            self.rect2.y = int(self.y2_float)
+        # Scroll the visible area up the strip so the road moves down
+        self.area.top = self.image_height - int(self.offset_float)
 
     def draw(self, screen):
-        # Draw both rects to the screen
-        screen.blit(self.image, self.rect1)
-        screen.blit(self.image, self.rect2)
+        # Draw the visible part of the strip to the screen
+        screen.blit(self.strip, (0, 0), self.area)
+
+    def visible_surface(self):
+        # Screen-sized view of the strip at the current scroll offset
+        return self.strip.subsurface(self.area)
@@ -0,0 +1,77 @@
+# Race rules shared by the single-race World and the batched BatchEnv.
+# Every function works on plain numbers and on NumPy arrays alike
+import numpy as np
+import settings
+
+# Points scored for each NPC the player passes
+PASS_SCORE = 10
+
+
+def throttle(road_speed, accelerate, brake, dt):
+    # Accelerate, or brake if not accelerating, for dt seconds, keeping
+    # the speed between 0 and the maximum
+    braking = np.logical_and(brake, np.logical_not(accelerate))
+    road_speed = (
+        road_speed
+        + np.multiply(accelerate, settings.ACCELERATION_CONSTANT * dt)
+        - np.multiply(braking, settings.BRAKING_CONSTANT * dt)
+    )
+    return np.clip(road_speed, 0, settings.MAX_SPEED)
+
+
+def steer(horizontal_speed, direction, acceleration, dt):
+    # Speed up sideways in a direction (-1 for left, 1 for right) for dt
+    # seconds, up to the maximum horizontal speed
+    return np.clip(
+        horizontal_speed + direction * acceleration * dt,
+        -settings.MAX_HORIZONTAL_SPEED,
+        settings.MAX_HORIZONTAL_SPEED,
+    )
+
+
+def move_npc(npc_y, road_speed, npc_speed, dt):
+    # NPCs move down the screen by road speed - their own speed
+    return npc_y + (road_speed - npc_speed) * dt
+
+
+def whole_pixels(position):
+    # Pixel an edge is drawn and collided at
+    return np.floor(position).astype(np.int64)
+
+
+def off_screen(npc_top, screen_height):
+    # NPCs despawn once they have left the bottom of the screen
+    return npc_top > screen_height
+
+
+def blocks_spawn(npc_top, screen_height):
+    # NPCs in the top half of the screen block new NPCs in their lane
+    return npc_top < screen_height // 2
+
+
+def passed(npc_top, player_bottom):
+    # The player has passed an NPC once its top is below the player
+    return npc_top > player_bottom
+
+
+def overlaps(
+    left_a, top_a, width_a, height_a, left_b, top_b, width_b, height_b
+):
+    # Same overlap test as pygame.Rect.colliderect
+    return (
+        (left_a < left_b + width_b)
+        & (left_a + width_a > left_b)
+        & (top_a < top_b + height_b)
+        & (top_a + height_a > top_b)
+    )
+
+
+def mask_overlaps(hits, left_a, top_a, left_b, top_b, width_b, height_b):
+    # Same test as pygame.Mask.overlap, looked up in a table of every
+    # offset at which car b's pixels touch car a's (see
+    # car.collision_table). Offsets outside the table never touch
+    x = np.subtract(left_b, left_a) + width_b - 1
+    y = np.subtract(top_b, top_a) + height_b - 1
+    width, height = hits.shape
+    inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+    return inside & hits[np.clip(x, 0, width - 1), np.clip(y, 0, height - 1)]
@@ -4,23 +4,84 @@ SCREEN_HEIGHT = 800
 ROAD_MARGIN = 20
 ROAD_WIDTH = SCREEN_WIDTH - (2 * ROAD_MARGIN)
 
+# Frame rate cap for drawing
 TARGET_FPS = 60
 
+# The simulation always advances in fixed steps of 1 / SIMULATION_HZ
+# seconds, whatever the frame rate
+SIMULATION_HZ = 60
+# Longest frame the simulation catches up on (seconds), so a long stall
+# doesn't make it run hundreds of steps at once
+MAX_FRAME_TIME = 0.25
+
+# How long an idle screen (instructions / game over) waits for input
+# before checking the game state again
+IDLE_WAIT_TIMEOUT_MS = 500
+
+# "flip" redraws and flips the whole screen every frame, "dirty" only
+# redraws and updates the parts of the screen that changed
+RENDER_MODE = "flip"
+
+# Time each phase of every drawn frame (see profiler.py). The last
+# PROFILE_BUFFER_FRAMES frames are kept, and written to PROFILE_DUMP_PATH
+# on exit or when F2 is pressed
+PROFILE_FRAMES = False
+PROFILE_BUFFER_FRAMES = 600
+PROFILE_DUMP_PATH = "frame_profile.csv"
+
+# main.py --trace records a timeline of frame phases, NPC spawns, asset
+# loads, file writes and garbage collections to TRACE_PATH as Chrome
+# trace events (open it in chrome://tracing or ui.perfetto.dev). Events
+# are written TRACE_BUFFER_EVENTS at a time
+TRACE_PATH = "trace.json"
+TRACE_BUFFER_EVENTS = 1000
+
+# Every MEMORY_CHECK_INTERVAL seconds, count live cars, surfaces, rects
+# and masks and append the changes to MEMORY_LOG_PATH. Counting searches
+# every object the garbage collector tracks, which adds a few tens of
+# milliseconds to the frame it runs in. main.py --trace-allocations
+# also runs tracemalloc, which slows every allocation: the top
+# MEMORY_TOP_SITES growing allocation sites are logged too, and if traced
+# memory grew by more than MEMORY_DUMP_THRESHOLD_KB the whole snapshot is
+# saved to MEMORY_DUMP_PATH
+MEMORY_WATCHDOG = False
+MEMORY_TRACE_ALLOCATIONS = False
+MEMORY_CHECK_INTERVAL = 30
+MEMORY_LOG_PATH = "memory_watchdog.log"
+MEMORY_TOP_SITES = 10
+MEMORY_DUMP_THRESHOLD_KB = 1024
+MEMORY_DUMP_PATH = "memory_snapshot_{}.tracemalloc"
+
+# Shortest time between updates of the FPS in the window caption
+CAPTION_UPDATE_MS = 1000
+
+# "mask" checks cars that overlap for touching pixels, so the transparent
+# corners of the car images don't count. "rect" uses the whole rectangle
+# and never builds collision masks
+COLLISION_MODE = "mask"
+
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
 RED = (255, 0, 0)
 BLUE = (0, 0, 255)
 GREEN = (0, 255, 0)
 
+# Maximum number of rendered text surfaces kept by the UI
+TEXT_CACHE_SIZE = 32
+
 PLAYER_IMAGE_PATH = "assets/player-image.png"
 NPC_IMAGE_PATH = "assets/npc-image.png"
 ROAD_IMAGE_PATH = "assets/background.png"
 
+# Directory for pre-scaled assets written by bake_assets.py
+ASSET_CACHE_DIR = "assets/cache"
+
 HIGH_SCORE_FILE_PATH = "highscore.txt"
 
-ACCELERATION_CONSTANT = 0.1
-BRAKING_CONSTANT = 0.7
-MAX_SPEED = 20
+# Road speed in pixels per second, accelerations in pixels per second^2
+ACCELERATION_CONSTANT = 360
+BRAKING_CONSTANT = 2520
+MAX_SPEED = 1200
 
 PLACEHOLDER_CAR_WIDTH = 75
 PLACEHOLDER_CAR_HEIGHT = 150
@@ -39,13 +100,20 @@ for i in range(NUM_LANES):
 
 MAX_NPCS = 5
 
-NPC_MIN_SPEED = 7
-NPC_MAX_SPEED = 10
+# NPC speeds in pixels per second
+NPC_MIN_SPEED = 420
+NPC_MAX_SPEED = 600
 
+# Average seconds of simulated time between NPC spawns
 NPC_SPAWN_INTERVAL = 1
+# How the gaps between spawns are chosen: "fixed", "jittered" (each gap
+# varies by up to NPC_SPAWN_JITTER x the interval) or "poisson"
+NPC_SPAWN_MODE = "fixed"
+NPC_SPAWN_JITTER = 0.5
 
 PLAYER_Y_POS = SCREEN_HEIGHT - PLACEHOLDER_CAR_HEIGHT
 PLAYER_START_X_POS = SCREEN_WIDTH / 2
 
-HORIZONTAL_ACCELERATION_CONSTANT = 0.5
-MAX_HORIZONTAL_SPEED = 10
+# Steering acceleration in pixels per second^2, speed in pixels per second
+HORIZONTAL_ACCELERATION_CONSTANT = 1800
+MAX_HORIZONTAL_SPEED = 600
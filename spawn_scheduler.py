@@ -0,0 +1,53 @@
+import random
+
+# Ways the time between NPC spawns can be chosen
+SPAWN_MODES = ("fixed", "jittered", "poisson")
+
+# Allowance for rounding, as simulated time is added up one step at a time
+TIME_EPSILON = 1e-9
+
+
+class SpawnScheduler:
+    """
+    Decides when NPCs spawn from simulated time, so a race spawns the same
+    traffic however fast it is run. "fixed" spawns every interval seconds,
+    "jittered" varies each gap by up to jitter x interval either way, and
+    "poisson" draws gaps averaging interval seconds
+    """
+
+    def __init__(self, interval, mode="fixed", rng=None, jitter=0.5):
+        if mode not in SPAWN_MODES:
+            raise ValueError(f"Unknown spawn mode: {mode}")
+        self.interval = interval
+        self.mode = mode
+        self.jitter = jitter
+        # Random gaps come from the owner's generator, so a seed
+        # reproduces them
+        self.rng = rng if rng is not None else random.Random()
+        self.reset()
+
+    def reset(self):
+        # The first spawn is one gap after the start
+        self.time_until_next = self._next_gap()
+
+    def _next_gap(self):
+        # Seconds between one spawn and the next
+        if self.mode == "jittered":
+            return self.interval * (
+                1 + self.rng.uniform(-self.jitter, self.jitter)
+            )
+        if self.mode == "poisson":
+            return self.rng.expovariate(1 / self.interval)
+        return self.interval
+
+    def advance(self, dt):
+        """
+        Move simulated time on by dt seconds, and return how many spawns
+        fell due
+        """
+        self.time_until_next -= dt
+        spawns = 0
+        while self.time_until_next <= TIME_EPSILON:
+            spawns += 1
+            self.time_until_next += self._next_gap()
+        return spawns
@@ -0,0 +1,74 @@
+import os
+import shutil
+import pytest
+import pygame
+
+import assets
+import bake_assets
+import settings
+
+# Use the dummy video driver so a display surface can be created headlessly
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+TEST_WIDTH = 40
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    # Bake into a temporary cache directory
+    monkeypatch.setattr(settings, "ASSET_CACHE_DIR", str(tmp_path / "cache"))
+    os.makedirs(settings.ASSET_CACHE_DIR)
+    pygame.init()
+    yield tmp_path
+    pygame.quit()
+
+
+def test_load_baked_without_bake_returns_none(cache_dir):
+    assert assets.load_baked(settings.NPC_IMAGE_PATH, TEST_WIDTH) is None
+
+
+def test_load_baked_matches_decoded_image(cache_dir):
+    # Bake the NPC image, then load it back from the raw blob
+    assert bake_assets.bake_asset(
+        settings.NPC_IMAGE_PATH, TEST_WIDTH, assets.car_image_size, True
+    )
+    image, mask = assets.load_baked(settings.NPC_IMAGE_PATH, TEST_WIDTH)
+
+    # Decode and scale the source image for comparison
+    expected = pygame.image.load(settings.NPC_IMAGE_PATH)
+    expected = pygame.transform.scale(
+        expected, assets.car_image_size(expected.get_size(), TEST_WIDTH)
+    )
+
+    assert image.get_size() == expected.get_size()
+    assert pygame.image.tobytes(image, "RGBA") == pygame.image.tobytes(expected, "RGBA")
+    expected_mask = pygame.mask.from_surface(expected)
+    assert mask.count() == expected_mask.count()
+    assert mask.overlap_area(expected_mask, (0, 0)) == expected_mask.count()
+
+
+def test_bake_asset_skips_up_to_date_asset(cache_dir):
+    assert bake_assets.bake_asset(
+        settings.ROAD_IMAGE_PATH, TEST_WIDTH, assets.road_image_size, False
+    )
+    # A second bake of the same unchanged source is a no-op
+    assert not bake_assets.bake_asset(
+        settings.ROAD_IMAGE_PATH, TEST_WIDTH, assets.road_image_size, False
+    )
+    image, mask = assets.load_baked(settings.ROAD_IMAGE_PATH, TEST_WIDTH, alpha=False)
+    assert image.get_width() == TEST_WIDTH
+    # Opaque assets don't get a collision mask
+    assert mask is None
+
+
+def test_load_baked_invalidated_by_source_change(cache_dir, mocker):
+    # Bake a copy of the image, then change its contents
+    source = str(cache_dir / "npc-copy.png")
+    shutil.copy(settings.NPC_IMAGE_PATH, source)
+    bake_assets.bake_asset(source, TEST_WIDTH, assets.car_image_size, True)
+    with open(source, "ab") as image_file:
+        image_file.write(b"edited")
+
+    mock_print = mocker.patch('builtins.print')
+    assert assets.load_baked(source, TEST_WIDTH) is None
+    mock_print.assert_called_once()
@@ -0,0 +1,87 @@
+import os
+import pytest
+import pygame
+from unittest.mock import patch
+
+import assets
+import settings
+
+# Use the dummy video driver so a display surface can be created headlessly
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+PLACEHOLDER_SIZE = (settings.PLACEHOLDER_CAR_WIDTH, settings.PLACEHOLDER_CAR_HEIGHT)
+INVALID_IMAGE_PATH = "assets/non_existent_car.png"
+
+
+@pytest.fixture(autouse=True)
+def pygame_display(tmp_path, monkeypatch):
+    # Ignore any locally baked assets so the PNGs are decoded
+    monkeypatch.setattr(settings, "ASSET_CACHE_DIR", str(tmp_path))
+    # convert_alpha() needs a video mode to be set
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    assets.clear_cache()
+    yield
+    assets.clear_cache()
+    pygame.quit()
+
+
+def test_load_sprite_same_key_decodes_once():
+    # Two loads of the same sprite should share one decoded surface and mask
+    with patch('pygame.image.load', wraps=pygame.image.load) as mock_load:
+        first = assets.load_sprite(
+            settings.NPC_IMAGE_PATH, settings.PLACEHOLDER_CAR_WIDTH, PLACEHOLDER_SIZE, settings.BLUE
+        )
+        second = assets.load_sprite(
+            settings.NPC_IMAGE_PATH, settings.PLACEHOLDER_CAR_WIDTH, PLACEHOLDER_SIZE, settings.BLUE
+        )
+
+    mock_load.assert_called_once_with(settings.NPC_IMAGE_PATH)
+    assert first is second
+    assert first.image is second.image
+    assert first.mask is second.mask
+    # The image is scaled to the requested width
+    assert first.image.get_width() == settings.PLACEHOLDER_CAR_WIDTH
+
+
+def test_load_sprite_different_width_is_separate_entry():
+    # A different target size must not reuse the cached surface
+    small = assets.load_sprite(settings.NPC_IMAGE_PATH, 40, PLACEHOLDER_SIZE, settings.BLUE)
+    large = assets.load_sprite(settings.NPC_IMAGE_PATH, 80, PLACEHOLDER_SIZE, settings.BLUE)
+
+    assert small is not large
+    assert small.image.get_width() == 40
+    assert large.image.get_width() == 80
+
+
+def test_load_sprite_placeholder_is_cached(mocker):
+    # A missing image should only be attempted (and warned about) once
+    mock_print = mocker.patch('builtins.print')
+    with patch('pygame.image.load', side_effect=pygame.error("Simulated failure")) as mock_load:
+        first = assets.load_sprite(INVALID_IMAGE_PATH, 75, PLACEHOLDER_SIZE, settings.RED)
+        second = assets.load_sprite(INVALID_IMAGE_PATH, 75, PLACEHOLDER_SIZE, settings.RED)
+
+    mock_load.assert_called_once_with(INVALID_IMAGE_PATH)
+    mock_print.assert_called_once()
+    assert first is second
+    assert first.image.get_size() == PLACEHOLDER_SIZE
+    assert first.image.get_at((0, 0))[:3] == settings.RED
+
+
+def test_load_sprite_placeholder_size_is_separate_entry(mocker):
+    # Placeholders of different sizes must not share a cached surface
+    mocker.patch('builtins.print')
+    with patch('pygame.image.load', side_effect=pygame.error("Simulated failure")):
+        small = assets.load_sprite(INVALID_IMAGE_PATH, 75, (10, 20), settings.RED)
+        large = assets.load_sprite(INVALID_IMAGE_PATH, 75, (30, 60), settings.RED)
+
+    assert small.image.get_size() == (10, 20)
+    assert large.image.get_size() == (30, 60)
+
+
+def test_clear_cache_forces_reload():
+    first = assets.load_sprite(settings.NPC_IMAGE_PATH, 75, PLACEHOLDER_SIZE, settings.BLUE)
+    assets.clear_cache()
+    second = assets.load_sprite(settings.NPC_IMAGE_PATH, 75, PLACEHOLDER_SIZE, settings.BLUE)
+
+    assert first is not second
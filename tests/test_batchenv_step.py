@@ -0,0 +1,116 @@
+import pytest
+import numpy as np
+
+import batch_env
+from batch_env import BatchEnv
+from world import World, InputState
+import settings
+
+
+@pytest.fixture(autouse=True)
+def source_assets(monkeypatch, tmp_path):
+    # Load sprites from source images, not from a local bake
+    monkeypatch.setattr(settings, 'ASSET_CACHE_DIR', str(tmp_path))
+
+
+def no_actions(race_count):
+    return np.zeros((race_count, batch_env.ACTION_COUNT), dtype=bool)
+
+
+def test_step_matches_world(monkeypatch):
+    # Without traffic, one batched race drives exactly like the World
+    monkeypatch.setattr(settings, 'NPC_SPAWN_INTERVAL', 10 ** 6)
+    world = World()
+    env = BatchEnv(1)
+
+    for frame in range(180):
+        inputs = InputState(
+            accelerate=frame < 120,
+            brake=frame >= 150,
+            left=40 <= frame < 70,
+            right=90 <= frame < 100,
+        )
+        actions = no_actions(1)
+        actions[0] = [inputs.accelerate, inputs.brake, inputs.left, inputs.right]
+
+        world.step(inputs)
+        env.step(actions)
+
+        assert env.road_speed[0] == pytest.approx(world.current_road_speed)
+        assert env.road_offset[0] == pytest.approx(world.road_offset)
+        assert env.player_x[0] == pytest.approx(world.player_car.x_float)
+
+
+def test_step_collision_ends_and_restarts_race(monkeypatch):
+    env = BatchEnv(3)
+    env.road_speed[:] = 500
+    env.score[1] = 30
+    # Put an NPC on top of the second race's player
+    env.npc_alive[1, 0] = True
+    env.npc_lane[1, 0] = int(np.argmin(np.abs(np.array(settings.LANE_POSITIONS) - env.player_x[1])))
+    env.npc_y[1, 0] = env.player_top
+
+    rewards, dones = env.step(no_actions(3))
+
+    assert dones.tolist() == [False, True, False]
+    assert env.final_score[1] == 30
+    # The crashed race starts again, the others carry on
+    assert env.score[1] == 0
+    assert env.road_speed[1] == 0
+    assert not env.npc_alive[1].any()
+    assert env.road_speed[0] == env.road_speed[2] == 500
+
+
+def test_step_scores_each_pass_once():
+    env = BatchEnv(2)
+    # An NPC in the first race, just above the player's bottom edge
+    env.npc_alive[0, 0] = True
+    env.npc_lane[0, 0] = 0
+    env.npc_y[0, 0] = env.player_bottom
+    env.npc_speed[0, 0] = 0
+    env.road_speed[0] = settings.SIMULATION_HZ
+
+    rewards, _ = env.step(no_actions(2))
+    assert rewards.tolist() == [10, 0]
+
+    rewards, _ = env.step(no_actions(2))
+    assert rewards.tolist() == [0, 0]
+    assert env.score.tolist() == [10, 0]
+
+
+def test_step_spawns_in_open_lanes(monkeypatch):
+    monkeypatch.setattr(settings, 'MAX_NPCS', 3)
+    env = BatchEnv(50, seed=1)
+    steps_per_spawn = int(settings.NPC_SPAWN_INTERVAL * settings.SIMULATION_HZ)
+
+    # Stand still so every spawned NPC stays near the top of the screen
+    for _ in range(steps_per_spawn * 5):
+        env.step(no_actions(50))
+
+    # One NPC per spawn interval, never more than MAX_NPCS
+    assert (env.npc_alive.sum(axis=1) == 3).all()
+    # NPCs near the top of the screen never share a lane
+    for race in range(50):
+        lanes = env.npc_lane[race][env.npc_alive[race]]
+        assert len(set(lanes.tolist())) == len(lanes)
+
+
+@pytest.mark.parametrize(
+    "mode, overlap, crashed",
+    [("mask", 5, False), ("mask", 40, True), ("rect", 5, True)],
+)
+def test_step_collides_like_world(monkeypatch, mode, overlap, crashed):
+    # The NPC's bottom right corner overlaps the player's top left corner
+    # by overlap pixels, where the car images are transparent at 5
+    monkeypatch.setattr(settings, 'COLLISION_MODE', mode)
+    env = BatchEnv(1)
+    env.npc_alive[0, 0] = True
+    env.npc_lane[0, 0] = 4
+    env.npc_speed[0, 0] = 0
+    env.npc_y[0, 0] = env.player_top + overlap - env.npc_height
+    player_left = env.npc_lane_lefts[4] + env.npc_width - overlap
+    env.player_x[0] = player_left + env.player_width // 2
+
+    _, dones = env.step(no_actions(1))
+
+    assert dones.tolist() == [crashed]
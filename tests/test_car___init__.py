@@ -4,6 +4,7 @@ from unittest.mock import patch, MagicMock
 
 # Assuming car.py and settings.py are in the same directory or accessible via PYTHONPATH
 from car import Car
+import assets
 import settings
 
 # Define constants for test inputs to avoid magic numbers
@@ -19,6 +20,8 @@ def pygame_minimal_setup():
     # Minimal pygame setup required for Surface, Rect, mask, and pygame.error
     # This ensures pygame's internal state is ready for these operations
     pygame.init()
+    # Start every test with an empty sprite cache so image loading is exercised
+    assets.clear_cache()
     yield
     pygame.quit()
 
@@ -0,0 +1,126 @@
+import os
+import pytest
+import pygame
+
+import profiler
+from profiler import FrameProfiler, PHASES
+from game import Game
+import settings
+
+# Run the real game headlessly
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+def record(frame_profiler, phase_ns):
+    # Record a frame whose phases took the given nanoseconds
+    frame_profiler.begin_frame()
+    frame_profiler._current[:] = phase_ns
+    frame_profiler.end_frame()
+
+
+def test_mark_times_each_phase(mocker):
+    clock = mocker.patch('time.perf_counter_ns')
+    clock.side_effect = [0, 100, 350, 1350, 1400]
+    frame_profiler = FrameProfiler(4)
+
+    frame_profiler.begin_frame()
+    for phase in PHASES:
+        frame_profiler.mark(phase)
+    frame_profiler.end_frame()
+
+    assert frame_profiler.recent().tolist() == [[100, 250, 1000, 50]]
+
+
+def test_ring_buffer_keeps_latest_frames():
+    frame_profiler = FrameProfiler(3)
+    for frame in range(5):
+        record(frame_profiler, [frame, 0, 0, 0])
+
+    # The two oldest frames were overwritten, the rest are oldest first
+    assert frame_profiler.frame_count == 5
+    assert frame_profiler.recent()[:, 0].tolist() == [2, 3, 4]
+
+
+def test_stats_percentiles_in_milliseconds():
+    frame_profiler = FrameProfiler(100)
+    for frame in range(1, 101):
+        record(frame_profiler, [frame * 1_000_000, 0, 0, 1_000_000])
+
+    stats = frame_profiler.stats()
+
+    assert stats["events"]["p50"] == pytest.approx(50.5)
+    assert stats["events"]["p99"] == pytest.approx(99.01)
+    assert stats["events"]["max"] == pytest.approx(100)
+    assert stats["update"]["max"] == 0
+    assert stats["frame"]["max"] == pytest.approx(101)
+
+
+def test_stats_empty():
+    assert FrameProfiler(10).stats() == {}
+
+
+def test_dump_writes_buffer(tmp_path):
+    frame_profiler = FrameProfiler(2)
+    for frame in range(3):
+        record(frame_profiler, [frame, 1, 2, 3])
+    path = tmp_path / "profile.csv"
+
+    frame_profiler.dump(str(path))
+
+    lines = path.read_text().splitlines()
+    assert lines[0] == "frame,events_ns,update_ns,draw_ns,present_ns"
+    assert lines[1:] == ["1,1,1,2,3", "2,2,1,2,3"]
+
+
+@pytest.fixture
+def game(mocker, monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, 'PROFILE_FRAMES', True)
+    monkeypatch.setattr(settings, 'PROFILE_DUMP_PATH', str(tmp_path / "profile.csv"))
+    mocker.patch.object(Game, '_load_high_score')
+    # Fonts aren't needed to test the main loop
+    mocker.patch('game.UIManager')
+    game = Game()
+    yield game
+    pygame.quit()
+
+
+def test_run_profiles_frames_and_dumps_on_exit(game, mocker):
+    game.show_instructions = False
+    mocker.patch('pygame.quit')
+    handle_events = game._handle_events
+
+    # Play a few frames, then quit
+    def play(events):
+        handle_events(events)
+        if game.profiler.frame_count == 3:
+            game.running = False
+
+    game._handle_events = play
+    game.run()
+
+    # The frame that stopped the game is finished and recorded too
+    assert game.profiler.frame_count == 4
+    assert (game.profiler.recent()[:, PHASES.index("draw")] > 0).all()
+    lines = open(settings.PROFILE_DUMP_PATH).read().splitlines()
+    assert len(lines) == 5
+
+
+def test_f2_dumps_profile(game):
+    game.profiler.begin_frame()
+    game.profiler.end_frame()
+
+    game._handle_events([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F2)])
+
+    assert os.path.exists(settings.PROFILE_DUMP_PATH)
+    # The key press doesn't dismiss the instructions
+    assert game.show_instructions
+
+
+def test_disabled_by_default(mocker):
+    mocker.patch.object(Game, '_load_high_score')
+    mocker.patch('game.UIManager')
+    game = Game()
+    assert isinstance(game.profiler, profiler.DisabledProfiler)
+    assert not game.profiler.enabled
+    pygame.quit()
@@ -22,9 +22,13 @@ def game_instance(mocker):
     # Mock methods of the Game class itself that are called in __init__
     mocker.patch.object(Game, '_load_high_score')
 
+    # pygame.init is mocked, so start the font module UIManager needs
+    pygame.font.init()
+
     # Create and return a Game instance
     game = Game()
-    return game
+    yield game
+    pygame.font.quit()
 
 # Test 1: Verify Pygame and mixer initialization
 def test_pygame_and_mixer_initialization(game_instance):
@@ -61,8 +65,8 @@ def test_road_object_initialization(game_instance):
 
 # Test 7: Verify PlayerCar object initialization
 def test_player_car_object_initialization(game_instance):
-    # Check player_car attribute is an instance of PlayerCar
-    assert isinstance(game_instance.player_car, PlayerCar)
+    # Check the world's player_car is an instance of PlayerCar
+    assert isinstance(game_instance.world.player_car, PlayerCar)
 
 # Test 8: Verify UIManager object initialization
 def test_ui_manager_object_initialization(game_instance):
@@ -73,15 +77,14 @@ def test_ui_manager_object_initialization(game_instance):
 def test_sprite_groups_initialization(game_instance):
     # Check all_sprites group type and content
     assert isinstance(game_instance.all_sprites, pygame.sprite.Group)
-    assert game_instance.player_car in game_instance.all_sprites
-    # Check npc_cars group type and initial emptiness
-    assert isinstance(game_instance.npc_cars, pygame.sprite.Group)
-    assert len(game_instance.npc_cars) == 0
+    assert game_instance.player_sprite in game_instance.all_sprites
+    # Check no NPC sprites are in use yet
+    assert len(game_instance.npc_sprites) == 0
 
 # Test 10: Verify score initialization
 def test_score_initialization(game_instance):
     # Check score is initialized to 0
-    assert game_instance.score == 0
+    assert game_instance.world.score == 0
 
 # Test 11: Verify high score initialization
 def test_high_score_initialization_and_load_attempt(game_instance):
@@ -93,14 +96,10 @@ def test_high_score_initialization_and_load_attempt(game_instance):
 # Test 12: Verify current road speed initialization
 def test_current_road_speed_initialization(game_instance):
     # Check current_road_speed is initialized to 0
-    assert game_instance.current_road_speed == 0
-
-# Test 13: Verify NPC spawn event setup
-def test_npc_spawn_event_setup(game_instance):
-    # Check NPC_SPAWN_EVENT constant value
-    assert game_instance.NPC_SPAWN_EVENT == pygame.USEREVENT + 1
-    # Check pygame.time.set_timer was called with correct arguments
-    pygame.time.set_timer.assert_called_once_with(
-        game_instance.NPC_SPAWN_EVENT,
-        int(settings.NPC_SPAWN_INTERVAL * 1000)
-    )
\ No newline at end of file
+    assert game_instance.world.current_road_speed == 0
+
+# Test 13: NPC spawns come from the simulation, not a pygame timer
+def test_no_npc_spawn_timer(game_instance):
+    pygame.time.set_timer.assert_not_called()
+    # The world's scheduler decides when NPCs spawn
+    assert game_instance.world.spawner.interval == settings.NPC_SPAWN_INTERVAL
@@ -0,0 +1,96 @@
+import os
+import pytest
+import pygame
+
+from game import Game
+import settings
+
+# Run the real game headlessly
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+@pytest.fixture
+def game(mocker, monkeypatch):
+    monkeypatch.setattr(settings, 'RENDER_MODE', 'dirty')
+    mocker.patch.object(Game, '_load_high_score')
+    game = Game()
+    game.show_instructions = False
+    yield game
+    pygame.quit()
+
+
+def move_player(game, distance):
+    # Move the simulated player without anything to interpolate from
+    player_car = game.world.player_car
+    player_car.x_float += distance
+    player_car.previous_x_float = player_car.x_float
+
+
+def draw_settled_frames(game):
+    # The first draw of a LayeredDirty group paints everything, and the
+    # sprites drawn by it are flagged dirty once more on the next frame
+    game._draw_elements()
+    game._draw_elements()
+
+
+def test_first_frame_is_full(game):
+    # Nothing is on screen yet, so the whole display must be updated
+    assert game._draw_elements() is None
+
+
+def test_stationary_frame_pushes_nothing(game):
+    draw_settled_frames(game)
+
+    # Road stopped and nothing moved: no screen areas change
+    assert game._draw_elements() == []
+
+
+def test_moved_player_pushes_old_and_new_area(game):
+    draw_settled_frames(game)
+    old_rect = game.player_sprite.rect.copy()
+
+    move_player(game, 1)
+    changed_rects = game._draw_elements()
+
+    # The changed area covers where the car was and where it is now
+    changed_area = changed_rects[0].unionall(changed_rects[1:])
+    assert changed_area.contains(old_rect.union(game.player_sprite.rect))
+    # ...and doesn't spill into the rest of the screen
+    assert changed_area.width < game.screen_width / 2
+
+
+def test_score_change_pushes_hud_only(game):
+    draw_settled_frames(game)
+
+    game.world.score += 10
+    changed_rects = game._draw_elements()
+
+    assert len(changed_rects) >= 1
+    for rect in changed_rects:
+        assert rect.colliderect(game.ui_manager.score_text.rect)
+
+
+def test_scrolling_road_is_full_frame(game):
+    game._draw_elements()
+
+    game.world.road_offset += 5
+    game.world.previous_road_offset = game.world.road_offset
+
+    assert game._draw_elements() is None
+
+
+def test_dirty_frames_match_full_redraw(game, monkeypatch):
+    # Draw a few frames with movement using dirty rects
+    game._draw_elements()
+    for _ in range(5):
+        move_player(game, 1)
+        game.world.score += 10
+        game._draw_elements()
+    dirty_pixels = pygame.image.tobytes(game.screen, "RGB")
+
+    # Redraw the same state from scratch
+    game.repaint_all = True
+    game._draw_elements()
+
+    assert pygame.image.tobytes(game.screen, "RGB") == dirty_pixels
@@ -24,12 +24,14 @@ def mock_game_environment():
     """
     Provides a mocked environment for Game class instantiation
     Mocks pygame, dependent classes (Road, PlayerCar, UIManager), and the settings module
+    PlayerCar is created by the World that Game owns, so it is patched in world.py
     """
     # Patch all external dependencies of the Game class constructor and _draw_elements method
     with patch('game.pygame') as mock_pygame, \
             patch('game.Road') as MockRoad, \
-            patch('game.PlayerCar') as MockPlayerCar, \
+            patch('world.PlayerCar') as MockPlayerCar, \
             patch('game.UIManager') as MockUIManager, \
+            patch('game.Game._load_high_score'), \
             patch('game.settings', MagicMock(**MOCK_SETTINGS_VALUES)) as mock_settings_module:
         # Configure mock_pygame attributes and methods called during Game.__init__
         mock_pygame.init = MagicMock(name="pygame_init_func")
@@ -43,25 +45,16 @@ def mock_game_environment():
         # self.clock
         mock_pygame.time.Clock.return_value = MagicMock(name="mock_pygame_clock")
 
-        # self.NPC_SPAWN_EVENT and timer
-        mock_pygame.USEREVENT = 100  # Define a base for USEREVENT for predictability
-        mock_pygame.time.set_timer = MagicMock(name="pygame_set_timer_func")
-
-        # Sprite groups: Game.__init__ creates two: self.all_sprites and self.npc_cars
-        # We use side_effect to return distinct mocks for each call to pygame.sprite.Group()
+        # Sprite group: Game.__init__ creates self.all_sprites
         mock_all_sprites_group = MagicMock(name="all_sprites_pygame_group")
-        mock_npc_cars_group = MagicMock(name="npc_cars_pygame_group")
-        mock_pygame.sprite.Group.side_effect = [mock_all_sprites_group, mock_npc_cars_group]
+        mock_pygame.sprite.Group.return_value = mock_all_sprites_group
 
         # Mock instances that Game creates internally
         mock_road_instance = MockRoad.return_value
         mock_player_car_instance = MockPlayerCar.return_value
         mock_ui_manager_instance = MockUIManager.return_value
 
-        # The _load_high_score method is 'pass' in the provided code
-        # If it performed I/O, it would need patching, e.g.,
-        # with patch('game.Game._load_high_score', MagicMock()) as mock_load_high_score:
-        # For now, no extra patch is needed for it specifically for these tests
+        # _load_high_score is patched above so no high score file is read
 
         # Import Game class here, ensuring it uses the patched dependencies
         from game import Game
@@ -93,8 +86,9 @@ def test_draw_elements_when_game_not_over(mock_game_environment):
     game_instance = Game()
 
     # Configure game state for this specific test case
+    game_instance.show_instructions = False
     game_instance.game_over = False
-    game_instance.score = 150
+    game_instance.world.score = 150
     game_instance.high_score = 300
 
     # Ensure game_instance.screen.fill is a fresh MagicMock for this test call
@@ -113,7 +107,7 @@ def test_draw_elements_when_game_not_over(mock_game_environment):
     # Verify all game sprites are drawn onto the screen
     mock_all_sprites.draw.assert_called_once_with(mock_screen)
     # Verify score is displayed
-    mock_ui_manager.display_score.assert_called_once_with(mock_screen, game_instance.score)
+    mock_ui_manager.display_score.assert_called_once_with(mock_screen, game_instance.world.score)
     # Verify high score is displayed
     mock_ui_manager.display_high_score.assert_called_once_with(mock_screen, game_instance.high_score)
     # Verify game over screen is NOT displayed when game is not over
@@ -133,8 +127,9 @@ def test_draw_elements_when_game_is_over(mock_game_environment):
     game_instance = Game()
 
     # Configure game state for game over scenario
+    game_instance.show_instructions = False
     game_instance.game_over = True
-    game_instance.score = 50
+    game_instance.world.score = 50
     game_instance.high_score = 250  # Example high score
 
     # Ensure game_instance.screen.fill is a fresh MagicMock
@@ -150,8 +145,8 @@ def test_draw_elements_when_game_is_over(mock_game_environment):
     mock_road.draw.assert_called_once_with(mock_screen)
     mock_all_sprites.draw.assert_called_once_with(mock_screen)
     # Verify score and high score are still displayed
-    mock_ui_manager.display_score.assert_called_once_with(mock_screen, game_instance.score)
+    mock_ui_manager.display_score.assert_called_once_with(mock_screen, game_instance.world.score)
     mock_ui_manager.display_high_score.assert_called_once_with(mock_screen, game_instance.high_score)
     # Verify game over screen IS displayed with correct current score and high score
-    mock_ui_manager.display_game_over.assert_called_once_with(mock_screen, game_instance.score,
+    mock_ui_manager.display_game_over.assert_called_once_with(mock_screen, game_instance.world.score,
                                                               game_instance.high_score)
\ No newline at end of file
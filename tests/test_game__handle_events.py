@@ -42,43 +42,33 @@ def game_instance(mocker):
     mocker.patch('pygame.display.set_mode')
     mocker.patch('pygame.display.set_caption')
     mocker.patch('pygame.time.Clock')
-    mocker.patch('pygame.time.set_timer')
 
-    # Mock classes instantiated by Game and their methods
-    # PlayerCar mock needs a move_horizontal method
-    mock_player_car_instance = Mock(
-        spec_set=['move_horizontal'])  # spec_set ensures only move_horizontal can be called/mocked
-    mock_player_car_instance.move_horizontal = Mock()
-    mocker.patch('car.PlayerCar', return_value=mock_player_car_instance)
-
-    mocker.patch('road.Road')
-    mocker.patch('ui_manager.UIManager')
-
-    # Mock sprite group and its add method
-    mock_sprite_group_instance = Mock()
-    mock_sprite_group_instance.add = Mock()
-    mocker.patch('pygame.sprite.Group', return_value=mock_sprite_group_instance)
+    # Mock the classes Game creates for drawing (fonts aren't initialised)
+    mocker.patch('game.Road')
+    mocker.patch('game.UIManager')
 
     mocker.patch('game.Game._load_high_score')
 
     game = Game()
-    # Ensure game.player_car is the mock we configured
-    game.player_car = mock_player_car_instance
+    # Watch the simulated player's steering
+    mocker.spy(game.world.player_car, 'move_horizontal')
 
     # Mock methods that _handle_events might call on the game instance itself
     game._reset_game = Mock()
-    game._spawn_npc_car = Mock()
 
-    # Ensure NPC_SPAWN_EVENT is defined as it is in __init__
-    game.NPC_SPAWN_EVENT = pygame.USEREVENT + 1
-
-    # Set initial states
+    # Set initial states (past the instructions screen)
     game.running = True
     game.game_over = False
-    game.current_road_speed = 0
+    game.show_instructions = False
+    game.world.current_road_speed = 0
     return game
 
 
+def step(game):
+    # Run one simulation step with the controls _handle_events read
+    game.world.step(game.inputs)
+
+
 # Test cases
 
 def test_handle_event_quit(game_instance, mocker):
@@ -123,159 +113,148 @@ def test_handle_event_quit_via_escape_when_over(game_instance, mocker):
     assert game_instance.running is False
 
 
-def test_handle_event_npc_spawn_when_not_over(game_instance, mocker):
-    # Arrange
-    game_instance.game_over = False
-    spawn_event = pygame.event.Event(game_instance.NPC_SPAWN_EVENT)
-    mocker.patch('pygame.event.get', return_value=[spawn_event])
-    mocker.patch('pygame.key.get_pressed', return_value=mock_key_state())
-
-    # Act
-    game_instance._handle_events()
-
-    # Assert
-    game_instance._spawn_npc_car.assert_called_once()
-
-
 @pytest.mark.parametrize("key", [pygame.K_UP, pygame.K_w])
 def test_handle_keys_accelerate(key, game_instance, mocker):
     # Arrange
-    game_instance.game_over = False
-    game_instance.current_road_speed = 10
-    mocker.patch('pygame.event.get', return_value=[])  # No quit/spawn events
+    game_instance.world.current_road_speed = 10
+    mocker.patch('pygame.event.get', return_value=[])  # No quit events
     mocker.patch('pygame.key.get_pressed', return_value=mock_key_state((key,)))
 
-    expected_speed = min(settings.MAX_SPEED, 10 + settings.ACCELERATION_CONSTANT)
+    # Speeds are in pixels per second, changed over one step
+    expected_speed = min(
+        settings.MAX_SPEED, 10 + settings.ACCELERATION_CONSTANT * game_instance.world.dt
+    )
 
     # Act
     game_instance._handle_events()
+    step(game_instance)
 
     # Assert
-    assert game_instance.current_road_speed == expected_speed
+    assert game_instance.inputs.accelerate
+    assert game_instance.world.current_road_speed == pytest.approx(expected_speed)
 
 
 @pytest.mark.parametrize("key", [pygame.K_DOWN, pygame.K_s])
 def test_handle_keys_brake(key, game_instance, mocker):
     # Arrange
-    game_instance.game_over = False
-    game_instance.current_road_speed = 20
+    game_instance.world.current_road_speed = 100
     mocker.patch('pygame.event.get', return_value=[])
     mocker.patch('pygame.key.get_pressed', return_value=mock_key_state((key,)))
 
-    expected_speed = max(0, 20 - settings.BRAKING_CONSTANT)
+    expected_speed = max(0, 100 - settings.BRAKING_CONSTANT * game_instance.world.dt)
 
     # Act
     game_instance._handle_events()
+    step(game_instance)
 
     # Assert
-    assert game_instance.current_road_speed == expected_speed
+    assert game_instance.inputs.brake
+    assert game_instance.world.current_road_speed == pytest.approx(expected_speed)
 
 
-@pytest.mark.parametrize("key, expected_arg", [
-    (pygame.K_LEFT, -settings.HORIZONTAL_SPEED_CONSTANT),
-    (pygame.K_a, -settings.HORIZONTAL_SPEED_CONSTANT)
-])
-def test_handle_keys_move_left(key, expected_arg, game_instance, mocker):
+@pytest.mark.parametrize("key", [pygame.K_LEFT, pygame.K_a])
+def test_handle_keys_move_left(key, game_instance, mocker):
     # Arrange
-    game_instance.game_over = False
     mocker.patch('pygame.event.get', return_value=[])
     mocker.patch('pygame.key.get_pressed', return_value=mock_key_state((key,)))
 
     # Act
     game_instance._handle_events()
+    step(game_instance)
 
-    # Assert
-    game_instance.player_car.move_horizontal.assert_called_once_with(expected_arg)
+    # Assert: steered left for one step
+    game_instance.world.player_car.move_horizontal.assert_called_once_with(
+        -1, game_instance.world.dt
+    )
 
 
-@pytest.mark.parametrize("key, expected_arg", [
-    (pygame.K_RIGHT, settings.HORIZONTAL_SPEED_CONSTANT),
-    (pygame.K_d, settings.HORIZONTAL_SPEED_CONSTANT)
-])
-def test_handle_keys_move_right(key, expected_arg, game_instance, mocker):
+@pytest.mark.parametrize("key", [pygame.K_RIGHT, pygame.K_d])
+def test_handle_keys_move_right(key, game_instance, mocker):
     # Arrange
-    game_instance.game_over = False
     mocker.patch('pygame.event.get', return_value=[])
     mocker.patch('pygame.key.get_pressed', return_value=mock_key_state((key,)))
 
     # Act
     game_instance._handle_events()
+    step(game_instance)
 
-    # Assert
-    game_instance.player_car.move_horizontal.assert_called_once_with(expected_arg)
+    # Assert: steered right for one step
+    game_instance.world.player_car.move_horizontal.assert_called_once_with(
+        1, game_instance.world.dt
+    )
 
 
 def test_accelerate_at_max_speed(game_instance, mocker):
     # Arrange
-    game_instance.game_over = False
-    game_instance.current_road_speed = settings.MAX_SPEED
+    game_instance.world.current_road_speed = settings.MAX_SPEED
     mocker.patch('pygame.event.get', return_value=[])
     mocker.patch('pygame.key.get_pressed', return_value=mock_key_state((pygame.K_UP,)))
 
     # Act
     game_instance._handle_events()
+    step(game_instance)
 
     # Assert
-    assert game_instance.current_road_speed == settings.MAX_SPEED
+    assert game_instance.world.current_road_speed == settings.MAX_SPEED
 
 
 def test_brake_at_zero_speed(game_instance, mocker):
     # Arrange
-    game_instance.game_over = False
-    game_instance.current_road_speed = 0
+    game_instance.world.current_road_speed = 0
     mocker.patch('pygame.event.get', return_value=[])
     mocker.patch('pygame.key.get_pressed', return_value=mock_key_state((pygame.K_DOWN,)))
 
     # Act
     game_instance._handle_events()
+    step(game_instance)
 
     # Assert
-    assert game_instance.current_road_speed == 0
+    assert game_instance.world.current_road_speed == 0
 
 
 def test_no_relevant_events_or_keys(game_instance, mocker):
     # Arrange
-    game_instance.game_over = False
     initial_speed = 50
-    game_instance.current_road_speed = initial_speed
+    game_instance.world.current_road_speed = initial_speed
     initial_running_state = game_instance.running  # Should be True
     mocker.patch('pygame.event.get', return_value=[])  # No events
     mocker.patch('pygame.key.get_pressed', return_value=mock_key_state())  # No keys
 
     # Act
     game_instance._handle_events()
+    step(game_instance)
 
     # Assert
     assert game_instance.running == initial_running_state
-    assert game_instance.current_road_speed == initial_speed
+    assert game_instance.world.current_road_speed == initial_speed
     game_instance._reset_game.assert_not_called()
-    game_instance._spawn_npc_car.assert_not_called()
-    game_instance.player_car.move_horizontal.assert_not_called()
+    game_instance.world.player_car.move_horizontal.assert_not_called()
 
 
 def test_game_over_key_r_when_not_game_over(game_instance, mocker):
     # Arrange
-    game_instance.game_over = False  # Game is NOT over
     key_r_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_r)
     # Simulate pressing UP key as well to see if normal key handling proceeds
     mocker.patch('pygame.event.get', return_value=[key_r_event])
     mocker.patch('pygame.key.get_pressed', return_value=mock_key_state((pygame.K_UP,)))
 
-    initial_speed = game_instance.current_road_speed
+    initial_speed = game_instance.world.current_road_speed
 
     # Act
     game_instance._handle_events()
+    step(game_instance)
 
     # Assert
     game_instance._reset_game.assert_not_called()  # R key event does nothing if not game over
     # Check that acceleration still happened
-    assert game_instance.current_road_speed == initial_speed + settings.ACCELERATION_CONSTANT
+    assert game_instance.world.current_road_speed == pytest.approx(
+        initial_speed + settings.ACCELERATION_CONSTANT * game_instance.world.dt
+    )
 
 
 def test_gameplay_keys_when_game_over(game_instance, mocker):
     # Arrange
     game_instance.game_over = True  # Game IS over
-    initial_speed = game_instance.current_road_speed
     mocker.patch('pygame.event.get', return_value=[])
     # Simulate pressing UP and LEFT keys
     mocker.patch('pygame.key.get_pressed', return_value=mock_key_state((pygame.K_UP, pygame.K_LEFT)))
@@ -284,9 +263,10 @@ def test_gameplay_keys_when_game_over(game_instance, mocker):
     game_instance._handle_events()
 
     # Assert
-    # Speed should not change
-    assert game_instance.current_road_speed == initial_speed
+    # The held keys aren't read as controls
+    assert not game_instance.inputs.accelerate
+    assert not game_instance.inputs.left
     # Movement method should not be called
-    game_instance.player_car.move_horizontal.assert_not_called()
+    game_instance.world.player_car.move_horizontal.assert_not_called()
     # Ensure game is still running (unless ESC was pressed, which it wasn't here)
-    assert game_instance.running is True
\ No newline at end of file
+    assert game_instance.running is True
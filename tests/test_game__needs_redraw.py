@@ -0,0 +1,57 @@
+import os
+import pytest
+import pygame
+
+from game import Game
+
+# Run the real game headlessly
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+@pytest.fixture
+def game(mocker):
+    mocker.patch.object(Game, '_load_high_score')
+    # Fonts aren't needed to test the main loop
+    mocker.patch('game.UIManager')
+    game = Game()
+    yield game
+    pygame.quit()
+
+
+def test_needs_redraw_first_frame(game):
+    # The first idle frame is always drawn
+    assert game._is_idle()
+    assert game._needs_redraw([])
+
+
+def test_needs_redraw_idle_screen_without_input(game):
+    game._needs_redraw([])
+
+    # A timeout doesn't redraw a static screen
+    assert not game._needs_redraw([])
+
+
+def test_needs_redraw_idle_screen_after_input(game):
+    game._needs_redraw([])
+
+    assert game._needs_redraw([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_x)])
+
+
+def test_needs_redraw_after_state_change(game):
+    game.show_instructions = False
+    game.game_over = True
+    game._needs_redraw([])
+
+    # A new high score changes what the game over screen shows
+    game.high_score += 10
+    assert game._needs_redraw([])
+    assert not game._needs_redraw([])
+
+
+def test_needs_redraw_every_frame_while_playing(game):
+    game.show_instructions = False
+
+    assert not game._is_idle()
+    assert game._needs_redraw([])
+    assert game._needs_redraw([])
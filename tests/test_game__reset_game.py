@@ -28,7 +28,7 @@ def mock_dependencies(mocker):
     mock_player_car_instance.reset_position = MagicMock()
     mock_player_car_instance.move_horizontal = MagicMock()
 
-    mocker.patch('game.PlayerCar', return_value=mock_player_car_instance)
+    mocker.patch('world.PlayerCar', return_value=mock_player_car_instance)
 
     mock_road_instance = MagicMock()
     mocker.patch('game.Road', return_value=mock_road_instance)
@@ -36,7 +36,7 @@ def mock_dependencies(mocker):
 
     settings_attrs = {
         'SCREEN_WIDTH': 840, 'SCREEN_HEIGHT': 650, 'ROAD_IMAGE_PATH': "assets/background.png",
-        'PLAYER_IMAGE_PATH': "assets/player-image.png", 'PLAYER_START_X_POS': 420,
+        'PLAYER_IMAGE_PATH': "assets/player-image.png", 'NPC_IMAGE_PATH': "assets/npc-image.png", 'PLAYER_START_X_POS': 420,
         'PLAYER_Y_POS': 400, 'HORIZONTAL_SPEED_CONSTANT': 100, 'NPC_SPAWN_INTERVAL': 1,
         'HIGH_SCORE_FILE_PATH': "highscore.txt",
     }
@@ -62,19 +62,18 @@ def game_instance(mock_dependencies, mocker):
 def test_reset_game_core_attributes(game_instance):
     # Arrange
     game_instance.game_over = True
-    game_instance.score = 150
-    dummy_npc_for_set = MagicMock()
-    game_instance.passed_npcs = {dummy_npc_for_set}
-    game_instance.current_road_speed = 75
+    game_instance.world.score = 150
+    game_instance.world.pass_events = [1]
+    game_instance.world.current_road_speed = 75
 
     # Act
     game_instance._reset_game()
 
     # Assert
     assert not game_instance.game_over
-    assert game_instance.score == 0
-    assert not game_instance.passed_npcs
-    assert game_instance.current_road_speed == 0
+    assert game_instance.world.score == 0
+    assert not game_instance.world.pass_events
+    assert game_instance.world.current_road_speed == 0
 
 
 def test_reset_game_player_car_position_reset(game_instance):
@@ -82,7 +81,7 @@ def test_reset_game_player_car_position_reset(game_instance):
     game_instance._reset_game()
 
     # Assert
-    game_instance.player_car.reset_position.assert_called_once()
+    game_instance.world.player_car.reset_position.assert_called_once()
 
 
 def test_reset_game_reloads_high_score(game_instance):
@@ -93,37 +92,27 @@ def test_reset_game_reloads_high_score(game_instance):
     game_instance._load_high_score.assert_called_once()
 
 
-def test_reset_game_clears_npcs(game_instance, mocker):
+def test_reset_game_clears_npcs(game_instance):
     # Arrange
-    mock_npc1 = MagicMock(spec=pygame.sprite.Sprite)
-    mock_npc1._Sprite__g = {}
-    mock_npc1.kill = MagicMock(
-        side_effect=lambda: (game_instance.all_sprites.remove(mock_npc1), game_instance.npc_cars.remove(mock_npc1)))
+    game_instance.world.npcs.spawn(100, 100, 8, 0)
+    game_instance.world.npcs.spawn(200, 100, 8, 1)
+    game_instance._sync_npc_sprites()
 
-    mock_npc2 = MagicMock(spec=pygame.sprite.Sprite)
-    mock_npc2._Sprite__g = {}
-    mock_npc2.kill = MagicMock(
-        side_effect=lambda: (game_instance.all_sprites.remove(mock_npc2), game_instance.npc_cars.remove(mock_npc2)))
-
-    game_instance.npc_cars.add(mock_npc1, mock_npc2)
-    game_instance.all_sprites.add(mock_npc1, mock_npc2)
-
-    assert len(game_instance.npc_cars) == 2
-    expected_all_sprites_len = (1 if game_instance.player_car else 0) + 2
+    assert len(game_instance.world.npcs) == 2
+    expected_all_sprites_len = (1 if game_instance.world.player_car else 0) + 2
     assert len(game_instance.all_sprites) == expected_all_sprites_len
 
     # Act
     game_instance._reset_game()
+    game_instance._sync_npc_sprites()
 
     # Assert
-    mock_npc1.kill.assert_called_once()
-    mock_npc2.kill.assert_called_once()
-
-    assert not game_instance.npc_cars
-    expected_all_sprites_after_reset = 1 if game_instance.player_car else 0
+    assert not game_instance.world.npcs
+    assert not game_instance.npc_sprites
+    expected_all_sprites_after_reset = 1 if game_instance.world.player_car else 0
     assert len(game_instance.all_sprites) == expected_all_sprites_after_reset
-    if game_instance.player_car:
-        assert game_instance.player_car in game_instance.all_sprites
+    if game_instance.world.player_car:
+        assert game_instance.player_sprite in game_instance.all_sprites
 
 
 def test_reset_game_reinitializes_road(game_instance, mocker, mock_dependencies):
@@ -143,32 +132,46 @@ def test_reset_game_reinitializes_road(game_instance, mocker, mock_dependencies)
 
 def test_reset_game_with_no_initial_npcs(game_instance, mocker, mock_dependencies):
     # Arrange
-    assert not game_instance.npc_cars
-    expected_all_sprites_len = 1 if game_instance.player_car else 0
+    assert not game_instance.world.npcs
+    expected_all_sprites_len = 1 if game_instance.world.player_car else 0
     assert len(game_instance.all_sprites) == expected_all_sprites_len
 
     reinitialized_road_mock_class_edge = mocker.patch('game.Road')
     s = mock_dependencies["mock_settings"]
     game_instance.game_over = True
-    game_instance.score = 70
+    game_instance.world.score = 70
 
     # Act
     game_instance._reset_game()
 
     # Assert
     assert not game_instance.game_over
-    assert game_instance.score == 0
-    assert not game_instance.npc_cars
+    assert game_instance.world.score == 0
+    assert not game_instance.world.npcs
 
-    expected_all_sprites_after_reset = 1 if game_instance.player_car else 0
+    expected_all_sprites_after_reset = 1 if game_instance.world.player_car else 0
     assert len(game_instance.all_sprites) == expected_all_sprites_after_reset
-    if game_instance.player_car:
-        assert game_instance.player_car in game_instance.all_sprites
+    if game_instance.world.player_car:
+        assert game_instance.player_sprite in game_instance.all_sprites
 
-    if game_instance.player_car:
-        game_instance.player_car.reset_position.assert_called_once()
+    if game_instance.world.player_car:
+        game_instance.world.player_car.reset_position.assert_called_once()
     game_instance._load_high_score.assert_called_once()
     reinitialized_road_mock_class_edge.assert_called_once_with(
         s.ROAD_IMAGE_PATH, s.SCREEN_WIDTH, s.SCREEN_HEIGHT
     )
-    assert game_instance.road == reinitialized_road_mock_class_edge.return_value
\ No newline at end of file
+    assert game_instance.road == reinitialized_road_mock_class_edge.return_value
+
+
+
+def test_reset_game_reports_new_traffic_seed(game_instance, mocker, capsys):
+    old_seed = game_instance.world.seed
+    game_instance.on_reset = mocker.Mock()
+
+    game_instance._reset_game()
+
+    # The restarted race has its own seed, passed on so it can be
+    # reported, and the game itself prints nothing
+    assert game_instance.world.seed != old_seed
+    game_instance.on_reset.assert_called_once_with(game_instance)
+    assert capsys.readouterr().out == ""
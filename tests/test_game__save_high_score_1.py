@@ -19,7 +19,7 @@ def game_instance(monkeypatch):
 
     # Mock game-specific class instantiations in Game.__init__
     monkeypatch.setattr("game.Road", MagicMock(name="Road_mock"))
-    monkeypatch.setattr("game.PlayerCar", MagicMock(name="PlayerCar_mock"))
+    monkeypatch.setattr("game.World", MagicMock(name="World_mock"))
     monkeypatch.setattr("game.UIManager", MagicMock(name="UIManager_mock"))
 
     # Mock pygame.sprite.Group as its methods might be called
@@ -33,12 +33,12 @@ def game_instance(monkeypatch):
         game = Game()
         # Explicitly set initial high_score for tests after Game object is created
         game.high_score = 50 # Default initial high score for these tests
-        game.score = 0      # Default initial score
+        game.world.score = 0      # Default initial score
         return game
 
 def test_save_new_high_score_successful(game_instance):
     # Set current score to be higher than the initial high score
-    game_instance.score = 100
+    game_instance.world.score = 100
     game_instance.high_score = 50 # Explicitly set for clarity, matches fixture default
 
     # Mock builtins.open for file writing
@@ -56,7 +56,7 @@ def test_save_new_high_score_successful(game_instance):
 
 def test_save_score_not_higher_than_high_score(game_instance):
     # Set current score to be less than the initial high score
-    game_instance.score = 30
+    game_instance.world.score = 30
     game_instance.high_score = 50 # Explicitly set for clarity
 
     # Mock builtins.open to ensure it's not called for writing
@@ -70,7 +70,7 @@ def test_save_score_not_higher_than_high_score(game_instance):
     mock_file_open.assert_not_called()
 
     # Test case for score equal to high score
-    game_instance.score = 50
+    game_instance.world.score = 50
     # Reset mock_file_open call count if it persists across calls (it shouldn't for a new 'with' block, but good practice)
     mock_file_open = mock_open() # Re-initialize mock for a clean state in this part of the test
     with patch('builtins.open', mock_file_open):
@@ -83,7 +83,7 @@ def test_save_score_not_higher_than_high_score(game_instance):
 
 def test_save_new_high_score_io_error_on_write(game_instance):
     # Set current score to be higher than the initial high score
-    game_instance.score = 100
+    game_instance.world.score = 100
     game_instance.high_score = 50 # Explicitly set for clarity
 
     # Mock builtins.open to simulate an IOError during file write
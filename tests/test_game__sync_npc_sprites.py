@@ -0,0 +1,77 @@
+import os
+import pytest
+import pygame
+
+from game import Game
+import settings
+
+# Run the real game headlessly
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+@pytest.fixture
+def game(mocker):
+    mocker.patch.object(Game, '_load_high_score')
+    # Fonts aren't needed to test the NPC views
+    mocker.patch('game.UIManager')
+    game = Game()
+    yield game
+    pygame.quit()
+
+
+def test_sync_creates_sprite_at_simulated_position(game):
+    npc_id = game.world.npcs.spawn(settings.LANE_POSITIONS[0], 100, 8, 0)
+
+    game._sync_npc_sprites()
+
+    sprite = game.npc_sprites[npc_id]
+    assert sprite in game.all_sprites
+    assert sprite.rect.topleft == (
+        game.world.npcs.lefts()[0],
+        game.world.npcs.tops()[0],
+    )
+
+
+def test_sync_follows_moving_npc(game):
+    npc_id = game.world.npcs.spawn(settings.LANE_POSITIONS[0], 100, 0, 0)
+    game._sync_npc_sprites()
+    sprite = game.npc_sprites[npc_id]
+    old_top = sprite.rect.top
+
+    game.world.npcs.update(5, game.screen_height, 1)
+    game._sync_npc_sprites()
+
+    # The same sprite is reused and moved
+    assert game.npc_sprites[npc_id] is sprite
+    assert sprite.rect.top == old_top + 5
+
+
+def test_sync_removes_despawned_sprites(game):
+    npc_id = game.world.npcs.spawn(settings.LANE_POSITIONS[0], 100, 0, 0)
+    game._sync_npc_sprites()
+    sprite = game.npc_sprites[npc_id]
+
+    game.world.npcs.update(game.screen_height, game.screen_height, 1)
+    game._sync_npc_sprites()
+
+    assert npc_id not in game.npc_sprites
+    assert not sprite.alive()
+
+
+def test_sync_reuses_pooled_sprites(game):
+    pooled = set(game.npc_pool.free)
+    first = game.world.npcs.spawn(settings.LANE_POSITIONS[0], 100, 0, 0)
+    game._sync_npc_sprites()
+    sprite = game.npc_sprites[first]
+    assert sprite in pooled
+
+    # Despawn the NPC, then spawn another: its sprite comes back
+    game.world.npcs.update(game.screen_height, game.screen_height, 1)
+    game._sync_npc_sprites()
+    second = game.world.npcs.spawn(settings.LANE_POSITIONS[1], 100, 0, 1)
+    game._sync_npc_sprites()
+
+    assert game.npc_sprites[second] is sprite
+    assert sprite.lane_id == 1
+    assert game.npc_pool.misses == 0
@@ -0,0 +1,69 @@
+import os
+import pytest
+import pygame
+
+from game import Game
+from world import InputState
+
+# Run the real game headlessly
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+@pytest.fixture
+def game(mocker):
+    mocker.patch.object(Game, '_load_high_score')
+    # Fonts aren't needed to test the views
+    mocker.patch('game.UIManager')
+    game = Game()
+    game.show_instructions = False
+    yield game
+    pygame.quit()
+
+
+def test_sync_views_interpolates_road(game):
+    game.world.current_road_speed = 600
+    game.world.step(InputState())
+    # 600 pixels per second for one 60th of a second
+    assert game.world.road_offset == pytest.approx(10)
+
+    # Halfway to the next step, the road is drawn halfway along
+    game.accumulator = game.world.dt / 2
+    game._sync_views()
+
+    assert game.road.offset_float == pytest.approx(5)
+
+
+def test_sync_views_interpolates_player(game):
+    player_car = game.world.player_car
+    start_x = player_car.rect.centerx
+    player_car.previous_x_float = start_x
+    player_car.x_float = start_x + 20
+
+    game.accumulator = game.world.dt / 4
+    game._sync_views()
+
+    assert game.player_sprite.rect.centerx == start_x + 5
+
+
+def test_sync_views_does_not_move_simulated_player(game):
+    player_car = game.world.player_car
+    start_x = player_car.rect.centerx
+    player_car.previous_x_float = start_x - 20
+    player_car.x_float = start_x
+
+    # Drawing between the last two steps moves only the drawn sprite, so
+    # collisions still use the simulated position
+    game.accumulator = 0.0
+    game._sync_views()
+    assert game.player_sprite.rect.centerx == start_x - 20
+    assert player_car.rect.centerx == start_x
+
+
+def test_sync_views_idle_shows_latest_state(game):
+    game.world.road_offset = 30.0
+    game.game_over = True
+
+    game._sync_views()
+
+    assert game.road.offset_float == pytest.approx(30)
@@ -1,15 +1,12 @@
 import pytest
 import pygame
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
-# Assuming game.py, car.py, road.py, settings.py are in paths accessible by pytest
 from game import Game
-from car import PlayerCar  # Imported for spec
 from road import Road  # Imported for spec
+from world import World, InputState  # Imported for spec
 
 
-# import settings # Not directly used in this test file but good for context
-
 @pytest.fixture
 def game_instance_for_update(mocker):
     # Standard Pygame init mocks (called in Game.__init__)
@@ -20,76 +17,100 @@ def game_instance_for_update(mocker):
     mocker.patch('pygame.time.Clock')
     mocker.patch('pygame.time.set_timer')
 
-    # Mock Road class and ensure its instance's update method is a mock
-    mock_road_instance = Mock(spec=Road)
-    mock_road_instance.update = Mock(name='road_update_mock')
-    mocker.patch('game.Road', return_value=mock_road_instance)  # Patch where Road is looked up by game.py
-
-    # Mock PlayerCar class and ensure its instance's update method is a mock
-    mock_player_car_instance = Mock(spec=PlayerCar)
-    mock_player_car_instance.update = Mock(name='player_car_update_mock')
-    mocker.patch('game.PlayerCar', return_value=mock_player_car_instance)  # Patch where PlayerCar is looked up
+    # Mock Road and World so only the shell's own logic runs
+    mocker.patch('game.Road', return_value=Mock(spec=Road))
+    mock_world_instance = Mock(spec=World)
+    # The shell only reads the player's image and rect, to draw it
+    mock_world_instance.player_car = Mock(
+        image=pygame.Surface((10, 20)), rect=pygame.Rect(0, 0, 10, 20)
+    )
+    mock_world_instance.game_over = False
+    mock_world_instance.dt = 0.25
+    mock_world_instance.score = 40
+    mocker.patch('game.World', return_value=mock_world_instance)
 
     # Mock UIManager (as it's instantiated in Game.__init__)
     mocker.patch('game.UIManager')
 
-    # Mock pygame.sprite.Group for self.all_sprites and self.npc_cars
-    # We need self.npc_cars.update to be a mock
-    mock_all_sprites_group = Mock(spec=pygame.sprite.Group)
-    mock_all_sprites_group.add = Mock(name='all_sprites_add_mock')  # Called in __init__ for player_car
+    # Mock _load_high_score as it's called in Game.__init__
+    mocker.patch('game.Game._load_high_score')
 
-    mock_npc_cars_group = Mock(spec=pygame.sprite.Group)
-    mock_npc_cars_group.update = Mock(name='npc_cars_update_mock')  # This is key for the test
+    game = Game()
+    game.show_instructions = False
+    game._save_high_score = Mock(name='_save_high_score_mock')
+    return game
 
-    # Use side_effect to provide different mocks for the two Group creations in Game.__init__
-    # The first Group() call is for self.all_sprites, the second for self.npc_cars
-    group_creation_order = [mock_all_sprites_group, mock_npc_cars_group]
 
-    # Define a side_effect function for patching pygame.sprite.Group
-    # It will return mocks from group_creation_order in sequence
-    def group_side_effect(*args, **kwargs):
-        if group_creation_order:
-            return group_creation_order.pop(0)
-        # Fallback if more groups are created than expected (should not happen here)
-        return Mock(spec=pygame.sprite.Group)
+def test_update_game_state_steps_world(game_instance_for_update):
+    # Arrange
+    game = game_instance_for_update
+    game.inputs = InputState(accelerate=True)
+    game.accumulator = 0.3
 
-    mocker.patch('pygame.sprite.Group', side_effect=group_side_effect)
+    # Act
+    game._update_game_state()
 
-    # Mock _load_high_score as it's called in Game.__init__
-    mocker.patch('game.Game._load_high_score')
+    # Assert
+    # The simulation advances with the controls read this frame
+    game.world.step.assert_called_once_with(game.inputs)
+    # The rest of the time is kept for the next frame
+    assert game.accumulator == pytest.approx(0.05)
+    assert game.game_over is False
+    game._save_high_score.assert_not_called()
 
-    # Now, create the actual Game instance
-    # Its .road, .player_car, .all_sprites, and .npc_cars attributes will be our pre-configured mocks
-    game = Game()
 
-    # Mock the internal methods of the Game instance that _update_game_state calls
-    game._check_collisions = Mock(name='_check_collisions_mock')
-    game._update_score = Mock(name='_update_score_mock')
+def test_update_game_state_catches_up_fixed_steps(game_instance_for_update):
+    # Arrange
+    game = game_instance_for_update
+    # A slow frame covers several steps
+    game.accumulator = 0.8
 
-    # Set a known road speed for the test
-    game.current_road_speed = 75  # Example value
+    # Act
+    game._update_game_state()
 
-    return game
+    # Assert
+    assert game.world.step.call_count == 3
+    assert game.accumulator == pytest.approx(0.05)
 
 
-def test_update_game_state_calls_all_dependencies(game_instance_for_update):
+def test_update_game_state_waits_for_full_step(game_instance_for_update):
     # Arrange
     game = game_instance_for_update
-    expected_road_speed = game.current_road_speed
+    # A fast frame doesn't cover a whole step
+    game.accumulator = 0.1
 
     # Act
     game._update_game_state()
 
     # Assert
-    # Verify Road.update was called correctly
-    game.road.update.assert_called_once_with(expected_road_speed)
+    game.world.step.assert_not_called()
+    assert game.accumulator == pytest.approx(0.1)
+
 
-    # Verify PlayerCar.update was called
-    game.player_car.update.assert_called_once_with()
+def test_update_game_state_crash_ends_game(game_instance_for_update):
+    # Arrange
+    game = game_instance_for_update
+    game.world.game_over = True
+    game.accumulator = 1.0
 
-    # Verify NPCCars group's update was called
-    game.npc_cars.update.assert_called_once_with()  # Sprite groups are updated with no args usually
+    # Act
+    game._update_game_state()
+
+    # Assert
+    # Stepping stops at the crash
+    game.world.step.assert_called_once()
+    assert game.game_over is True
+    game._save_high_score.assert_called_once_with()
 
-    # Verify internal game methods were called
-    game._check_collisions.assert_called_once_with()
-    game._update_score.assert_called_once_with()
\ No newline at end of file
+
+def test_update_game_state_paused_on_idle_screens(game_instance_for_update):
+    # Arrange
+    game = game_instance_for_update
+    game.show_instructions = True
+    game.accumulator = 1.0
+
+    # Act
+    game._update_game_state()
+
+    # Assert
+    game.world.step.assert_not_called()
@@ -0,0 +1,58 @@
+import os
+import pytest
+import pygame
+
+from game import Game
+import settings
+
+# Run the real game headlessly
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+@pytest.fixture
+def game(mocker):
+    mocker.patch.object(Game, '_load_high_score')
+    # Fonts aren't needed to test the main loop
+    mocker.patch('game.UIManager')
+    game = Game()
+    pygame.event.clear()
+    yield game
+    pygame.quit()
+
+
+def test_wait_for_events_times_out_without_input(game, monkeypatch):
+    monkeypatch.setattr(settings, 'IDLE_WAIT_TIMEOUT_MS', 20)
+
+    assert game._wait_for_events() == []
+
+
+def test_wait_for_events_returns_queued_events_in_order(game):
+    first = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a)
+    second = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_b)
+    pygame.event.post(first)
+    pygame.event.post(second)
+
+    events = game._wait_for_events()
+
+    assert [event.key for event in events] == [pygame.K_a, pygame.K_b]
+
+
+def test_run_idle_screen_does_not_redraw_without_input(game, mocker, monkeypatch):
+    monkeypatch.setattr(settings, 'IDLE_WAIT_TIMEOUT_MS', 1)
+    draw = mocker.spy(game, '_draw_elements')
+    mocker.patch('pygame.quit')
+
+    # Stop after a handful of idle iterations
+    iterations = []
+
+    def handle_events(events):
+        iterations.append(events)
+        if len(iterations) == 5:
+            game.running = False
+
+    game._handle_events = handle_events
+    game.run()
+
+    # Only the first idle frame is drawn
+    assert draw.call_count == 1
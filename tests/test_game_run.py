@@ -15,10 +15,13 @@ def mock_pygame_essentials(mocker):
     mocker.patch('pygame.display.set_mode', return_value=MagicMock())  # Return a mock surface
     mocker.patch('pygame.display.set_caption', return_value=None)
     mocker.patch('pygame.display.flip', return_value=None)
+    mocker.patch('pygame.event.get', return_value=[])
 
     mock_clock_instance = MagicMock()
     # Ensure get_fps returns a value for the caption update
     mock_clock_instance.get_fps.return_value = settings.TARGET_FPS
+    # Milliseconds since the last frame
+    mock_clock_instance.tick.return_value = 1000 // settings.TARGET_FPS
     mocker.patch('pygame.time.Clock', return_value=mock_clock_instance)
 
     mocker.patch('pygame.time.set_timer', return_value=None)
@@ -30,10 +33,16 @@ def mock_pygame_essentials(mocker):
     mock_sprite_group_instance.empty = MagicMock()
     mocker.patch('pygame.sprite.Group', return_value=mock_sprite_group_instance)
 
-    # Mock classes instantiated by Game.__init__
-    mocker.patch('car.PlayerCar', autospec=True)
-    mocker.patch('road.Road', autospec=True)
-    mocker.patch('ui_manager.UIManager', autospec=True)
+    # Mock classes instantiated by Game.__init__ (where game.py looks them
+    # up, as pygame.init is mocked and fonts can't be created)
+    mock_player_car_class = mocker.patch('world.PlayerCar', autospec=True)
+    # Game draws the player from its image and rect
+    mock_player_car_class.return_value.image = pygame.Surface((10, 20))
+    mock_player_car_class.return_value.rect = pygame.Rect(0, 0, 10, 20)
+    mocker.patch('game.Road', autospec=True)
+    mocker.patch('game.UIManager', autospec=True)
+    # The FPS caption is only updated once CAPTION_UPDATE_MS has passed
+    mocker.patch('pygame.time.get_ticks', return_value=settings.CAPTION_UPDATE_MS)
 
     # Prevent file operations during tests
     mocker.patch('game.Game._load_high_score', return_value=None)
@@ -45,10 +54,13 @@ def mock_pygame_essentials(mocker):
 def game_instance(mock_pygame_essentials, mocker):
     """Creates a Game instance with mocked dependencies and methods for run()"""
     game = Game()
+    # Start past the instructions screen, in a frame-rate capped game
+    game.show_instructions = False
     # Mock internal methods called by run() to control their behavior and check calls
     game._handle_events = MagicMock()
     game._update_game_state = MagicMock()
-    game._draw_elements = MagicMock()
+    # Full-screen drawing, which is presented with a flip
+    game._draw_elements = MagicMock(return_value=None)
     return game
 
 
@@ -59,7 +71,7 @@ def test_run_loop_single_iteration_and_termination(game_instance, mock_pygame_es
     mock_clock = mock_pygame_essentials
 
     # Make _handle_events stop the loop after the first iteration
-    def side_effect_handle_events_single_run():
+    def side_effect_handle_events_single_run(events):
         game_instance.running = False
 
     game_instance._handle_events.side_effect = side_effect_handle_events_single_run
@@ -69,7 +81,7 @@ def test_run_loop_single_iteration_and_termination(game_instance, mock_pygame_es
     # Check clock ticked once with target FPS
     mock_clock.tick.assert_called_once_with(settings.TARGET_FPS)
     # Check internal methods were called once
-    game_instance._handle_events.assert_called_once()
+    game_instance._handle_events.assert_called_once_with([])
     game_instance._update_game_state.assert_called_once()  # game_over is False by default
     game_instance._draw_elements.assert_called_once()
     # Check display flip was called (using the globally patched pygame.display.flip)
@@ -88,9 +100,15 @@ def test_run_skips_update_game_state_when_game_over(game_instance, mock_pygame_e
 
     # Set game_over to True
     game_instance.game_over = True
+    # The game over screen waits for input instead of ticking
+    game_instance._wait_for_events = MagicMock(return_value=[])
+    # Use the real update, with enough time owed for several steps
+    del game_instance._update_game_state
+    game_instance.world.step = MagicMock()
+    game_instance.accumulator = 1.0
 
     # Make _handle_events stop the loop after the first iteration
-    def side_effect_handle_events_game_over():
+    def side_effect_handle_events_game_over(events):
         game_instance.running = False
 
     game_instance._handle_events.side_effect = side_effect_handle_events_game_over
@@ -98,12 +116,13 @@ def test_run_skips_update_game_state_when_game_over(game_instance, mock_pygame_e
     game_instance.run()
 
     # Check _handle_events and _draw_elements were called
-    game_instance._handle_events.assert_called_once()
+    game_instance._handle_events.assert_called_once_with([])
     game_instance._draw_elements.assert_called_once()
-    # Crucially, check _update_game_state was NOT called
-    game_instance._update_game_state.assert_not_called()
-    # Check other loop components still ran
-    mock_pygame_essentials.tick.assert_called_once_with(settings.TARGET_FPS)
+    # Crucially, check the simulation was NOT stepped
+    game_instance.world.step.assert_not_called()
+    # Check other loop components still ran, without a frame rate cap
+    game_instance._wait_for_events.assert_called_once()
+    mock_pygame_essentials.tick.assert_called_once_with()
     pygame.display.flip.assert_called_once()
     pygame.quit.assert_called_once()
 
@@ -116,7 +135,7 @@ def test_run_loop_multiple_iterations(game_instance, mock_pygame_essentials, moc
     current_iteration = 0
 
     # Make _handle_events control the loop for a set number of iterations
-    def side_effect_handle_events_multiple_runs():
+    def side_effect_handle_events_multiple_runs(events):
         nonlocal current_iteration
         current_iteration += 1
         if current_iteration >= loop_iterations:
@@ -148,7 +167,7 @@ def test_run_updates_caption_with_fps(game_instance, mock_pygame_essentials, moc
     mock_pygame_essentials.get_fps.return_value = test_fps  # mock_pygame_essentials is the clock mock
 
     # Make _handle_events stop the loop after the first iteration
-    def side_effect_handle_events_caption_test():
+    def side_effect_handle_events_caption_test(events):
         game_instance.running = False
 
     game_instance._handle_events.side_effect = side_effect_handle_events_caption_test
@@ -157,4 +176,31 @@ def test_run_updates_caption_with_fps(game_instance, mock_pygame_essentials, moc
 
     # Check set_caption was called once in the loop with the correct FPS string
     expected_caption = f"Car Racing Game - FPS: {test_fps:.2f}"
-    pygame.display.set_caption.assert_called_once_with(expected_caption)
\ No newline at end of file
+    pygame.display.set_caption.assert_called_once_with(expected_caption)
+
+def test_run_idle_screen_only_redraws_on_change(game_instance, mock_pygame_essentials, mocker):
+    # The instructions screen is drawn once, then not again until input
+    game_instance.show_instructions = True
+    key_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
+    game_instance._wait_for_events = MagicMock(side_effect=[[], [], [key_event]])
+    iterations = 0
+
+    def side_effect_handle_events_idle(events):
+        nonlocal iterations
+        iterations += 1
+        if iterations >= 3:
+            game_instance.running = False
+
+    game_instance._handle_events.side_effect = side_effect_handle_events_idle
+
+    game_instance.run()
+
+    # Every iteration waited for events instead of ticking at the frame rate
+    assert game_instance._wait_for_events.call_count == 3
+    mock_pygame_essentials.tick.assert_called_with()
+    game_instance._handle_events.assert_called_with([key_event])
+    # Drawn for the first frame and after the key press, but not while
+    # nothing happened
+    assert game_instance._draw_elements.call_count == 2
+    assert pygame.display.flip.call_count == 2
+    game_instance._update_game_state.assert_called()
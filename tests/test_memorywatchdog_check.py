@@ -0,0 +1,96 @@
+import os
+import tracemalloc
+import pygame
+import pytest
+
+from memory_watchdog import MemoryWatchdog, count_objects
+
+
+@pytest.fixture
+def watchdog(tmp_path):
+    watchdog = MemoryWatchdog(
+        10,
+        str(tmp_path / "memory.log"),
+        top_sites=5,
+        dump_threshold_kb=10**6,
+        dump_path=str(tmp_path / "snapshot_{}.tracemalloc"),
+        trace_allocations=True,
+    )
+    yield watchdog
+    watchdog.close()
+
+
+def test_check_waits_for_interval(watchdog, mocker):
+    take_snapshot = mocker.patch.object(watchdog, "_take_snapshot")
+
+    watchdog.check(now=100)
+    watchdog.check(now=105)
+    watchdog.check(now=109.9)
+    assert take_snapshot.call_count == 1
+
+    watchdog.check(now=110)
+    assert take_snapshot.call_count == 2
+
+
+def test_first_check_starts_tracing_without_logging(watchdog):
+    watchdog.check(now=0)
+
+    assert tracemalloc.is_tracing()
+    assert watchdog.snapshot is not None
+    assert not os.path.exists(watchdog.log_path)
+
+
+def test_check_logs_growth_and_object_counts(watchdog):
+    watchdog.check(now=0)
+    surfaces = [pygame.Surface((4, 4)) for _ in range(50)]
+    watchdog.check(now=10)
+
+    with open(watchdog.log_path) as log_file:
+        log = log_file.read()
+    assert "snapshot 2" in log
+    assert "Surface" in log
+    assert watchdog.counts["Surface"] >= len(surfaces)
+    # No full dump below the threshold
+    assert not os.path.exists(watchdog.dump_path.format(2))
+
+
+def test_check_dumps_snapshot_over_threshold(watchdog):
+    watchdog.dump_threshold_kb = 100
+    watchdog.check(now=0)
+    leak = [bytearray(1024) for _ in range(500)]
+    watchdog.check(now=10)
+
+    dump_path = watchdog.dump_path.format(2)
+    assert os.path.exists(dump_path)
+    assert tracemalloc.Snapshot.load(dump_path).traces
+    assert len(leak) == 500
+
+
+def test_close_stops_tracing(watchdog):
+    watchdog.check(now=0)
+    watchdog.close()
+
+    assert not tracemalloc.is_tracing()
+
+
+def test_check_without_allocation_tracing(watchdog):
+    # Only objects are counted, and tracemalloc is never started
+    watchdog.trace_allocations = False
+    watchdog.check(now=0)
+    watchdog.check(now=10)
+
+    assert not tracemalloc.is_tracing()
+    with open(watchdog.log_path) as log_file:
+        log = log_file.read()
+    assert "snapshot 2" in log
+    assert "Surface" in log
+    assert "traced memory" not in log
+
+
+def test_count_objects_finds_untracked_types():
+    rects = [pygame.Rect(0, 0, 1, 1) for _ in range(20)]
+
+    counts = count_objects({"Rect": pygame.Rect})
+
+    assert counts["Rect"] >= len(rects)
+
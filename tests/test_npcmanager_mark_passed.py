@@ -0,0 +1,89 @@
+import random
+import numpy as np
+import pytest
+
+import rules
+from npc_manager import NPCManager
+
+# Constants for the tests
+SCREEN_HEIGHT = 800
+CAR_WIDTH = 75
+CAR_HEIGHT = 150
+LANE_COUNT = 4
+PLAYER_BOTTOM = 500
+
+
+@pytest.fixture
+def npcs():
+    # Fixture to create a small NPC manager for each test
+    return NPCManager(4, CAR_WIDTH, CAR_HEIGHT, LANE_COUNT)
+
+
+def spawn_at_top(npcs, top, speed, lane_id=0):
+    # Helper to spawn an NPC with its rect top at a specific value
+    return npcs.spawn(100, top + CAR_HEIGHT // 2, speed, lane_id)
+
+
+def test_mark_passed_returns_npcs_crossing_the_player(npcs):
+    # Only the NPC whose top goes below the player's bottom is passed
+    near = spawn_at_top(npcs, PLAYER_BOTTOM - 5, speed=0, lane_id=1)
+    spawn_at_top(npcs, 100, speed=0, lane_id=2)
+    assert npcs.mark_passed(PLAYER_BOTTOM).tolist() == []
+
+    npcs.update(10, SCREEN_HEIGHT, 1)
+
+    assert npcs.mark_passed(PLAYER_BOTTOM).tolist() == [near]
+    assert npcs.mark_passed(PLAYER_BOTTOM).tolist() == []
+
+
+def test_mark_passed_only_looks_near_the_player(npcs, mocker):
+    # Once the player's bottom is known, only the NPCs that can have
+    # crossed it are looked at
+    npcs.mark_passed(PLAYER_BOTTOM)
+    spawn_at_top(npcs, PLAYER_BOTTOM - 5, speed=0)
+    npcs.update(10, SCREEN_HEIGHT, 1)
+    tops = mocker.spy(npcs, "tops")
+
+    assert len(npcs.mark_passed(PLAYER_BOTTOM)) == 1
+    assert tops.call_count == 0
+
+
+def test_mark_passed_finds_npc_spawned_past_the_player(npcs):
+    # An NPC spawned below the player is passed on the next check
+    npcs.mark_passed(PLAYER_BOTTOM)
+    npc = spawn_at_top(npcs, PLAYER_BOTTOM + 200, speed=0)
+
+    assert npcs.mark_passed(PLAYER_BOTTOM).tolist() == [npc]
+
+
+def test_mark_passed_matches_checking_every_npc():
+    # Random traffic, with NPCs overtaking each other in their lane and
+    # the road slowing below their speed, scores the same NPCs at the
+    # same steps as checking every NPC
+    rng = random.Random(3)
+    npcs = NPCManager(4, CAR_WIDTH, CAR_HEIGHT, LANE_COUNT)
+    passed_ids = set()
+    for _ in range(2000):
+        if rng.random() < 0.2:
+            spawn_at_top(
+                npcs,
+                rng.uniform(-CAR_HEIGHT, SCREEN_HEIGHT),
+                rng.uniform(420, 600),
+                rng.randrange(LANE_COUNT),
+            )
+        npcs.update(rng.uniform(0, 1200), SCREEN_HEIGHT, 1 / 60)
+
+        n = len(npcs)
+        ids = npcs.ids[:n]
+        expected = [
+            npc_id
+            for npc_id, top in zip(ids.tolist(), npcs.tops().tolist())
+            if rules.passed(top, PLAYER_BOTTOM) and npc_id not in passed_ids
+        ]
+        newly_passed = npcs.mark_passed(PLAYER_BOTTOM).tolist()
+
+        assert sorted(newly_passed) == sorted(expected)
+        passed_ids.update(newly_passed)
+        assert np.array_equal(
+            npcs.passed[:n], np.isin(ids, list(passed_ids))
+        )
@@ -0,0 +1,182 @@
+import pytest
+import numpy as np
+import pygame
+
+import rules
+
+from npc_manager import NPCManager
+
+# Constants for the tests
+SCREEN_HEIGHT = 800
+CAR_WIDTH = 75
+CAR_HEIGHT = 150
+LANE_COUNT = 4
+
+
+@pytest.fixture
+def npcs():
+    # Fixture to create a small NPC manager for each test
+    return NPCManager(4, CAR_WIDTH, CAR_HEIGHT, LANE_COUNT)
+
+
+def spawn_at_top(npcs, top, speed, lane_id=0):
+    # Helper to spawn an NPC with its rect top at a specific value
+    return npcs.spawn(100, top + CAR_HEIGHT // 2, speed, lane_id)
+
+
+def test_update_moves_by_road_speed_minus_car_speed(npcs):
+    # Every NPC moves by road speed - its own speed
+    spawn_at_top(npcs, 100, speed=10)
+    spawn_at_top(npcs, 200, speed=4)
+
+    npcs.update(6, SCREEN_HEIGHT, 1)
+
+    assert npcs.tops().tolist() == [96, 202]
+
+
+def test_update_scales_by_time_step(npcs):
+    # Speeds are per second, so half a second moves half as far
+    spawn_at_top(npcs, 100, speed=0)
+
+    npcs.update(60, SCREEN_HEIGHT, 0.5)
+
+    assert npcs.tops().tolist() == [130]
+
+
+def test_drawn_tops_interpolates(npcs):
+    # Drawn positions blend from the previous position to the current one
+    spawn_at_top(npcs, 100, speed=0)
+    npcs.update(40, SCREEN_HEIGHT, 1)
+
+    assert npcs.drawn_tops(0.0).tolist() == [100]
+    assert npcs.drawn_tops(0.25).tolist() == [110]
+    assert npcs.drawn_tops(1.0).tolist() == [140]
+
+
+def test_update_accumulates_fractional_movement(npcs):
+    # Fractional road speeds are kept between frames
+    spawn_at_top(npcs, 100, speed=0)
+
+    for _ in range(4):
+        npcs.update(0.25, SCREEN_HEIGHT, 1)
+
+    assert npcs.tops().tolist() == [101]
+
+
+def test_update_stays_on_screen(npcs):
+    # An NPC exactly at the bottom edge is still alive
+    npc_id = spawn_at_top(npcs, SCREEN_HEIGHT - 5, speed=0)
+
+    despawned = npcs.update(5, SCREEN_HEIGHT, 1)
+
+    assert len(npcs) == 1
+    assert despawned.tolist() == []
+    assert npcs.ids[0] == npc_id
+
+
+def test_update_kills_off_screen(npcs):
+    # An NPC past the bottom edge is despawned and its id returned
+    npc_id = spawn_at_top(npcs, SCREEN_HEIGHT, speed=0)
+
+    despawned = npcs.update(1, SCREEN_HEIGHT, 1)
+
+    assert len(npcs) == 0
+    assert despawned.tolist() == [npc_id]
+
+
+def test_update_compacts_remaining_npcs(npcs):
+    # Despawned slots are removed and the rest keep their data and order
+    first = spawn_at_top(npcs, SCREEN_HEIGHT, speed=0, lane_id=0)
+    second = spawn_at_top(npcs, 100, speed=2, lane_id=1)
+    third = spawn_at_top(npcs, SCREEN_HEIGHT + 50, speed=0, lane_id=2)
+    fourth = spawn_at_top(npcs, 300, speed=3, lane_id=3)
+
+    despawned = npcs.update(1, SCREEN_HEIGHT, 1)
+
+    assert sorted(despawned.tolist()) == [first, third]
+    assert npcs.ids[: len(npcs)].tolist() == [second, fourth]
+    assert npcs.lane[: len(npcs)].tolist() == [1, 3]
+    assert npcs.speed[: len(npcs)].tolist() == [2, 3]
+    assert npcs.tops().tolist() == [99, 298]
+    assert npcs.alive.tolist() == [True, True, False, False]
+
+
+def test_spawn_grows_past_capacity(npcs):
+    # Spawning more NPCs than the starting capacity grows the arrays
+    for n in range(10):
+        spawn_at_top(npcs, n * 10, speed=n)
+
+    assert len(npcs) == 10
+    assert npcs.speed[:10].tolist() == list(range(10))
+    assert np.all(npcs.alive[:10])
+
+
+def test_free_lanes(npcs):
+    # Only NPCs in the lane and in the top half of the screen block it
+    spawn_at_top(npcs, 100, speed=0, lane_id=1)
+    spawn_at_top(npcs, 500, speed=0, lane_id=2)
+
+    assert npcs.free_lanes(SCREEN_HEIGHT).tolist() == [0, 2, 3]
+
+
+def test_lane_index_follows_moves_and_despawns(npcs):
+    # The index tracks the highest NPC in each lane
+    spawn_at_top(npcs, 300, speed=0, lane_id=1)
+    spawn_at_top(npcs, 380, speed=0, lane_id=1)
+    spawn_at_top(npcs, 700, speed=0, lane_id=3)
+    assert npcs.lane_top.tolist()[1] == 300
+    assert 1 not in npcs.free_lanes(SCREEN_HEIGHT)
+
+    # Moving down 100 pixels clears the top half of lane 1
+    npcs.update(100, SCREEN_HEIGHT, 1)
+    assert npcs.lane_top.tolist()[1] == 400
+    assert 1 in npcs.free_lanes(SCREEN_HEIGHT)
+
+    # Lane 3's NPC leaves the screen and its lane empties
+    npcs.update(100, SCREEN_HEIGHT, 1)
+    assert len(npcs) == 2
+    assert npcs.lane_top[3] > SCREEN_HEIGHT
+
+    npcs.clear()
+    assert npcs.free_lanes(SCREEN_HEIGHT).tolist() == [0, 1, 2, 3]
+
+
+def test_candidates_matches_full_scan():
+    # The lane index finds exactly the NPCs a full scan does
+    rng = np.random.default_rng(0)
+    npcs = NPCManager(8, CAR_WIDTH, CAR_HEIGHT, LANE_COUNT)
+    for _ in range(300):
+        lane_id = int(rng.integers(LANE_COUNT))
+        npcs.spawn(100 + lane_id * 80, float(rng.uniform(-2000, 900)), 0, lane_id)
+    npcs.update(3.5, SCREEN_HEIGHT, 1)
+
+    rect = pygame.Rect(150, 500, 80, 160)
+    expected = np.flatnonzero(
+        rules.overlaps(
+            npcs.lefts(),
+            npcs.tops(),
+            CAR_WIDTH,
+            CAR_HEIGHT,
+            rect.left,
+            rect.top,
+            rect.width,
+            rect.height,
+        )
+    )
+    found = npcs.candidates(rect, range(LANE_COUNT))
+
+    assert len(expected) > 0
+    assert sorted(found.tolist()) == expected.tolist()
+    # Lanes that aren't asked about are skipped
+    assert len(npcs.candidates(rect, [])) == 0
+
+
+def test_candidates_sees_new_spawns(npcs):
+    rect = pygame.Rect(100, 300, CAR_WIDTH, CAR_HEIGHT)
+    npcs.update(0, SCREEN_HEIGHT, 1)
+
+    slot = len(npcs)
+    spawn_at_top(npcs, 350, speed=0, lane_id=2)
+
+    assert npcs.candidates(rect, [2]).tolist() == [slot]
+    assert npcs.candidates(rect, [1]).tolist() == []
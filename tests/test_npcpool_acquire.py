@@ -0,0 +1,60 @@
+import pytest
+import pygame
+
+from npc_pool import NPCPool
+import settings
+
+
+@pytest.fixture(autouse=True)
+def source_assets(monkeypatch, tmp_path):
+    # Load sprites from source images, not from a local bake
+    monkeypatch.setattr(settings, 'ASSET_CACHE_DIR', str(tmp_path))
+
+
+def test_acquire_reuses_pooled_sprites():
+    group = pygame.sprite.Group()
+    pool = NPCPool(group, size=2)
+    pooled = list(pool.free)
+
+    sprite = pool.acquire(3, 40, 50)
+
+    assert sprite in pooled
+    assert sprite in group
+    assert sprite.lane_id == 3
+    assert sprite.rect.topleft == (40, 50)
+    assert sprite.dirty == 1
+    assert (pool.hits, pool.misses) == (1, 0)
+    assert len(pool) == 1
+
+
+def test_release_returns_sprite_to_pool():
+    group = pygame.sprite.Group()
+    pool = NPCPool(group, size=1)
+    sprite = pool.acquire(0, 0, 0)
+
+    pool.release(sprite)
+
+    assert not sprite.alive()
+    assert len(pool) == 1
+    # The released sprite is handed out again
+    assert pool.acquire(1, 10, 20) is sprite
+    assert sprite.lane_id == 1
+
+
+def test_acquire_from_empty_pool_makes_sprite():
+    pool = NPCPool(pygame.sprite.Group(), size=1)
+    first = pool.acquire(0, 0, 0)
+    second = pool.acquire(1, 0, 0)
+
+    assert first is not second
+    assert (pool.hits, pool.misses) == (1, 1)
+
+    # Both sprites are kept once released
+    pool.release(first)
+    pool.release(second)
+    assert len(pool) == 2
+
+
+def test_default_size_is_max_npcs(monkeypatch):
+    monkeypatch.setattr(settings, 'MAX_NPCS', 4)
+    assert len(NPCPool()) == 4
@@ -0,0 +1,129 @@
+import os
+import pytest
+import pygame
+
+from perf_overlay import PerfOverlay, GRAPH_FRAMES
+from game import Game
+import settings
+
+# Run the real game headlessly
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+@pytest.fixture
+def screen():
+    pygame.font.init()
+    yield pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+    pygame.font.quit()
+
+
+def test_draw_caches_glyphs(screen, mocker):
+    overlay = PerfOverlay()
+    overlay.draw(screen, ["FPS 60"])
+    overlay.font = mocker.Mock(wraps=overlay.font)
+
+    overlay.draw(screen, ["FPS 06", "SPF"])
+
+    # Every character was already rendered on the first frame
+    overlay.font.render.assert_not_called()
+    assert set(overlay.glyphs) == set("FPS 60")
+
+
+def test_draw_reuses_text_until_lines_change(screen):
+    overlay = PerfOverlay()
+    overlay.draw(screen, ["FPS 60", "draw p50 1.00"])
+    text = overlay.text
+
+    overlay.draw(screen, ["FPS 60", "draw p50 1.00"])
+    assert overlay.text is text
+
+    overlay.draw(screen, ["FPS 59", "draw p50 1.00"])
+    assert overlay.text is not text
+
+
+def test_draw_covers_graph_and_text(screen):
+    overlay = PerfOverlay()
+    rect = overlay.draw(screen, ["one", "two"])
+
+    assert rect.topleft == (0, 0)
+    assert rect.width >= GRAPH_FRAMES * 2
+    assert rect.height > 2 * overlay.font.get_linesize()
+
+
+def test_record_frame_wraps():
+    overlay = PerfOverlay()
+    for frame in range(GRAPH_FRAMES + 5):
+        overlay.record_frame(frame)
+
+    assert overlay.frame_times.max() == GRAPH_FRAMES + 4
+    assert overlay.frame_times[4] == GRAPH_FRAMES + 4
+
+
+@pytest.fixture
+def game(mocker):
+    mocker.patch.object(Game, '_load_high_score')
+    # Fonts aren't needed for the game's own text
+    mocker.patch('game.UIManager')
+    game = Game()
+    yield game
+    pygame.quit()
+
+
+def test_f3_toggles_overlay(game):
+    f3 = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F3)
+
+    game._handle_events([f3])
+    assert game.perf_overlay.visible
+    # The key press doesn't dismiss the instructions
+    assert game.show_instructions
+
+    game._handle_events([f3])
+    assert not game.perf_overlay.visible
+
+
+def test_overlay_drawn_with_game_state(game, mocker):
+    game.show_instructions = False
+    game.perf_overlay.toggle()
+    draw = mocker.spy(game.perf_overlay, 'draw')
+
+    game._draw_elements()
+
+    lines = draw.call_args.args[1]
+    assert any(line.startswith("pool free") for line in lines)
+    assert any(line.startswith("sprites") for line in lines)
+
+
+def test_caption_updated_at_most_once_a_second(game, mocker):
+    game.show_instructions = False
+    set_caption = mocker.patch('pygame.display.set_caption')
+    mocker.patch('pygame.quit')
+    mocker.patch('pygame.time.get_ticks', side_effect=[1000, 1200, 1900, 2000, 2500])
+    handle_events = game._handle_events
+    frames = []
+
+    def play(events):
+        handle_events(events)
+        frames.append(events)
+        if len(frames) == 5:
+            game.running = False
+
+    game._handle_events = play
+    game.run()
+
+    # Five frames over 1.5 seconds update the caption twice
+    assert set_caption.call_count == 2
+
+
+def test_perf_lines_worked_out_at_caption_rate(game, mocker):
+    stats = mocker.spy(game.profiler, 'stats')
+    get_ticks = mocker.patch('pygame.time.get_ticks')
+
+    for now in (0, 100, settings.CAPTION_UPDATE_MS - 1):
+        get_ticks.return_value = now
+        lines = game._perf_lines()
+    assert stats.call_count == 1
+
+    get_ticks.return_value = settings.CAPTION_UPDATE_MS
+    assert game._perf_lines() is not lines
+    assert stats.call_count == 2
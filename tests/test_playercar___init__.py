@@ -18,7 +18,7 @@ VALID_PLAYER_IMG_PATH = settings.PLAYER_IMAGE_PATH
 INVALID_PLAYER_IMG_PATH = "assets/non_existent_player_image.png"
 TEST_X_POS = settings.PLAYER_START_X_POS
 TEST_Y_POS = settings.PLAYER_Y_POS
-TEST_H_SPEED_CONSTANT = settings.HORIZONTAL_SPEED_CONSTANT
+TEST_H_ACCELERATION_CONSTANT = settings.HORIZONTAL_ACCELERATION_CONSTANT
 
 
 @patch('car.pygame.mask.from_surface')
@@ -39,7 +39,7 @@ def test_player_car_init_valid_image(mock_car_pygame_surface_cls, mock_image_loa
     mock_mask_from_surface.return_value = mock_mask_created
 
     # Act
-    player_car = PlayerCar(VALID_PLAYER_IMG_PATH, TEST_X_POS, TEST_Y_POS, TEST_H_SPEED_CONSTANT)
+    player_car = PlayerCar(VALID_PLAYER_IMG_PATH, TEST_X_POS, TEST_Y_POS, TEST_H_ACCELERATION_CONSTANT)
 
     # Assert
     mock_image_load.assert_called_once_with(VALID_PLAYER_IMG_PATH)
@@ -56,7 +56,7 @@ def test_player_car_init_valid_image(mock_car_pygame_surface_cls, mock_image_loa
 
     assert player_car.initial_x_pos == TEST_X_POS
     assert player_car.initial_y_pos == TEST_Y_POS
-    assert player_car.horizontal_speed_constant == TEST_H_SPEED_CONSTANT
+    assert player_car.horizontal_acceleration_constant == TEST_H_ACCELERATION_CONSTANT
 
 
 @patch('car.pygame.mask.from_surface')
@@ -89,7 +89,7 @@ def test_player_car_init_invalid_image(mock_car_pygame_surface_cls, mock_image_l
     mock_mask_from_surface.return_value = mock_mask_created
 
     # Act
-    player_car = PlayerCar(INVALID_PLAYER_IMG_PATH, TEST_X_POS, TEST_Y_POS, TEST_H_SPEED_CONSTANT)
+    player_car = PlayerCar(INVALID_PLAYER_IMG_PATH, TEST_X_POS, TEST_Y_POS, TEST_H_ACCELERATION_CONSTANT)
 
     # Assert
     mock_image_load.assert_called_once_with(INVALID_PLAYER_IMG_PATH)
@@ -114,4 +114,4 @@ def test_player_car_init_invalid_image(mock_car_pygame_surface_cls, mock_image_l
     # Check PlayerCar specific attributes
     assert player_car.initial_x_pos == TEST_X_POS
     assert player_car.initial_y_pos == TEST_Y_POS
-    assert player_car.horizontal_speed_constant == TEST_H_SPEED_CONSTANT
\ No newline at end of file
+    assert player_car.horizontal_acceleration_constant == TEST_H_ACCELERATION_CONSTANT
\ No newline at end of file
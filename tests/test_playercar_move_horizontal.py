@@ -21,40 +21,53 @@ def player_car_instance():
     start_x = settings.SCREEN_WIDTH // 2
     start_y = settings.PLAYER_Y_POS
 
-    # Initialize the car with the horizontal speed constant from settings
-    # This value is stored in the PlayerCar instance as self.horizontal_speed_constant
-    speed_const = settings.HORIZONTAL_SPEED_CONSTANT
+    # Initialize the car with the horizontal acceleration from settings
+    # This value is stored as self.horizontal_acceleration_constant
+    acceleration = settings.HORIZONTAL_ACCELERATION_CONSTANT
 
-    car = PlayerCar(img_path, start_x, start_y, speed_const)
+    car = PlayerCar(img_path, start_x, start_y, acceleration)
     return car
 
 
+# One simulation step, in seconds
+DT = 1 / settings.SIMULATION_HZ
+
+
 def test_move_horizontal_left(player_car_instance):
     # Record the car's initial x position
-    initial_x = player_car_instance.rect.x
-    # Calculate the expected change in x position for a leftward move
-    # The change is negative and scaled by the car's horizontal_speed_constant
-    expected_change = -1 * player_car_instance.horizontal_speed_constant
+    initial_x = player_car_instance.x_float
+    # From rest, one step of steering reaches acceleration * dt pixels
+    # per second (to the left), and moves that far for dt seconds
+    expected_speed = -settings.HORIZONTAL_ACCELERATION_CONSTANT * DT
 
-    # Call the method to move the car left (direction = -1)
-    player_car_instance.move_horizontal(-1)
+    # Call the method to move the car left (direction = -1) for one step
+    player_car_instance.move_horizontal(-1, DT)
 
-    # Assert that the car's x position has changed by the expected amount
-    assert player_car_instance.rect.x == initial_x + expected_change
+    # Assert that the car's speed and position changed by the expected amounts
+    assert player_car_instance.horizontal_speed == pytest.approx(expected_speed)
+    assert player_car_instance.x_float == pytest.approx(initial_x + expected_speed * DT)
+    assert player_car_instance.rect.centerx == round(player_car_instance.x_float)
 
 
 def test_move_horizontal_right(player_car_instance):
     # Record the car's initial x position
-    initial_x = player_car_instance.rect.x
-    # Calculate the expected change in x position for a rightward move
-    # The change is positive and scaled by the car's horizontal_speed_constant
-    expected_change = 1 * player_car_instance.horizontal_speed_constant
+    initial_x = player_car_instance.x_float
+    expected_speed = settings.HORIZONTAL_ACCELERATION_CONSTANT * DT
+
+    # Call the method to move the car right (direction = 1) for one step
+    player_car_instance.move_horizontal(1, DT)
+
+    # Assert that the car's speed and position changed by the expected amounts
+    assert player_car_instance.horizontal_speed == pytest.approx(expected_speed)
+    assert player_car_instance.x_float == pytest.approx(initial_x + expected_speed * DT)
+
 
-    # Call the method to move the car right (direction = 1)
-    player_car_instance.move_horizontal(1)
+def test_move_horizontal_speed_is_capped(player_car_instance):
+    # Steering for a whole second can't go faster than the maximum speed
+    for _ in range(settings.SIMULATION_HZ):
+        player_car_instance.move_horizontal(1, DT)
 
-    # Assert that the car's x position has changed by the expected amount
-    assert player_car_instance.rect.x == initial_x + expected_change
+    assert player_car_instance.horizontal_speed == settings.MAX_HORIZONTAL_SPEED
 
 
 def test_move_horizontal_no_movement(player_car_instance):
@@ -62,7 +75,8 @@ def test_move_horizontal_no_movement(player_car_instance):
     initial_x = player_car_instance.rect.x
 
     # Call the method with zero direction, indicating no movement
-    player_car_instance.move_horizontal(0)
+    player_car_instance.move_horizontal(0, DT)
 
     # Assert that the car's x position has not changed
-    assert player_car_instance.rect.x == initial_x
\ No newline at end of file
+    assert player_car_instance.rect.x == initial_x
+    assert player_car_instance.horizontal_speed == 0
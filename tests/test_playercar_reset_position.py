@@ -14,7 +14,7 @@ def player_car_instance():
     car_image_path = "non_existent_player_car.png"
     initial_x = settings.PLAYER_START_X_POS
     initial_y = settings.PLAYER_Y_POS
-    speed_constant = settings.HORIZONTAL_SPEED_CONSTANT
+    speed_constant = settings.HORIZONTAL_ACCELERATION_CONSTANT
     car = PlayerCar(car_image_path, initial_x, initial_y, speed_constant)
     return car
 
@@ -0,0 +1,128 @@
+import os
+import pytest
+import numpy as np
+import pygame
+
+from env import RacingEnv
+import settings
+
+# Render off-screen headlessly
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ACCELERATE = (1, 0, 0, 0)
+COAST = (0, 0, 0, 0)
+
+
+@pytest.fixture(autouse=True)
+def source_assets(monkeypatch, tmp_path):
+    # Load sprites from source images, not from a local bake
+    monkeypatch.setattr(settings, 'ASSET_CACHE_DIR', str(tmp_path))
+
+
+@pytest.fixture
+def env():
+    env = RacingEnv()
+    env.reset(seed=1)
+    yield env
+    env.close()
+
+
+def test_reset_returns_observation(env):
+    observation, info = env.reset(seed=1)
+
+    assert observation.shape == (env.observation_size,)
+    assert observation.dtype == np.float32
+    # No traffic yet: every lane is empty with the full screen ahead
+    lane_count = len(settings.LANE_POSITIONS)
+    assert not observation[:lane_count].any()
+    assert (observation[lane_count:lane_count * 2] == 1.0).all()
+    assert info == {"score": 0, "steps": 0, "seed": 1}
+
+
+def test_step_accelerate(env):
+    observation, reward, terminated, truncated, info = env.step(ACCELERATE)
+
+    assert env.world.current_road_speed > 0
+    assert observation[-1] == pytest.approx(env.world.current_road_speed / settings.MAX_SPEED)
+    assert reward == 0
+    assert not terminated and not truncated
+    assert info["steps"] == 1
+
+
+def test_step_observes_npc_ahead(env):
+    player_rect = env.world.player_car.rect
+    npcs = env.world.npcs
+    # An NPC in lane 2 whose bottom is 200 pixels above the player
+    centre_to_bottom = npcs.car_height - npcs.car_height // 2
+    npcs.spawn(settings.LANE_POSITIONS[2], player_rect.top - 200 - centre_to_bottom, 0, 2)
+
+    observation, _, _, _, _ = env.step(COAST)
+
+    lane_count = len(settings.LANE_POSITIONS)
+    assert observation[2] == 1.0
+    assert observation[lane_count + 2] == pytest.approx(200 / settings.SCREEN_HEIGHT)
+    assert observation[lane_count + 1] == 1.0
+
+
+def test_step_reward_for_passing(env):
+    npcs = env.world.npcs
+    # A stationary NPC just above the player's bottom edge
+    env.world.npcs.spawn(settings.LANE_POSITIONS[0], env.world.player_car.rect.bottom + npcs.car_height // 2, 0, 0)
+    env.world.current_road_speed = settings.SIMULATION_HZ
+
+    _, reward, _, _, info = env.step(COAST)
+
+    assert reward == 10
+    assert info["score"] == 10
+
+
+def test_step_terminates_on_crash(env):
+    player_rect = env.world.player_car.rect
+    # An NPC on top of the player, in the lane the player is in
+    lane_id = int(np.argmin(np.abs(np.array(settings.LANE_POSITIONS) - player_rect.centerx)))
+    env.world.npcs.spawn(settings.LANE_POSITIONS[lane_id], player_rect.centery, 0, lane_id)
+
+    _, _, terminated, _, _ = env.step(COAST)
+
+    assert terminated
+
+
+def test_step_truncates_at_max_steps():
+    env = RacingEnv(max_steps=3)
+    env.reset()
+
+    results = [env.step(COAST)[3] for _ in range(3)]
+
+    assert results == [False, False, True]
+
+
+def test_training_never_touches_display(env, mocker):
+    set_mode = mocker.patch('pygame.display.set_mode')
+
+    for _ in range(200):
+        env.step(ACCELERATE)
+    assert env.render() is None
+
+    set_mode.assert_not_called()
+    assert env.game is None
+
+
+def test_render_rgb_array():
+    env = RacingEnv(render_mode="rgb_array")
+    env.reset(seed=1)
+    for _ in range(120):
+        env.step(ACCELERATE)
+
+    frame = env.render()
+
+    assert frame.shape == (settings.SCREEN_HEIGHT, settings.SCREEN_WIDTH, 3)
+    assert frame.dtype == np.uint8
+    # Drawn off-screen, without opening a window
+    assert pygame.display.get_surface() is None
+    env.close()
+
+
+def test_unknown_render_mode():
+    with pytest.raises(ValueError):
+        RacingEnv(render_mode="video")
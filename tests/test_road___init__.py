@@ -1,56 +1,37 @@
 # test_road_init.py
+import os
 import pygame
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 from road import Road  # assuming road.py is in the python path
+import assets
 import settings  # assuming settings.py is in the python path
 
+# Use the dummy video driver so surfaces can be converted headlessly
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
 # constants for testing
 DUMMY_IMAGE_PATH = "assets/test_road.png"  # example path
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 
 
+@pytest.fixture(autouse=True)
+def pygame_display():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.quit()
+
+
 # Test: Initialize Road with a valid image path
-@patch('road.pygame.transform.scale')  # patch scale first due to order in decorator stack
-@patch('road.pygame.image.load')
-def test_road_init_valid_image(mock_image_load, mock_transform_scale):
+@patch('road.assets.load_scaled_image')
+def test_road_init_valid_image(mock_load_scaled_image):
     # arrange
-    # mock the original image loaded by pygame.image.load
-    original_img_mock = MagicMock(spec=pygame.Surface)
-    original_img_mock.convert.return_value = original_img_mock
-    original_width, original_height = 600, 1200  # w, h for an example image
-    original_img_mock.get_size.return_value = (original_width, original_height)
-    mock_image_load.return_value = original_img_mock
-
-    # mock the scaled image returned by pygame.transform.scale
-    scaled_img_mock = MagicMock(spec=pygame.Surface)
-    # calculate expected scaled height based on the game's logic
-    aspect_ratio = original_width / original_height
-    expected_scaled_height = SCREEN_WIDTH * aspect_ratio
-
-    scaled_img_mock.get_height.return_value = expected_scaled_height
-
-    # mock rects for the scaled image
-    mock_rect1 = MagicMock(spec=pygame.Rect)
-    mock_rect1.topleft = (0, 0)  # set topleft for assertion clarity
-    mock_rect2 = MagicMock(spec=pygame.Rect)
-    mock_rect2.topleft = (0, -expected_scaled_height)  # set topleft for assertion clarity
-
-    # configure scaled_img_mock.get_rect to return specific rects
-    def get_rect_side_effect(**kwargs):
-        if kwargs.get('topleft') == (0, 0):
-            return mock_rect1
-        if kwargs.get('topleft') == (0, -expected_scaled_height):
-            return mock_rect2
-        # fallback, though not expected to be hit in this test for rect1/rect2
-        fallback_rect = MagicMock(spec=pygame.Rect)
-        fallback_rect.topleft = kwargs.get('topleft', (0, 0))  # default topleft
-        return fallback_rect
-
-    scaled_img_mock.get_rect.side_effect = get_rect_side_effect
-    mock_transform_scale.return_value = scaled_img_mock
+    # the scaled tile returned by the asset loader
+    tile = pygame.Surface((SCREEN_WIDTH, 400))
+    mock_load_scaled_image.return_value = tile
 
     # act
     road = Road(DUMMY_IMAGE_PATH, SCREEN_WIDTH, SCREEN_HEIGHT)
@@ -60,44 +41,28 @@ def test_road_init_valid_image(mock_image_load, mock_transform_scale):
     assert road.screen_width == SCREEN_WIDTH
     assert road.screen_height == SCREEN_HEIGHT
 
-    # check pygame.image.load call
-    mock_image_load.assert_called_once_with(DUMMY_IMAGE_PATH)
-    original_img_mock.convert.assert_called_once()  # ensure convert was called
-    original_img_mock.get_size.assert_called_once()  # ensure get_size was called
-
-    # check pygame.transform.scale call
-    # the target size for scaling is (SCREEN_WIDTH, SCREEN_WIDTH * aspect_ratio)
-    mock_transform_scale.assert_called_once_with(
-        original_img_mock,  # the surface returned by load().convert()
-        (SCREEN_WIDTH, SCREEN_WIDTH * aspect_ratio)
+    # check the image is loaded opaque and fitted to the screen width
+    mock_load_scaled_image.assert_called_once_with(
+        DUMMY_IMAGE_PATH, SCREEN_WIDTH, assets.road_image_size, alpha=False
     )
+    assert road.image is tile
+    assert road.image_height == 400
 
-    # check attributes of the road instance
-    assert road.image == scaled_img_mock  # image is the scaled image
-    assert road.image_height == expected_scaled_height  # image_height from scaled image
-
-    assert road.rect1 == mock_rect1  # check it's the correct mock object
-    assert road.rect1.topleft == (0, 0)  # verify topleft attribute
-    assert road.rect2 == mock_rect2  # check it's the correct mock object
-    assert road.rect2.topleft == (0, -expected_scaled_height)  # verify topleft attribute
-
-    # ensure placeholder was not created
-    assert not hasattr(road, 'image_original')
+    # the strip covers the screen plus one tile (600 / 400 -> 2 tiles + 1)
+    assert road.strip.get_size() == (SCREEN_WIDTH, 400 * 3)
+    # the visible area starts one tile down with no scroll offset
+    assert road.offset_float == 0.0
+    assert road.area == pygame.Rect(0, 400, SCREEN_WIDTH, SCREEN_HEIGHT)
 
 
 # Test: Initialize Road with an invalid image path (FileNotFoundError)
-@patch('road.pygame.Surface')  # This mock is injected as mock_pygame_surface_constructor
 @patch('road.pygame.image.load')
-def test_road_init_invalid_path_file_not_found(mock_image_load, mock_pygame_surface_constructor, capsys):
+def test_road_init_invalid_path_file_not_found(mock_image_load, capsys):
     # arrange
     # configure pygame.image.load to raise FileNotFoundError
     invalid_path = "invalid/path/to/image.png"
     mock_image_load.side_effect = FileNotFoundError("File not found for test")
 
-    # This is the mock instance that pygame.Surface() will return inside Road.__init__
-    mock_created_surface_instance = MagicMock(name="placeholder_surface_instance")
-    mock_pygame_surface_constructor.return_value = mock_created_surface_instance
-
     # act
     road = Road(invalid_path, SCREEN_WIDTH, SCREEN_HEIGHT)
 
@@ -113,31 +78,23 @@ def test_road_init_invalid_path_file_not_found(mock_image_load, mock_pygame_surf
     )
     assert expected_warning in captured.out
 
-    # check placeholder surface constructor was called
-    mock_pygame_surface_constructor.assert_called_once_with((SCREEN_WIDTH, SCREEN_HEIGHT))
-    # check fill was called on the mock instance that was returned by the constructor
-    mock_created_surface_instance.fill.assert_called_once_with(settings.BLACK)
-    assert road.image_original == mock_created_surface_instance
+    # check a black, screen-sized placeholder tile was created
+    assert road.image.get_size() == (SCREEN_WIDTH, SCREEN_HEIGHT)
+    assert road.image.get_at((0, 0))[:3] == settings.BLACK
+    assert road.image_height == SCREEN_HEIGHT
 
-    # ensure main image attributes are not set if load fails
-    assert not hasattr(road, 'image')
-    assert not hasattr(road, 'image_height')
-    assert not hasattr(road, 'rect1')
-    assert not hasattr(road, 'rect2')
+    # the placeholder gets the same scrolling strip as a real image
+    assert road.strip.get_size() == (SCREEN_WIDTH, SCREEN_HEIGHT * 2)
+    assert road.area == pygame.Rect(0, SCREEN_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT)
 
 
 # Test: Initialize Road when pygame.image.load raises pygame.error
-@patch('road.pygame.Surface')  # This mock is injected as mock_pygame_surface_constructor
 @patch('road.pygame.image.load')
-def test_road_init_pygame_error_on_load(mock_image_load, mock_pygame_surface_constructor, capsys):
+def test_road_init_pygame_error_on_load(mock_image_load, capsys):
     # arrange
     # configure pygame.image.load to raise pygame.error
     mock_image_load.side_effect = pygame.error("Pygame test error")
 
-    # This is the mock instance that pygame.Surface() will return inside Road.__init__
-    mock_created_surface_instance = MagicMock(name="placeholder_surface_instance_pyerror")
-    mock_pygame_surface_constructor.return_value = mock_created_surface_instance
-
     # act
     road = Road(DUMMY_IMAGE_PATH, SCREEN_WIDTH, SCREEN_HEIGHT)
 
@@ -153,17 +110,9 @@ def test_road_init_pygame_error_on_load(mock_image_load, mock_pygame_surface_con
     )
     assert expected_warning in captured.out
 
-    # check placeholder surface constructor was called
-    mock_pygame_surface_constructor.assert_called_once_with((SCREEN_WIDTH, SCREEN_HEIGHT))
-    # check fill was called on the mock instance that was returned by the constructor
-    mock_created_surface_instance.fill.assert_called_once_with(settings.BLACK)
-    assert road.image_original == mock_created_surface_instance
-
-    # ensure main image attributes are not set if load fails
-    assert not hasattr(road, 'image')
-    assert not hasattr(road, 'image_height')
-    assert not hasattr(road, 'rect1')
-    assert not hasattr(road, 'rect2')
+    # check the placeholder tile and strip were created
+    assert road.image.get_size() == (SCREEN_WIDTH, SCREEN_HEIGHT)
+    assert road.strip.get_height() == SCREEN_HEIGHT * 2
 
 
 # Test: Edge Case - Initialize Road with an image having an extreme aspect ratio (very wide)
@@ -171,54 +120,29 @@ def test_road_init_pygame_error_on_load(mock_image_load, mock_pygame_surface_con
 @patch('road.pygame.image.load')
 def test_road_init_extreme_aspect_ratio_wide_image(mock_image_load, mock_transform_scale):
     # arrange
-    # mock original image (very wide)
-    original_img_mock = MagicMock(spec=pygame.Surface)
-    original_img_mock.convert.return_value = original_img_mock
+    # original image (very wide)
     original_width, original_height = 2000, 100  # w, h for a very wide image
-    original_img_mock.get_size.return_value = (original_width, original_height)
-    mock_image_load.return_value = original_img_mock
+    original_img = pygame.Surface((original_width, original_height))
+    mock_image_load.return_value = original_img
 
-    # mock scaled image
-    scaled_img_mock = MagicMock(spec=pygame.Surface)
     # calculate expected scaled height
     aspect_ratio = original_width / original_height  # 2000 / 100 = 20
     expected_scaled_height = SCREEN_WIDTH * aspect_ratio  # 800 * 20 = 16000 (very tall)
 
-    scaled_img_mock.get_height.return_value = expected_scaled_height
-
-    # mock rects
-    mock_rect1 = MagicMock(spec=pygame.Rect)
-    mock_rect1.topleft = (0, 0)  # set topleft for assertion clarity
-    mock_rect2 = MagicMock(spec=pygame.Rect)
-    mock_rect2.topleft = (0, -expected_scaled_height)  # set topleft for assertion clarity
-
-    def get_rect_side_effect(**kwargs):
-        if kwargs.get('topleft') == (0, 0):
-            return mock_rect1
-        if kwargs.get('topleft') == (0, -expected_scaled_height):
-            return mock_rect2
-        fallback_rect = MagicMock(spec=pygame.Rect)
-        fallback_rect.topleft = kwargs.get('topleft', (0, 0))
-        return fallback_rect
-
-    scaled_img_mock.get_rect.side_effect = get_rect_side_effect
-    mock_transform_scale.return_value = scaled_img_mock
+    # scaled image
+    scaled_img = pygame.Surface((SCREEN_WIDTH, int(expected_scaled_height)))
+    mock_transform_scale.return_value = scaled_img
 
     # act
     road = Road(DUMMY_IMAGE_PATH, SCREEN_WIDTH, SCREEN_HEIGHT)
 
     # assert
     mock_image_load.assert_called_once_with(DUMMY_IMAGE_PATH)
-    original_img_mock.convert.assert_called_once()
-    original_img_mock.get_size.assert_called_once()
 
-    mock_transform_scale.assert_called_once_with(
-        original_img_mock,
-        (SCREEN_WIDTH, SCREEN_WIDTH * aspect_ratio)  # target size for scale
-    )
+    scale_args, _ = mock_transform_scale.call_args
+    assert scale_args[1] == (SCREEN_WIDTH, SCREEN_WIDTH * aspect_ratio)  # target size for scale
 
-    assert road.image == scaled_img_mock
+    assert road.image is scaled_img
     assert road.image_height == expected_scaled_height
-    assert road.rect1.topleft == (0, 0)  # verify topleft attribute
-    assert road.rect2.topleft == (0, -expected_scaled_height)  # verify topleft attribute
-    assert not hasattr(road, 'image_original')  # no placeholder
\ No newline at end of file
+    # a single tile already covers the screen, so only one extra is stacked
+    assert road.strip.get_height() == expected_scaled_height * 2
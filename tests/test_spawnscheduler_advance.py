@@ -0,0 +1,107 @@
+import math
+import random
+import statistics
+import pytest
+
+from spawn_scheduler import SpawnScheduler
+
+
+def count_spawns(scheduler, steps, dt):
+    return sum(scheduler.advance(dt) for _ in range(steps))
+
+
+def test_advance_fixed_interval():
+    scheduler = SpawnScheduler(1, "fixed")
+
+    # One spawn at the end of each simulated second
+    assert count_spawns(scheduler, 59, 1 / 60) == 0
+    assert scheduler.advance(1 / 60) == 1
+    assert count_spawns(scheduler, 60 * 9, 1 / 60) == 9
+
+
+def test_advance_same_spawns_at_any_step_size():
+    # A race run in big steps spawns the same number of NPCs as one run
+    # in small steps, including several in one step
+    fine = SpawnScheduler(0.5, "fixed")
+    coarse = SpawnScheduler(0.5, "fixed")
+
+    assert count_spawns(fine, 600, 1 / 60) == 20
+    assert coarse.advance(10) == 20
+
+
+@pytest.mark.parametrize("mode", ["jittered", "poisson"])
+def test_advance_random_modes_average_interval(mode):
+    scheduler = SpawnScheduler(1, mode, random.Random(3))
+
+    spawns = count_spawns(scheduler, 1000, 1)
+
+    assert 900 < spawns < 1100
+
+
+def test_advance_jittered_gaps_stay_in_range():
+    scheduler = SpawnScheduler(1, "jittered", random.Random(5), jitter=0.25)
+    for _ in range(100):
+        gap = scheduler.time_until_next
+        assert 0.75 <= gap <= 1.25
+        scheduler.advance(gap)
+
+
+def spawn_gaps(scheduler, count):
+    # Advance exactly to each spawn, recording the gaps between them
+    gaps = []
+    for _ in range(count):
+        gap = scheduler.time_until_next
+        gaps.append(gap)
+        assert scheduler.advance(gap) == 1
+    return gaps
+
+
+def test_advance_jittered_gaps_are_uniform():
+    scheduler = SpawnScheduler(2, "jittered", random.Random(17), jitter=0.5)
+
+    gaps = spawn_gaps(scheduler, 5000)
+
+    # Spread evenly over 1 to 3 seconds: mean 2, standard deviation
+    # 1 / sqrt(3), and each half of the range holds half the gaps
+    assert min(gaps) >= 1 and max(gaps) <= 3
+    assert statistics.mean(gaps) == pytest.approx(2, abs=0.03)
+    assert statistics.stdev(gaps) == pytest.approx(1 / math.sqrt(3), rel=0.05)
+    assert sum(gap < 2 for gap in gaps) / len(gaps) == pytest.approx(0.5, abs=0.03)
+
+
+def test_advance_poisson_gaps_are_exponential():
+    scheduler = SpawnScheduler(2, "poisson", random.Random(23))
+
+    gaps = spawn_gaps(scheduler, 5000)
+
+    # Exponential with mean 2: the standard deviation equals the mean, and
+    # a gap is longer than the mean with probability 1 / e
+    assert min(gaps) > 0
+    assert statistics.mean(gaps) == pytest.approx(2, rel=0.05)
+    assert statistics.stdev(gaps) == pytest.approx(2, rel=0.08)
+    assert sum(gap > 2 for gap in gaps) / len(gaps) == pytest.approx(
+        math.exp(-1), abs=0.03
+    )
+
+
+def test_advance_same_seed_same_spawns():
+    first = SpawnScheduler(1, "poisson", random.Random(11))
+    second = SpawnScheduler(1, "poisson", random.Random(11))
+
+    assert [first.advance(0.1) for _ in range(500)] == [
+        second.advance(0.1) for _ in range(500)
+    ]
+
+
+def test_reset_restarts_schedule():
+    scheduler = SpawnScheduler(1, "fixed")
+    scheduler.advance(0.75)
+    scheduler.reset()
+
+    assert scheduler.advance(0.75) == 0
+    assert scheduler.advance(0.25) == 1
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        SpawnScheduler(1, "sometimes")
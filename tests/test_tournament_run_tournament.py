@@ -0,0 +1,108 @@
+import json
+import pytest
+
+import tournament
+import settings
+
+
+@pytest.fixture(autouse=True)
+def source_assets(monkeypatch, tmp_path):
+    # Load sprites from source images, not from a local bake
+    monkeypatch.setattr(settings, 'ASSET_CACHE_DIR', str(tmp_path))
+
+
+def read_results(path):
+    with open(path) as results_file:
+        return [json.loads(line) for line in results_file]
+
+
+def test_expand_grid():
+    grid = {'MAX_NPCS': [3, 5], 'NPC_SPAWN_INTERVAL': [0.5]}
+    assert tournament.expand_grid(grid) == [
+        {'MAX_NPCS': 3, 'NPC_SPAWN_INTERVAL': 0.5},
+        {'MAX_NPCS': 5, 'NPC_SPAWN_INTERVAL': 0.5},
+    ]
+    assert tournament.expand_grid({}) == [{}]
+
+
+def test_run_race_restores_settings():
+    max_npcs = settings.MAX_NPCS
+    result = tournament.run_race({'MAX_NPCS': 1}, 3, 'cruise', max_steps=30)
+
+    assert settings.MAX_NPCS == max_npcs
+    assert result['frames'] == 30
+    assert result['survival_time'] == pytest.approx(30 / settings.SIMULATION_HZ)
+    assert result['params'] == {'MAX_NPCS': 1}
+    assert not result['crashed']
+
+
+def test_run_race_unknown_setting():
+    with pytest.raises(ValueError):
+        tournament.run_race({'NOT_A_SETTING': 1}, 0, 'cruise')
+
+
+def test_run_race_same_seed_same_result():
+    first = tournament.run_race({}, 7, 'dodge', max_steps=600)
+    second = tournament.run_race({}, 7, 'dodge', max_steps=600)
+    assert first == second
+
+
+def test_run_tournament_writes_results(tmp_path):
+    results_path = str(tmp_path / 'results.jsonl')
+    grid = {'NPC_SPAWN_INTERVAL': [0.5, 1]}
+
+    count = tournament.run_tournament(
+        grid, [1, 2], ['cruise'], results_path, workers=2, max_steps=60
+    )
+
+    assert count == 4
+    results = read_results(results_path)
+    assert len(results) == 4
+    assert {(r['params']['NPC_SPAWN_INTERVAL'], r['seed']) for r in results} == {
+        (0.5, 1), (0.5, 2), (1, 1), (1, 2)
+    }
+
+
+def test_run_tournament_resumes(tmp_path):
+    results_path = str(tmp_path / 'results.jsonl')
+    tournament.run_tournament({}, [1], ['cruise'], results_path, workers=1, max_steps=30)
+    # An interrupted run can leave half a line at the end of the file
+    with open(results_path, 'a') as results_file:
+        results_file.write('{"run_id": ')
+
+    count = tournament.run_tournament(
+        {}, [1, 2], ['cruise'], results_path, workers=1, max_steps=30
+    )
+
+    # Only the new seed is raced
+    assert count == 1
+    assert tournament.run_tournament(
+        {}, [1, 2], ['cruise'], results_path, workers=1, max_steps=30
+    ) == 0
+
+
+def test_run_tournament_records_failed_races(tmp_path):
+    results_path = str(tmp_path / 'results.jsonl')
+    # A setting value the game can't use makes that race raise
+    grid = {'MAX_NPCS': [3, 'many']}
+
+    count = tournament.run_tournament(
+        grid, [1], ['cruise'], results_path, workers=1, max_steps=30
+    )
+
+    # The good race still finished and was saved
+    assert count == 2
+    results = {r['params']['MAX_NPCS']: r for r in read_results(results_path)}
+    assert 'score' in results[3]
+    assert 'TypeError' in results['many']['error']
+    # Failed races are tried again when the tournament is resumed
+    assert tournament.load_finished(results_path) == {results[3]['run_id']}
+
+
+def test_dodge_bot_single_lane(monkeypatch):
+    monkeypatch.setattr(settings, 'LANE_POSITIONS', [settings.SCREEN_WIDTH // 2])
+    # An NPC close ahead in the only lane, with the player in the middle
+    observation = [1.0, 0.1, 0.5, 0.0, 0.0]
+
+    # Nowhere to dodge to, so just drive on
+    assert tournament.dodge_bot(observation) == (True, False, False, False)
@@ -0,0 +1,136 @@
+import gc
+import json
+import pytest
+
+import tracer
+
+
+@pytest.fixture
+def trace_path(tmp_path):
+    path = tmp_path / "trace.json"
+    yield path
+    # Never leave a trace running into another test
+    tracer.stop()
+
+
+@pytest.fixture
+def no_gc():
+    # Stop garbage collections adding their own events
+    gc.disable()
+    yield
+    gc.enable()
+
+
+def read_events(path):
+    with open(path) as trace_file:
+        return json.load(trace_file)
+
+
+def test_span_records_begin_and_end(trace_path):
+    tracer.start(str(trace_path))
+    with tracer.span("update"):
+        with tracer.span("spawn_npc_car"):
+            pass
+    tracer.stop()
+
+    events = [
+        (event["ph"], event["name"])
+        for event in read_events(trace_path)
+        if event["cat"] == "game"
+    ]
+    assert events == [
+        ("B", "update"),
+        ("B", "spawn_npc_car"),
+        ("E", "spawn_npc_car"),
+        ("E", "update"),
+    ]
+
+
+def test_span_timestamps_increase(trace_path):
+    tracer.start(str(trace_path))
+    for _ in range(10):
+        with tracer.span("draw"):
+            pass
+    tracer.stop()
+
+    timestamps = [event["ts"] for event in read_events(trace_path)]
+    assert timestamps == sorted(timestamps)
+
+
+def test_span_without_tracer_records_nothing(trace_path):
+    assert not tracer.enabled()
+    with tracer.span("draw"):
+        pass
+    assert not trace_path.exists()
+
+
+def test_span_ends_when_body_raises(trace_path, no_gc):
+    tracer.start(str(trace_path))
+    with pytest.raises(ValueError):
+        with tracer.span("update"):
+            raise ValueError
+    tracer.stop()
+
+    phases = [event["ph"] for event in read_events(trace_path)]
+    assert phases == ["B", "E"]
+
+
+def test_events_stream_to_disk_when_buffer_fills(trace_path, no_gc):
+    active = tracer.start(str(trace_path), buffer_events=4)
+    for _ in range(5):
+        with tracer.span("draw"):
+            pass
+
+    # Only the events since the last flush are held in memory
+    assert active.written == 8
+    assert len(active.buffer) == 2
+    # The unfinished file already holds the flushed events
+    assert trace_path.read_text().count('"ph": "B"') == 4
+
+    tracer.stop()
+    assert len(read_events(trace_path)) == 10
+
+
+def test_gc_pauses_are_spans(trace_path):
+    tracer.start(str(trace_path))
+    gc.collect()
+    tracer.stop()
+
+    gc_events = [
+        event for event in read_events(trace_path) if event["cat"] == "gc"
+    ]
+    assert [event["ph"] for event in gc_events] == ["B", "E"]
+    assert gc_events[0]["args"]["generation"] == 2
+
+
+def test_gc_during_flush_is_written_once(trace_path, mocker):
+    active = tracer.start(str(trace_path), buffer_events=2)
+    dumps = tracer.json.dumps
+
+    def dumps_with_gc(event):
+        # A collection starts and ends while an event is encoded
+        if event["cat"] == "game" and event["ph"] == "B":
+            active._gc_callback("start", {"generation": 0})
+            active._gc_callback("stop", {"collected": 0})
+        return dumps(event)
+
+    mocker.patch("tracer.json.dumps", side_effect=dumps_with_gc)
+    with tracer.span("draw"):
+        pass
+    mocker.stopall()
+    tracer.stop()
+
+    events = [
+        (event["cat"], event["ph"]) for event in read_events(trace_path)
+    ]
+    assert sorted(events) == sorted(
+        [("game", "B"), ("game", "E"), ("gc", "B"), ("gc", "E")]
+    )
+
+
+def test_stop_removes_gc_callback(trace_path):
+    active = tracer.start(str(trace_path))
+    tracer.stop()
+
+    assert active._gc_callback not in gc.callbacks
+    assert not tracer.enabled()
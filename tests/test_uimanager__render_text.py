@@ -0,0 +1,81 @@
+import pytest
+from unittest.mock import MagicMock
+import pygame
+import settings
+from ui_manager import UIManager
+
+
+@pytest.fixture
+def ui_manager(mocker):
+    """
+    UIManager whose fonts render fresh mock surfaces on every call
+    """
+    mock_font_instance = MagicMock(spec=pygame.font.Font)
+    mock_font_instance.render.side_effect = lambda *args: MagicMock(spec=pygame.Surface)
+    mocker.patch('pygame.font.Font', return_value=mock_font_instance)
+    mocker.patch('pygame.font.SysFont', return_value=mock_font_instance)
+    return UIManager()
+
+
+def test_render_text_reuses_surface_for_same_text(ui_manager):
+    font = ui_manager.default_font
+
+    first = ui_manager._render_text("Score: 10", font, settings.WHITE)
+    second = ui_manager._render_text("Score: 10", font, settings.WHITE)
+
+    # The text is only rendered once, and the same surface comes back
+    font.render.assert_called_once_with("Score: 10", True, settings.WHITE)
+    assert first[0] is second[0]
+
+
+def test_render_text_rects_are_independent(ui_manager):
+    font = ui_manager.default_font
+    font.render.side_effect = lambda *args: pygame.Surface((50, 10))
+
+    _, first_rect = ui_manager._render_text("Score: 10", font, settings.WHITE)
+    first_rect.topleft = (100, 200)
+    _, second_rect = ui_manager._render_text("Score: 10", font, settings.WHITE)
+
+    # Placing one copy of the text doesn't move the other
+    assert first_rect is not second_rect
+    assert second_rect.topleft == (0, 0)
+
+
+def test_render_text_rerenders_when_value_changes(ui_manager):
+    font = ui_manager.default_font
+
+    first_surface, _ = ui_manager._render_text("Score: 10", font, settings.WHITE)
+    second_surface, _ = ui_manager._render_text("Score: 20", font, settings.WHITE)
+    # A different colour is a different cache entry
+    third_surface, _ = ui_manager._render_text("Score: 20", font, settings.GREEN)
+
+    assert font.render.call_count == 3
+    assert len({id(first_surface), id(second_surface), id(third_surface)}) == 3
+
+
+def test_render_text_evicts_least_recently_used(ui_manager):
+    font = ui_manager.default_font
+    ui_manager.text_cache_size = 2
+
+    ui_manager._render_text("a", font, settings.WHITE)
+    ui_manager._render_text("b", font, settings.WHITE)
+    # Touch "a" so "b" becomes the least recently used entry
+    ui_manager._render_text("a", font, settings.WHITE)
+    ui_manager._render_text("c", font, settings.WHITE)
+
+    assert len(ui_manager.text_cache) == 2
+    assert ("a", font, settings.WHITE) in ui_manager.text_cache
+    assert ("b", font, settings.WHITE) not in ui_manager.text_cache
+    assert ("c", font, settings.WHITE) in ui_manager.text_cache
+
+
+def test_display_score_renders_once_per_value(ui_manager):
+    font = ui_manager.default_font
+    mock_screen = MagicMock(spec=pygame.Surface)
+
+    # Drawing the same score every frame only renders it once
+    for _ in range(60):
+        ui_manager.display_score(mock_screen, 30)
+
+    font.render.assert_called_once_with("Score: 30", True, ui_manager.text_colour)
+    assert mock_screen.blit.call_count == 60
@@ -4,9 +4,11 @@ from unittest.mock import Mock, patch, call
 import settings  # Assuming settings.py is accessible
 from ui_manager import UIManager  # Assuming ui_manager.py is accessible
 
-# Mock Pygame initialization globally if UIManager or its dependencies call it at import time
+# Mock Pygame font initialization for these tests only, so other test modules still get real fonts
 # For UIManager, pygame.font.Font/SysFont is the main concern at init
-pygame.font.init = Mock()  # Prevent actual font init
+@pytest.fixture(autouse=True)
+def mock_font_init(monkeypatch):
+    monkeypatch.setattr(pygame.font, 'init', Mock())  # Prevent actual font init
 
 
 @pytest.fixture
@@ -119,13 +121,47 @@ def test_display_game_over_typical_scores_all_elements(ui_manager_instance, mock
     assert mock_rect_high_score.center == (int(settings.SCREEN_WIDTH / 2), int(settings.SCREEN_HEIGHT / 2 + 60))
     assert mock_rect_restart.center == (int(settings.SCREEN_WIDTH / 2), int(settings.SCREEN_HEIGHT / 2 + 130))
 
-    # Assert blit calls in order (checks all elements are drawn in sequence)
-    expected_blit_calls = [
-        call(mock_overlay_surface, (0, 0)),
+    # Assert the text is composed onto the overlay, static lines first
+    expected_overlay_blit_calls = [
         call(mock_surface_game_over, mock_rect_game_over),
+        call(mock_surface_restart, mock_rect_restart),
         call(mock_surface_final_score, mock_rect_final_score),
         call(mock_surface_high_score, mock_rect_high_score),
-        call(mock_surface_restart, mock_rect_restart),
     ]
-    mock_screen.blit.assert_has_calls(expected_blit_calls, any_order=False)
-    assert mock_screen.blit.call_count == 5
\ No newline at end of file
+    mock_overlay_surface.blit.assert_has_calls(expected_overlay_blit_calls, any_order=False)
+    assert mock_overlay_surface.blit.call_count == 4
+
+    # Assert the whole screen is drawn with a single blit
+    mock_screen.blit.assert_called_once_with(mock_overlay_surface, (0, 0))
+
+
+def test_display_game_over_reuses_overlay_between_frames(ui_manager_instance, mock_screen, mock_pygame_settings):
+    # Showing the same scores again should not rebuild or re-render anything
+    for font in (ui_manager_instance.large_font, ui_manager_instance.medium_font, ui_manager_instance.default_font):
+        font.render = Mock(side_effect=lambda *args: pygame.Surface((10, 10), pygame.SRCALPHA))
+
+    ui_manager_instance.display_game_over(mock_screen, 100, 200)
+    overlay = ui_manager_instance.game_over_overlay
+    for _ in range(10):
+        ui_manager_instance.display_game_over(mock_screen, 100, 200)
+
+    assert ui_manager_instance.game_over_overlay is overlay
+    assert ui_manager_instance.large_font.render.call_count == 1
+    assert ui_manager_instance.medium_font.render.call_count == 2
+    assert ui_manager_instance.default_font.render.call_count == 1
+    assert mock_screen.blit.call_count == 11
+
+
+def test_display_game_over_patches_changed_score_only(ui_manager_instance, mock_screen, mock_pygame_settings):
+    # A new score only re-renders the final score line
+    for font in (ui_manager_instance.large_font, ui_manager_instance.medium_font, ui_manager_instance.default_font):
+        font.render = Mock(side_effect=lambda *args: pygame.Surface((10, 10), pygame.SRCALPHA))
+
+    ui_manager_instance.display_game_over(mock_screen, 100, 200)
+    ui_manager_instance.display_game_over(mock_screen, 150, 200)
+
+    assert ui_manager_instance.large_font.render.call_count == 1
+    ui_manager_instance.medium_font.render.assert_called_with("Final Score: 150", True, ui_manager_instance.text_colour)
+    assert ui_manager_instance.medium_font.render.call_count == 3
+    assert ui_manager_instance.game_over_score == 150
+    assert ui_manager_instance.game_over_high_score == 200
@@ -0,0 +1,44 @@
+import pytest
+import pygame
+from unittest.mock import Mock, patch
+import settings
+from ui_manager import UIManager, OVERLAY_COLOUR
+
+
+@pytest.fixture
+def ui_manager_instance():
+    # Fonts that render small real surfaces
+    mock_font = Mock()
+    mock_font.render = Mock(side_effect=lambda *args: pygame.Surface((10, 10), pygame.SRCALPHA))
+    mock_font.get_height = Mock(return_value=20)
+    with patch('pygame.font.Font', return_value=mock_font):
+        return UIManager()
+
+
+def test_display_instructions_single_blit(ui_manager_instance):
+    mock_screen = Mock(spec=pygame.Surface)
+
+    ui_manager_instance.display_instructions(mock_screen)
+
+    # The overlay is composed once and drawn with one blit
+    overlay = ui_manager_instance.instructions_overlay
+    assert overlay.get_size() == (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+    assert overlay.get_flags() & pygame.SRCALPHA
+    mock_screen.blit.assert_called_once_with(overlay, (0, 0))
+    # Background of the overlay is the translucent overlay colour
+    assert tuple(overlay.get_at((0, 0))) == OVERLAY_COLOUR
+
+
+def test_display_instructions_built_once(ui_manager_instance):
+    mock_screen = Mock(spec=pygame.Surface)
+
+    ui_manager_instance.display_instructions(mock_screen)
+    render_calls = ui_manager_instance.default_font.render.call_count
+    overlay = ui_manager_instance.instructions_overlay
+    for _ in range(10):
+        ui_manager_instance.display_instructions(mock_screen)
+
+    # No text is re-rendered and no new surfaces are allocated while idle
+    assert ui_manager_instance.default_font.render.call_count == render_calls
+    assert ui_manager_instance.instructions_overlay is overlay
+    assert mock_screen.blit.call_count == 11
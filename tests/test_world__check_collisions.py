@@ -0,0 +1,157 @@
+import pytest
+from unittest.mock import MagicMock
+import pygame
+
+import assets
+import settings
+from world import World
+
+
+# --- Pytest Fixture for World instance ---
+@pytest.fixture
+def world_instance_fixture(mocker):
+    # The player car only needs a rect to collide with
+    mock_player_car = mocker.patch('world.PlayerCar').return_value
+    mock_player_car.rect = pygame.Rect(460, 600, 80, 160)
+    world = World()
+    world.game_over = False  # Set initial state
+    return world
+
+
+# --- Test Class for _check_collisions ---
+class TestWorldCheckCollisions:
+
+    def test_no_collision_detected(self, world_instance_fixture):
+        # Arrange
+        world = world_instance_fixture
+        # An NPC in the next lane along, level with the player
+        world.npcs.spawn(settings.LANE_POSITIONS[6], world.player_car.rect.centery, 8, 6)
+
+        # Act
+        world._check_collisions()
+
+        # Assert
+        # game_over state should remain False
+        assert world.game_over is False
+
+    def test_collision_detected(self, world_instance_fixture):
+        # Arrange
+        world = world_instance_fixture
+        # An NPC in the player's lane, overlapping the player's front
+        world.npcs.spawn(settings.LANE_POSITIONS[5], world.player_car.rect.top, 8, 5)
+
+        # Act
+        world._check_collisions()
+
+        # Assert
+        # game_over state should become True
+        assert world.game_over is True
+
+    def test_touching_edges_do_not_collide(self, world_instance_fixture):
+        # Arrange
+        world = world_instance_fixture
+        npcs = world.npcs
+        # An NPC whose bottom edge touches the player's top edge,
+        # which pygame.Rect.colliderect doesn't count as a collision
+        npcs.spawn(
+            settings.LANE_POSITIONS[5],
+            world.player_car.rect.top - npcs.car_height // 2 - npcs.car_height % 2,
+            8,
+            5,
+        )
+        assert npcs.tops()[0] + npcs.car_height == world.player_car.rect.top
+
+        # Act
+        world._check_collisions()
+
+        # Assert
+        assert world.game_over is False
+
+    def test_collision_stops_the_world(self, world_instance_fixture):
+        # Arrange
+        world = world_instance_fixture
+        world.game_over = True
+        world.current_road_speed = 10
+        world._apply_inputs = MagicMock()
+
+        # Act
+        world.step(MagicMock())
+
+        # Assert
+        # Nothing moves after a crash
+        assert world.road_offset == 0.0
+        world._apply_inputs.assert_not_called()
+        world.player_car.update.assert_not_called()
+
+
+# --- Pixel-accurate collisions with the real car images ---
+@pytest.fixture
+def real_world(monkeypatch, tmp_path):
+    # Load sprites from source images, not from a local bake
+    monkeypatch.setattr(settings, 'ASSET_CACHE_DIR', str(tmp_path))
+    assets.clear_cache()
+    yield World
+    assets.clear_cache()
+
+
+def spawn_on_corner(world, overlap):
+    # Put an NPC in lane 4, and the player down and to the right of it, so
+    # the NPC's bottom right corner overlaps the player's top left corner
+    # by overlap pixels
+    npcs = world.npcs
+    npcs.spawn(settings.LANE_POSITIONS[4], 200, 0, 4)
+    world.player_car.rect.topleft = (
+        npcs.lefts()[0] + npcs.car_width - overlap,
+        npcs.tops()[0] + npcs.car_height - overlap,
+    )
+
+
+def test_mask_mode_ignores_transparent_corners(real_world, monkeypatch):
+    monkeypatch.setattr(settings, 'COLLISION_MODE', 'mask')
+    world = real_world()
+    spawn_on_corner(world, 5)
+
+    world._check_collisions()
+
+    # The rects overlap, but only where the car images are transparent
+    rect = world.player_car.rect
+    assert len(world.npcs.candidates(rect, world._lanes_under(rect))) > 0
+    assert world.game_over is False
+
+
+def test_mask_mode_detects_touching_pixels(real_world, monkeypatch):
+    monkeypatch.setattr(settings, 'COLLISION_MODE', 'mask')
+    world = real_world()
+    spawn_on_corner(world, 40)
+
+    world._check_collisions()
+
+    assert world.game_over is True
+
+
+def test_rect_mode_skips_masks(real_world, monkeypatch):
+    monkeypatch.setattr(settings, 'COLLISION_MODE', 'rect')
+    world = real_world()
+    spawn_on_corner(world, 5)
+
+    world._check_collisions()
+
+    # No masks are built, and any rect overlap is a crash
+    assert world.player_car.mask is None
+    assert world.npc_mask is None
+    assert world.game_over is True
+
+
+def test_only_lanes_under_the_player_are_checked(real_world, mocker):
+    world = real_world()
+    rect = world.player_car.rect
+    candidates = mocker.spy(world.npcs, 'candidates')
+
+    world._check_collisions()
+
+    # The player straddles the lanes either side of its centre
+    lanes = candidates.call_args.args[1].tolist()
+    assert lanes
+    for lane_id in lanes:
+        left = settings.LANE_POSITIONS[lane_id] - world.npcs.car_width // 2
+        assert left < rect.right and left + world.npcs.car_width > rect.left
@@ -0,0 +1,132 @@
+import pytest
+import pygame  # Required for pygame.Rect and pygame.sprite.Group
+from world import World, InputState  # The class we are testing
+from car import PlayerCar  # For mocker.patch spec
+from npc_manager import NPCManager
+
+
+@pytest.fixture
+def world_instance(mocker):
+    # PlayerCar needs to be a mock object we can control, especially its rect
+    mock_player_car_class = mocker.patch("world.PlayerCar")
+    mock_player_car_instance = mocker.Mock(spec=PlayerCar)
+    mock_player_car_instance.rect = pygame.Rect(0, 0, 50, 100)  # x, y, width, height
+    mock_player_car_instance.horizontal_speed = 0
+    mock_player_car_instance.x_float = 25.0
+    mock_player_car_class.return_value = mock_player_car_instance
+
+    world = World()
+    # Reset score for clean test state
+    world.score = 0
+    # Set a consistent player car bottom position for calculations
+    world.player_car.rect.bottom = 400
+    # Fresh NPC storage with a known car size (width, height)
+    world.npcs = NPCManager(5, 30, 60, 1)
+    return world
+
+
+def add_npc(world, top_pos):
+    # Helper to spawn a stationary NPC with its top at top_pos, returning its id
+    return world.npcs.spawn(100, top_pos + world.npcs.car_height // 2, 0, 0)
+
+
+def despawn(world):
+    # Helper to move every NPC off the bottom of the screen and step the world
+    world.npcs.y[: len(world.npcs)] = world.screen_height + 1
+    world.step(InputState())
+
+
+def test_npc_passed_first_time(world_instance):
+    # Test case 1: NPC is passed by player for the first time
+    # Player car bottom is at y=400
+    # NPC top is at y=410 (meaning it's "below" or "further down" than player, hence passed)
+    npc1 = add_npc(world_instance, top_pos=world_instance.player_car.rect.bottom + 10)
+
+    world_instance._update_score()
+
+    assert world_instance.score == 10
+    assert world_instance.pass_events == [npc1]  # One score event
+    assert world_instance.npcs.passed[0]
+
+
+def test_npc_already_passed(world_instance):
+    # Test case 2: NPC has already been passed and is checked again
+    add_npc(world_instance, top_pos=world_instance.player_car.rect.bottom + 10)
+    world_instance._update_score()  # NPC1 is now passed, score is 10
+
+    world_instance._update_score()
+
+    assert world_instance.score == 10  # Score should not change
+    assert world_instance.pass_events == []  # No second score event
+    assert world_instance.npcs.passed[0]
+
+
+def test_npc_not_yet_passed(world_instance):
+    # Test case 3: NPC has not yet been passed by the player
+    # NPC top is at y=390 (meaning it's "above" or "less far down" than player)
+    add_npc(world_instance, top_pos=world_instance.player_car.rect.bottom - 10)
+
+    world_instance._update_score()
+
+    assert world_instance.score == 0
+    assert world_instance.pass_events == []
+    assert not world_instance.npcs.passed[0]
+
+
+def test_no_npc_cars(world_instance):
+    # Test case 4: There are no NPC cars on screen
+    # NPC storage is empty by default in fixture for this test
+
+    world_instance._update_score()
+
+    assert world_instance.score == 0
+    assert world_instance.pass_events == []
+
+
+def test_passed_npc_despawns(world_instance):
+    # Test case 5: A previously passed NPC despawns (is not alive)
+    # NPC is passed
+    npc1 = add_npc(world_instance, top_pos=world_instance.player_car.rect.bottom + 10)
+    world_instance._update_score()  # NPC1 is now passed, score is 10
+
+    assert world_instance.score == 10
+    assert world_instance.pass_events == [npc1]
+
+    # Now npc1 despawns
+    despawn(world_instance)
+
+    assert world_instance.score == 10  # Score should remain from the initial pass
+    assert world_instance.pass_events == []
+    # No pass state is left behind for the despawned NPC
+    assert len(world_instance.npcs) == 0
+
+
+def test_unpassed_npc_despawns(world_instance):
+    # Test case 6: An NPC that was never passed despawns
+    # NPC is not passed
+    add_npc(world_instance, top_pos=world_instance.player_car.rect.bottom - 10)
+    world_instance._update_score()  # NPC1 is not passed, score is 0
+
+    assert world_instance.score == 0
+    assert world_instance.pass_events == []
+
+    # Now npc1 despawns
+    despawn(world_instance)
+
+    assert world_instance.score == 0  # Score remains 0
+    assert world_instance.pass_events == []  # Despawning doesn't score
+
+
+def test_pass_flag_follows_npc_when_others_despawn(world_instance):
+    # Pass flags move with their NPC when the arrays are compacted
+    world_instance.npcs.spawn(100, world_instance.screen_height + 100, 0, 0)
+    npc2 = add_npc(world_instance, top_pos=world_instance.player_car.rect.bottom + 10)
+    world_instance._update_score()
+    assert world_instance.score == 20
+
+    # The first NPC despawns, leaving the second in slot 0
+    world_instance.step(InputState())
+
+    assert world_instance.npcs.ids[0] == npc2
+    assert world_instance.npcs.passed[0]
+    assert world_instance.score == 20
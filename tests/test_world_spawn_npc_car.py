@@ -0,0 +1,128 @@
+import pytest
+from unittest.mock import patch
+
+# world and settings modules need to be in PYTHONPATH
+from world import World
+import settings
+
+
+@pytest.fixture
+def world_for_spawn_test(monkeypatch):
+    """
+    Fixture for World instance, specifically for spawn_npc_car tests
+    Mocks the player car, NPCs are stored in the world's arrays
+    """
+    monkeypatch.setattr(settings, 'MAX_NPCS', 5)  # Ensure MAX_NPCS allows spawning
+    with patch('world.PlayerCar'):
+        world = World()
+        # world.npcs starts empty
+        return world
+
+
+# Test for spawning an NPC when the count is below the maximum
+def test_spawn_npc_car_when_below_max(mocker, world_for_spawn_test):
+    # Setup
+    world = world_for_spawn_test
+    # Mock the world's random generator used in spawn_npc_car
+    mock_randint = mocker.patch.object(world.rng, 'randint')
+    assert len(world.npcs) == 0, "Initial NPC car count should be 0"
+
+    # Lane 0, then the minimum speed
+    mock_randint.side_effect = [0, settings.NPC_MIN_SPEED]
+
+    # Execution
+    world.spawn_npc_car()
+
+    # Assertions
+    assert len(world.npcs) == 1, "One NPC should be added to the NPC arrays"
+    assert world.npcs.lane[0] == 0
+    assert world.npcs.speed[0] == settings.NPC_MIN_SPEED
+
+
+# Test for attempting to spawn an NPC when the count is at maximum
+def test_spawn_npc_car_when_at_max(mocker, world_for_spawn_test, monkeypatch):
+    # Setup
+    world = world_for_spawn_test
+    # Mock the world's random generator used in spawn_npc_car
+    mock_randint = mocker.patch.object(world.rng, 'randint')
+    monkeypatch.setattr(settings, 'MAX_NPCS', 2)  # Set a specific MAX_NPCS for this test
+
+    # Manually fill the NPC arrays up to MAX_NPCS, far down the screen
+    for lane_id in range(settings.MAX_NPCS):
+        world.npcs.spawn(settings.LANE_POSITIONS[lane_id], 700, 8, lane_id)
+
+    assert len(world.npcs) == settings.MAX_NPCS, "NPC car count should be at MAX_NPCS for this test"
+
+    # Execution
+    world.spawn_npc_car()  # Attempt to spawn another NPC
+
+    # Assertions
+    # Count should not have changed, and no lane or speed was rolled
+    assert len(world.npcs) == settings.MAX_NPCS, "NPC count should remain at MAX_NPCS"
+    mock_randint.assert_not_called()
+
+
+# Test for verifying the properties of a spawned NPC
+def test_spawn_npc_car_initializes_with_correct_parameters(mocker, world_for_spawn_test):
+    # Setup
+    world = world_for_spawn_test
+    # Mock the world's random generator used in spawn_npc_car
+    mock_randint = mocker.patch.object(world.rng, 'randint')
+
+    # Define expected properties for the new NPC
+    expected_lane = 2  # Choose a specific lane for predictability
+    expected_speed = settings.NPC_MIN_SPEED + 1  # A speed within the defined range
+    mock_randint.side_effect = [expected_lane, expected_speed]
+
+    # Execution
+    world.spawn_npc_car()
+
+    # Assertions
+    # The NPC is centred on its lane, one car height above the screen
+    npcs = world.npcs
+    assert npcs.x[0] + npcs.car_width // 2 == settings.LANE_POSITIONS[expected_lane]
+    assert npcs.y[0] + npcs.car_height // 2 == -settings.PLACEHOLDER_CAR_HEIGHT
+    assert npcs.speed[0] == expected_speed
+    assert npcs.lane[0] == expected_lane
+
+
+# Test that a lane with a car near the top of the screen is skipped
+def test_spawn_npc_car_skips_blocked_lane(mocker, world_for_spawn_test):
+    # Setup
+    world = world_for_spawn_test
+    # Mock the world's random generator used in spawn_npc_car
+    mock_randint = mocker.patch.object(world.rng, 'randint')
+    # Lane 0 has a car just above the screen
+    world.npcs.spawn(settings.LANE_POSITIONS[0], 0, 8, 0)
+    # The first free lane is picked
+    mock_randint.side_effect = [0, settings.NPC_MIN_SPEED]
+
+    # Execution
+    world.spawn_npc_car()
+
+    # Assertions
+    # Lane 0 is blocked, so the first free lane is lane 1
+    assert len(world.npcs) == 2
+    assert world.npcs.lane[1] == 1
+    # The lane is picked from the free ones in a single roll
+    mock_randint.assert_any_call(0, len(settings.LANE_POSITIONS) - 2)
+
+
+# Test that nothing spawns when every lane is blocked
+def test_spawn_npc_car_all_lanes_blocked(mocker, world_for_spawn_test, monkeypatch):
+    # Setup
+    world = world_for_spawn_test
+    # Mock the world's random generator used in spawn_npc_car
+    mock_randint = mocker.patch.object(world.rng, 'randint')
+    monkeypatch.setattr(settings, 'MAX_NPCS', 100)
+    for lane_id in range(len(settings.LANE_POSITIONS)):
+        world.npcs.spawn(settings.LANE_POSITIONS[lane_id], 0, 8, lane_id)
+
+    # Execution
+    npc_id = world.spawn_npc_car()
+
+    # Assertions
+    # The spawn is skipped instead of looping forever
+    assert npc_id is None
+    assert len(world.npcs) == len(settings.LANE_POSITIONS)
+    mock_randint.assert_not_called()
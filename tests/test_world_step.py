@@ -0,0 +1,149 @@
+import pytest
+import pygame
+
+from world import World, InputState
+import settings
+
+
+@pytest.fixture
+def world_instance(monkeypatch, tmp_path):
+    # Load sprites from source images, not from a local bake
+    monkeypatch.setattr(settings, 'ASSET_CACHE_DIR', str(tmp_path))
+    # No display is needed to run the simulation
+    assert pygame.display.get_surface() is None
+    return World()
+
+
+def test_step_accelerate_moves_road(world_instance):
+    world_instance.step(InputState(accelerate=True))
+    world_instance.step(InputState(accelerate=True))
+
+    dt = world_instance.dt
+    assert world_instance.current_road_speed == pytest.approx(settings.ACCELERATION_CONSTANT * dt * 2)
+    # The road moves by the speed for one step after each step
+    assert world_instance.road_offset == pytest.approx(settings.ACCELERATION_CONSTANT * dt * 3 * dt)
+    # ...and remembers where it was at the start of the last step
+    assert world_instance.previous_road_offset == pytest.approx(settings.ACCELERATION_CONSTANT * dt * dt)
+
+
+def test_step_brake_never_reverses(world_instance):
+    world_instance.step(InputState(brake=True))
+
+    assert world_instance.current_road_speed == 0
+    assert world_instance.road_offset == 0
+
+
+def test_step_speed_capped(world_instance):
+    world_instance.current_road_speed = settings.MAX_SPEED
+
+    world_instance.step(InputState(accelerate=True))
+
+    assert world_instance.current_road_speed == settings.MAX_SPEED
+
+
+def test_step_steering(world_instance):
+    start_x = world_instance.player_car.rect.x
+
+    # Steering speeds the car up sideways over a few steps
+    for _ in range(3):
+        world_instance.step(InputState(left=True))
+    assert world_instance.player_car.rect.x < start_x
+
+    # Letting go of the steering stops the car moving sideways
+    world_instance.step(InputState())
+    assert world_instance.player_car.horizontal_speed == 0
+
+
+def test_step_runs_headless_with_traffic(world_instance, monkeypatch):
+    monkeypatch.setattr(settings, 'MAX_NPCS', 3)
+
+    # Thousands of frames can run without a display
+    for frame in range(2000):
+        if frame % settings.SIMULATION_HZ == 0:
+            world_instance.spawn_npc_car()
+        world_instance.step(InputState(accelerate=True))
+
+    assert pygame.display.get_surface() is None
+    assert world_instance.road_offset > 0
+    assert len(world_instance.npcs) <= 3
+
+
+def test_step_speed_independent_of_tick_rate(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, 'ASSET_CACHE_DIR', str(tmp_path))
+
+    # Drive at top speed for one simulated second at two tick rates
+    distances = []
+    for tick_rate in (30, 120):
+        monkeypatch.setattr(settings, 'SIMULATION_HZ', tick_rate)
+        world = World()
+        world.current_road_speed = settings.MAX_SPEED
+        for _ in range(tick_rate):
+            world.step(InputState(accelerate=True))
+        distances.append(world.road_offset)
+
+    assert distances[0] == pytest.approx(settings.MAX_SPEED)
+    assert distances[1] == pytest.approx(settings.MAX_SPEED)
+
+
+def drive(world, steps):
+    # Accelerate through traffic, spawning an NPC every 30 steps
+    for frame in range(steps):
+        if frame % 30 == 0:
+            world.spawn_npc_car()
+        world.step(InputState(accelerate=True))
+    npcs = world.npcs
+    count = len(npcs)
+    return (
+        npcs.x[:count].tolist(),
+        npcs.y[:count].tolist(),
+        npcs.speed[:count].tolist(),
+        world.score,
+        world.game_over,
+    )
+
+
+def test_step_same_seed_same_traffic(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, 'ASSET_CACHE_DIR', str(tmp_path))
+    first = World(seed=42)
+    second = World(seed=42)
+
+    assert drive(first, 600) == drive(second, 600)
+
+    # Resetting with the seed replays the race
+    first.reset(seed=42)
+    second.reset(seed=42)
+    assert first.seed == 42
+    assert drive(first, 300) == drive(second, 300)
+
+
+def test_step_unseeded_reset_can_be_replayed(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, 'ASSET_CACHE_DIR', str(tmp_path))
+    world = World(seed=42)
+    drive(world, 300)
+
+    # A reset without a seed starts a new race with a new seed...
+    world.reset()
+    assert world.seed != 42
+    race = drive(world, 600)
+
+    # ...which replays that race
+    replay = World(seed=world.seed)
+    assert drive(replay, 600) == race
+
+
+def test_step_spawns_on_simulated_time(world_instance, monkeypatch):
+    steps_per_spawn = int(settings.NPC_SPAWN_INTERVAL * settings.SIMULATION_HZ)
+
+    for _ in range(steps_per_spawn - 1):
+        world_instance.step(InputState())
+    assert len(world_instance.npcs) == 0
+
+    # The first NPC spawns once a spawn interval of simulated time passes
+    world_instance.step(InputState())
+    assert len(world_instance.npcs) == 1
+
+    # Resetting restarts the schedule
+    world_instance.reset()
+    for _ in range(steps_per_spawn - 1):
+        world_instance.step(InputState())
+    assert len(world_instance.npcs) == 0
@@ -0,0 +1,245 @@
+import argparse
+import concurrent.futures
+import itertools
+import json
+import os
+
+import settings
+
+from env import RacingEnv
+
+# Longest race, in simulation steps, before it is stopped
+DEFAULT_MAX_STEPS = 60 * 60 * 5
+
+
+def cruise_bot(observation):
+    # Hold the accelerator and never steer
+    return (True, False, False, False)
+
+
+def dodge_bot(observation):
+    # Accelerate, and when something is close ahead in a lane the player's
+    # car overlaps, steer towards the side with the most room
+    lanes = settings.LANE_POSITIONS
+    lane_count = len(lanes)
+    # With a single lane there is nowhere to steer to
+    if lane_count < 2:
+        return (True, False, False, False)
+    gaps = observation[lane_count : lane_count * 2]
+    player_x = observation[lane_count * 2] * settings.SCREEN_WIDTH
+    spacing = lanes[1] - lanes[0]
+    near = [n for n in range(lane_count) if abs(lanes[n] - player_x) < spacing]
+
+    if min(gaps[n] for n in near) > 0.6:
+        return (True, False, False, False)
+    # Room in the lanes just beyond the ones the car is in, or none past
+    # the edge of the road
+    left_gap = gaps[near[0] - 1] if near[0] > 0 else -1.0
+    right_gap = gaps[near[-1] + 1] if near[-1] < lane_count - 1 else -1.0
+    if left_gap >= right_gap:
+        return (True, False, True, False)
+    return (True, False, False, True)
+
+
+# Bots that can be entered into a tournament, by name
+BOTS = {"cruise": cruise_bot, "dodge": dodge_bot}
+
+
+def expand_grid(grid):
+    """
+    Turn {setting: [values]} into one {setting: value} dict per combination
+    """
+    names = sorted(grid)
+    return [
+        dict(zip(names, values))
+        for values in itertools.product(*(grid[name] for name in names))
+    ]
+
+
+def run_id(params, seed, bot):
+    # Identifies a run in the results file, so finished runs can be skipped
+    return json.dumps(
+        {"params": params, "seed": seed, "bot": bot}, sort_keys=True
+    )
+
+
+def apply_settings(overrides):
+    """
+    Set values in the settings module, returning the previous values so
+    they can be restored
+    """
+    previous = {}
+    for name, value in overrides.items():
+        if not hasattr(settings, name):
+            raise ValueError(f"Unknown setting: {name}")
+        previous[name] = getattr(settings, name)
+        setattr(settings, name, value)
+    return previous
+
+
+def run_race(params, seed, bot, max_steps=DEFAULT_MAX_STEPS):
+    """
+    Run one headless race with the given settings, seed and bot, and
+    return its result
+    """
+    # Each worker process has its own settings module, but runs many
+    # races, so the overrides are undone afterwards
+    previous = apply_settings(params)
+    try:
+        policy = BOTS[bot]
+        env = RacingEnv(max_steps=max_steps)
+        observation, info = env.reset(seed=seed)
+        terminated = truncated = False
+        while not (terminated or truncated):
+            observation, reward, terminated, truncated, info = env.step(
+                policy(observation)
+            )
+        return {
+            "run_id": run_id(params, seed, bot),
+            "params": params,
+            "seed": seed,
+            "bot": bot,
+            "score": info["score"],
+            "frames": info["steps"],
+            "survival_time": info["steps"] * env.world.dt,
+            "crashed": terminated,
+        }
+    finally:
+        apply_settings(previous)
+
+
+def load_finished(results_path):
+    """
+    Return the ids of runs already in the results file
+    """
+    finished = set()
+    if not os.path.exists(results_path):
+        return finished
+    with open(results_path, "r") as results_file:
+        for line in results_file:
+            try:
+                result = json.loads(line)
+            # Skip a line cut short by an interrupted run
+            except ValueError:
+                continue
+            # Failed runs are tried again
+            if "run_id" in result and "error" not in result:
+                finished.add(result["run_id"])
+    return finished
+
+
+def _drop_partial_line(results_path):
+    # Cut off a result left half-written by an interrupted run, so new
+    # results start on a line of their own
+    if not os.path.exists(results_path):
+        return
+    with open(results_path, "rb+") as results_file:
+        data = results_file.read()
+        if data and not data.endswith(b"\n"):
+            results_file.truncate(data.rfind(b"\n") + 1)
+
+
+def run_tournament(
+    grid, seeds, bots, results_path, workers=None, max_steps=DEFAULT_MAX_STEPS
+):
+    """
+    Race every combination of settings, seed and bot across a process pool,
+    appending each result to results_path (JSON lines) as it finishes.
+    Runs already in the file are skipped, so an interrupted tournament
+    carries on where it stopped. A race that raises is recorded with its
+    error instead of stopping the tournament. Returns the number of races
+    run
+    """
+    _drop_partial_line(results_path)
+    finished = load_finished(results_path)
+    tasks = [
+        (params, seed, bot)
+        for params in expand_grid(grid)
+        for seed in seeds
+        for bot in bots
+        if run_id(params, seed, bot) not in finished
+    ]
+    if not tasks:
+        return 0
+
+    with concurrent.futures.ProcessPoolExecutor(workers) as pool, open(
+        results_path, "a"
+    ) as results_file:
+        futures = {
+            pool.submit(run_race, params, seed, bot, max_steps): (
+                params,
+                seed,
+                bot,
+            )
+            for params, seed, bot in tasks
+        }
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as error:
+                # Record the failed configuration and carry on
+                params, seed, bot = futures[future]
+                result = {
+                    "run_id": run_id(params, seed, bot),
+                    "params": params,
+                    "seed": seed,
+                    "bot": bot,
+                    "error": repr(error),
+                }
+            results_file.write(json.dumps(result) + "\n")
+            # Save each result straight away so it survives an interruption
+            results_file.flush()
+    return len(tasks)
+
+
+def parse_param(text):
+    # Parse NAME=value1,value2,... into a name and list of values
+    name, _, values = text.partition("=")
+    if not values:
+        raise argparse.ArgumentTypeError(f"Expected NAME=v1,v2: {text}")
+    return name, [json.loads(value) for value in values.split(",")]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Race bots headlessly over a grid of settings."
+    )
+    parser.add_argument(
+        "--grid",
+        help="JSON file mapping setting names to lists of values",
+    )
+    parser.add_argument(
+        "--param",
+        type=parse_param,
+        action="append",
+        default=[],
+        help="setting values to try, as NAME=v1,v2 (can be repeated)",
+    )
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0])
+    parser.add_argument(
+        "--bots", nargs="+", choices=sorted(BOTS), default=["dodge"]
+    )
+    parser.add_argument("--results", default="tournament_results.jsonl")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-steps", type=int, default=DEFAULT_MAX_STEPS)
+    args = parser.parse_args()
+
+    grid = {}
+    if args.grid:
+        with open(args.grid, "r") as grid_file:
+            grid.update(json.load(grid_file))
+    grid.update(dict(args.param))
+
+    count = run_tournament(
+        grid,
+        args.seeds,
+        args.bots,
+        args.results,
+        workers=args.workers,
+        max_steps=args.max_steps,
+    )
+    print(f"Ran {count} races, results in {args.results}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+import gc
+import json
+import os
+import threading
+import time
+
+# Events held in memory before they are written to the trace file
+DEFAULT_BUFFER_EVENTS = 1000
+
+# Tracer recording events, or None when tracing is off
+_active = None
+
+
+class Tracer:
+    """
+    Records begin/end spans as Chrome trace events (the JSON array format
+    read by chrome://tracing and Perfetto). Events are buffered and
+    streamed to the file whenever buffer_events have built up, so a long
+    session never holds more than that many in memory
+    """
+
+    def __init__(self, path, buffer_events=DEFAULT_BUFFER_EVENTS):
+        self.path = path
+        self.buffer_events = buffer_events
+        self.buffer = []
+        # Events written to the file so far
+        self.written = 0
+        # Whether a flush is under way
+        self.flushing = False
+
+        self.pid = os.getpid()
+        # Timestamps are microseconds since the tracer started
+        self.start_ns = time.perf_counter_ns()
+
+        # An unterminated array is still a valid trace, so the file can
+        # be opened even if the game is killed before close()
+        self.file = open(path, "w")
+        self.file.write("[\n")
+
+        # Garbage collections show up as spans too
+        gc.callbacks.append(self._gc_callback)
+
+    def _event(self, phase, name, category, args=None):
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": phase,
+            "ts": (time.perf_counter_ns() - self.start_ns) / 1000,
+            "pid": self.pid,
+            "tid": threading.get_native_id(),
+        }
+        if args:
+            event["args"] = args
+        self.buffer.append(event)
+        if len(self.buffer) >= self.buffer_events:
+            self.flush()
+
+    def begin(self, name, category="game", args=None):
+        self._event("B", name, category, args)
+
+    def end(self, name, category="game", args=None):
+        self._event("E", name, category, args)
+
+    def _gc_callback(self, phase, info):
+        if phase == "start":
+            self.begin("gc", "gc", {"generation": info["generation"]})
+        else:
+            self.end("gc", "gc", {"collected": info["collected"]})
+
+    def flush(self):
+        # Write the buffered events to the file and empty the buffer. A
+        # garbage collection can record events while they are encoded, so
+        # the buffer is swapped for an empty one first, and a flush those
+        # events start waits for the next one
+        if self.flushing or not self.buffer:
+            return
+        self.flushing = True
+        events, self.buffer = self.buffer, []
+        try:
+            lines = [json.dumps(event) for event in events]
+            if self.written:
+                self.file.write(",\n")
+            self.file.write(",\n".join(lines))
+            self.file.flush()
+            self.written += len(lines)
+        finally:
+            self.flushing = False
+
+    def close(self):
+        # Stop tracing garbage collections and finish the file
+        if self._gc_callback in gc.callbacks:
+            gc.callbacks.remove(self._gc_callback)
+        self.flush()
+        self.file.write("\n]\n")
+        self.file.close()
+
+
+class _Span:
+    """
+    Context manager recording a span on the active tracer, if there is
+    one
+    """
+
+    __slots__ = ("name", "category", "args", "tracer")
+
+    def __init__(self, name, category, args):
+        self.name = name
+        self.category = category
+        self.args = args
+        self.tracer = None
+
+    def __enter__(self):
+        self.tracer = _active
+        if self.tracer is not None:
+            self.tracer.begin(self.name, self.category, self.args)
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.tracer is not None:
+            self.tracer.end(self.name, self.category)
+        return False
+
+
+def start(path, buffer_events=DEFAULT_BUFFER_EVENTS):
+    """
+    Start writing a trace to path, replacing any trace already running.
+    Returns the tracer
+    """
+    global _active
+    stop()
+    _active = Tracer(path, buffer_events)
+    return _active
+
+
+def stop():
+    # Finish the running trace, if there is one
+    global _active
+    if _active is not None:
+        _active.close()
+        _active = None
+
+
+def enabled():
+    return _active is not None
+
+
+def span(name, category="game", args=None):
+    # Time the body of a with block as a span (nothing is recorded while
+    # tracing is off)
+    return _Span(name, category, args)
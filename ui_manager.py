@@ -1,6 +1,35 @@
+from collections import OrderedDict
+
 import pygame
 import settings
 
+# Colour of the translucent overlay behind instructions and game over text
+OVERLAY_COLOUR = (0, 0, 0, 180)
+
+
+class HudText(pygame.sprite.DirtySprite):
+    """
+    HUD text as a sprite, so dirty-rect rendering can track its changes
+    """
+
+    def __init__(self, anchor, position):
+        super().__init__()
+        # Which point of the text rect is pinned to the position
+        self.anchor = anchor
+        self.position = position
+        self.text = None
+        self.image = pygame.Surface((0, 0), pygame.SRCALPHA)
+        self.rect = self.image.get_rect()
+
+    def set_text(self, text, surface):
+        # Only flag the sprite for redrawing if the text changed
+        if text == self.text:
+            return
+        self.text = text
+        self.image = surface
+        self.rect = surface.get_rect(**{self.anchor: self.position})
+        self.dirty = 1
+
 
 class UIManager:
     def __init__(
@@ -27,19 +56,64 @@ class UIManager:
         self.screen_width = settings.SCREEN_WIDTH
         self.screen_height = settings.SCREEN_HEIGHT
 
-    def display_instructions(self, screen):
+        # Cache of rendered text surfaces, least recently used first
+        self.text_cache = OrderedDict()
+        self.text_cache_size = settings.TEXT_CACHE_SIZE
+
+        # Overlay screens, built the first time they are displayed
+        self.instructions_overlay = None
+        self.game_over_overlay = None
+        # Scores currently drawn on the game over overlay, and where
+        self.game_over_score = None
+        self.game_over_high_score = None
+        self.game_over_line_rects = {}
+
+        # HUD sprites used by dirty-rect rendering
+        self.score_text = HudText("topleft", (40, 20))
+        self.high_score_text = HudText(
+            "topright", (self.screen_width - 40, 20)
+        )
+
+    def _render_text(self, text, font, colour):
+        # Reuse the rendered surface if this text was drawn before
+        key = (text, font, colour)
+        surface = self.text_cache.get(key)
+        if surface is not None:
+            self.text_cache.move_to_end(key)
+        else:
+            # Render the text and store its surface
+            surface = font.render(text, True, colour)
+            self.text_cache[key] = surface
+
+            # Evict the least recently used text once the cache is full
+            if len(self.text_cache) > self.text_cache_size:
+                self.text_cache.popitem(last=False)
+        # Each caller gets its own rect to position
+        return surface, surface.get_rect()
+
+    def _new_overlay(self):
         # Translucent overlay to make text easier to read
         overlay = pygame.Surface(
             (self.screen_width, self.screen_height), pygame.SRCALPHA
         )
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        overlay.fill(OVERLAY_COLOUR)
+        return overlay
+
+    def display_instructions(self, screen):
+        # Build the instructions overlay the first time it is shown
+        if self.instructions_overlay is None:
+            self.instructions_overlay = self._build_instructions_overlay()
+        screen.blit(self.instructions_overlay, (0, 0))
+
+    def _build_instructions_overlay(self):
+        overlay = self._new_overlay()
 
         instructions_content = [
             ("Instructions", self.large_font, settings.WHITE),
             # Spacer
             ("", self.default_font, settings.WHITE),
-            ("Use Arrow Keys or WASD to Steer", self.default_font, settings.WHITE),
+            ("Use Arrow Keys or WASD to Steer",
+             self.default_font, settings.WHITE),
             ("UP / W : Accelerate", self.default_font, settings.WHITE),
             ("DOWN / S : Brake", self.default_font, settings.WHITE),
             # Spacer
@@ -65,41 +139,87 @@ class UIManager:
             rect = surface.get_rect()
             rect.centerx = int(self.screen_width / 2)
             rect.top = int(current_y)
-            screen.blit(surface, rect)
+            overlay.blit(surface, rect)
             # Add padding between lines
             current_y += font.get_height() + 10
 
+        return overlay
+
     def display_score(self, screen, score):
         score_text = f"Score: {score}"
-        # Create score text surface
-        surface = self.default_font.render(score_text, True, self.text_colour)
+        # Get score text surface (only re-rendered when the score changes)
+        surface, rect = self._render_text(
+            score_text, self.default_font, self.text_colour
+        )
         # Set score position
-        rect = surface.get_rect()
         rect.topleft = (40, 20)
         # Draw to screen
         screen.blit(surface, rect)
 
     def display_high_score(self, screen, high_score):
         high_score_text = f"High Score: {high_score}"
-        # Create high score text surface
-        surface = self.default_font.render(
-            high_score_text, True, self.text_colour
+        # Get high score text surface (only re-rendered when it changes)
+        surface, rect = self._render_text(
+            high_score_text, self.default_font, self.text_colour
         )
         # Set high score position
-        rect = surface.get_rect()
         rect.topright = (self.screen_width - 40, 20)
         # Draw to screen
         screen.blit(surface, rect)
 
-    def display_game_over(self, screen, score, high_score):
-        # Translucent overlay to make text easier to read
-        overlay = pygame.Surface(
-            (self.screen_width, self.screen_height), pygame.SRCALPHA
+    def update_hud(self, score, high_score, visible=True):
+        # Show or hide the HUD sprites (only flagging them if that changed)
+        for hud_text in (self.score_text, self.high_score_text):
+            if hud_text.visible != visible:
+                hud_text.visible = visible
+
+        # Point the HUD sprites at the (cached) text for the current scores
+        score_text = f"Score: {score}"
+        surface, _ = self._render_text(
+            score_text, self.default_font, self.text_colour
+        )
+        self.score_text.set_text(score_text, surface)
+
+        high_score_text = f"High Score: {high_score}"
+        surface, _ = self._render_text(
+            high_score_text, self.default_font, self.text_colour
         )
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        self.high_score_text.set_text(high_score_text, surface)
+
+    def display_game_over(self, screen, score, high_score):
+        # Build the static part of the overlay the first time it is shown
+        if self.game_over_overlay is None:
+            self.game_over_overlay = self._build_game_over_overlay()
 
-        # Render "GMAE OVER" text
+        # Patch the score lines only when they have changed
+        if score != self.game_over_score:
+            self._patch_overlay_line(
+                "final_score",
+                f"Final Score: {score}",
+                (
+                    int(self.screen_width / 2),
+                    int(self.screen_height / 2),
+                ),
+            )
+            self.game_over_score = score
+        if high_score != self.game_over_high_score:
+            self._patch_overlay_line(
+                "high_score",
+                f"High Score: {high_score}",
+                (
+                    int(self.screen_width / 2),
+                    int(self.screen_height / 2 + 60),
+                ),
+            )
+            self.game_over_high_score = high_score
+
+        # Draw the whole game over screen in one blit
+        screen.blit(self.game_over_overlay, (0, 0))
+
+    def _build_game_over_overlay(self):
+        overlay = self._new_overlay()
+
+        # Render "GAME OVER" text
         game_over_text = "GAME OVER"
         game_over_surface = self.large_font.render(
             game_over_text, True, settings.RED
@@ -109,31 +229,7 @@ class UIManager:
             int(self.screen_width / 2),
             int(self.screen_height / 2 - 100),
         )
-        screen.blit(game_over_surface, game_over_rect)
-
-        # Render "Final Score: " text
-        final_score_text = f"Final Score: {score}"
-        final_score_surface = self.medium_font.render(
-            final_score_text, True, self.text_colour
-        )
-        final_score_rect = final_score_surface.get_rect()
-        final_score_rect.center = (
-            int(self.screen_width / 2),
-            int(self.screen_height / 2),
-        )
-        screen.blit(final_score_surface, final_score_rect)
-
-        # Render "High Score: " text
-        high_score_display_text = f"High Score: {high_score}"
-        high_score_surface = self.medium_font.render(
-            high_score_display_text, True, self.text_colour
-        )
-        high_score_rect = high_score_surface.get_rect()
-        high_score_rect.center = (
-            int(self.screen_width / 2),
-            int(self.screen_height / 2 + 60),
-        )
-        screen.blit(high_score_surface, high_score_rect)
+        overlay.blit(game_over_surface, game_over_rect)
 
         # Render "Press R to Restart" text
         restart_text = "Press R to Restart"
@@ -145,4 +241,20 @@ class UIManager:
             int(self.screen_width / 2),
             int(self.screen_height / 2 + 130),
         )
-        screen.blit(restart_surface, restart_rect)
\ No newline at end of file
+        overlay.blit(restart_surface, restart_rect)
+
+        return overlay
+
+    def _patch_overlay_line(self, line, text, centre):
+        # Clear the previous text for this line back to the overlay colour
+        old_rect = self.game_over_line_rects.get(line)
+        if old_rect is not None:
+            self.game_over_overlay.fill(OVERLAY_COLOUR, old_rect)
+
+        # Draw the new text in its place
+        surface, rect = self._render_text(
+            text, self.medium_font, self.text_colour
+        )
+        rect.center = centre
+        self.game_over_overlay.blit(surface, rect)
+        self.game_over_line_rects[line] = rect.copy()
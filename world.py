@@ -0,0 +1,246 @@
+import random
+
+import numpy as np
+import rules
+import settings
+import tracer
+
+from car import PlayerCar, car_asset, collision_table
+from npc_manager import NPCManager
+from spawn_scheduler import SpawnScheduler
+
+
+class InputState:
+    """
+    Controls held by the player for one simulation step
+    """
+
+    def __init__(self, accelerate=False, brake=False, left=False, right=False):
+        self.accelerate = accelerate
+        self.brake = brake
+        self.left = left
+        self.right = right
+
+
+class World:
+    """
+    Headless race simulation (road, player, NPC traffic, collisions and
+    scoring). Never touches the display, mixer or fonts
+    """
+
+    def __init__(self, seed=None):
+        # Define the size of the play area
+        self.screen_width = settings.SCREEN_WIDTH
+        self.screen_height = settings.SCREEN_HEIGHT
+
+        # Create the player car
+        self.player_car = PlayerCar(
+            settings.PLAYER_IMAGE_PATH,
+            settings.PLAYER_START_X_POS,
+            settings.PLAYER_Y_POS,
+            settings.HORIZONTAL_ACCELERATION_CONSTANT,
+        )
+
+        # NPC traffic is stored in arrays, sized from the shared NPC image
+        npc_asset = car_asset(settings.NPC_IMAGE_PATH, is_npc=True)
+        npc_width, npc_height = npc_asset.image.get_size()
+        # Every NPC shares one collision mask (None in rect collision mode)
+        self.npc_mask = npc_asset.mask
+        # Every offset at which an NPC's pixels touch the player's, shared
+        # with BatchEnv so both use the same hitboxes (None in rect mode)
+        self.collision_hits = None
+        if self.npc_mask is not None:
+            self.collision_hits = collision_table(
+                car_asset(settings.PLAYER_IMAGE_PATH).mask, self.npc_mask
+            )
+        # Left edge of an NPC in each lane
+        self.npc_lane_lefts = (
+            np.array(settings.LANE_POSITIONS) - npc_width // 2
+        )
+        self.npcs = NPCManager(
+            settings.MAX_NPCS,
+            npc_width,
+            npc_height,
+            len(settings.LANE_POSITIONS),
+        )
+
+        # Set starting values
+        self.game_over = False
+        self.score = 0
+        # Ids of the NPCs passed in the last step, one score event each
+        self.pass_events = []
+        self.current_road_speed = 0
+        # Total distance the road has scrolled, now and at the start of
+        # the last step
+        self.road_offset = 0.0
+        self.previous_road_offset = 0.0
+
+        # Length of one simulation step in seconds
+        self.dt = 1.0 / settings.SIMULATION_HZ
+
+        # Traffic is drawn from the world's own random generator, so the
+        # same seed and inputs always give the same race. Without a seed
+        # one is picked, so the race can still be replayed
+        if seed is None:
+            seed = random.randrange(2**32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        # NPCs spawn on simulated time, not the wall clock
+        self.spawner = SpawnScheduler(
+            settings.NPC_SPAWN_INTERVAL,
+            settings.NPC_SPAWN_MODE,
+            self.rng,
+            settings.NPC_SPAWN_JITTER,
+        )
+
+    def step(self, inputs):
+        # Score events only describe the step they happened in
+        self.pass_events = []
+        # Nothing moves once the player has crashed
+        if self.game_over:
+            return
+
+        # Remember where things were, so frames can be drawn in between
+        self.previous_road_offset = self.road_offset
+        self.player_car.previous_x_float = self.player_car.x_float
+
+        # Spawn any NPCs due during this step
+        for _ in range(self.spawner.advance(self.dt)):
+            self.spawn_npc_car()
+
+        self._apply_inputs(inputs)
+
+        # Move the road, player and NPCs
+        self.road_offset += self.current_road_speed * self.dt
+        self.player_car.update(self.screen_width)
+        self.npcs.update(self.current_road_speed, self.screen_height, self.dt)
+
+        self._check_collisions()
+        self._update_score()
+
+    def _apply_inputs(self, inputs):
+        # Change road speed based on accelerate/brake input
+        self.current_road_speed = float(
+            rules.throttle(
+                self.current_road_speed,
+                inputs.accelerate,
+                inputs.brake,
+                self.dt,
+            )
+        )
+
+        if inputs.left:
+            self.player_car.move_horizontal(-1, self.dt)
+        # If the player is moving left and not steering left,
+        # set horizontal speed to 0
+        elif self.player_car.horizontal_speed < 0:
+            self.player_car.horizontal_speed = 0
+
+        if inputs.right:
+            self.player_car.move_horizontal(1, self.dt)
+        # If the player is moving right and not steering right,
+        # set horizontal speed to 0
+        elif self.player_car.horizontal_speed > 0:
+            self.player_car.horizontal_speed = 0
+
+    def spawn_npc_car(self):
+        """
+        Spawn an NPC in a random free lane. Returns its id, or None if
+        there are already MAX_NPCS or no lane is free
+        """
+        with tracer.span("spawn_npc_car"):
+            return self._spawn_npc_car()
+
+    def _spawn_npc_car(self):
+        # If there are fewer cars than the maximum on screen
+        if len(self.npcs) >= settings.MAX_NPCS:
+            return None
+
+        # NPCs too close to the top of the screen block their lane
+        free_lanes = self.npcs.free_lanes(self.screen_height)
+        if len(free_lanes) == 0:
+            return None
+
+        # Pick one of the free lanes at random
+        lane_id = int(free_lanes[self.rng.randint(0, len(free_lanes) - 1)])
+        # Set NPC x position based on the selected lane
+        npc_x_pos = settings.LANE_POSITIONS[lane_id]
+
+        # Set y pos based on height of car
+        npc_y_pos = -settings.PLACEHOLDER_CAR_HEIGHT
+        # Set random speed in between defined min and max speed
+        npc_speed = self.rng.randint(
+            settings.NPC_MIN_SPEED, settings.NPC_MAX_SPEED
+        )
+
+        # Add the new NPC to the traffic arrays
+        return self.npcs.spawn(npc_x_pos, npc_y_pos, npc_speed, lane_id)
+
+    def _lanes_under(self, rect):
+        # Ids of the lanes whose NPCs could overlap rect
+        return np.flatnonzero(
+            (self.npc_lane_lefts < rect.right)
+            & (self.npc_lane_lefts + self.npcs.car_width > rect.left)
+        )
+
+    def _check_collisions(self):
+        # Only NPCs in the lanes the player's rect spans can be hit
+        rect = self.player_car.rect
+        lanes = self._lanes_under(rect)
+        # Find the NPCs in those lanes whose rect overlaps the player's
+        candidates = self.npcs.candidates(rect, lanes)
+        if len(candidates) == 0:
+            return
+
+        # In rect mode, any overlap is a crash
+        if self.collision_hits is None:
+            self.game_over = True
+            return
+
+        # Otherwise only a crash if the cars' pixels overlap
+        hits = rules.mask_overlaps(
+            self.collision_hits,
+            rect.left,
+            rect.top,
+            rules.whole_pixels(self.npcs.x[candidates]),
+            rules.whole_pixels(self.npcs.y[candidates]),
+            self.npcs.car_width,
+            self.npcs.car_height,
+        )
+        if hits.any():
+            # If player collides with an NPC car, the game is over
+            self.game_over = True
+
+    def _update_score(self):
+        # Each NPC scores once, in the step its top goes below the
+        # player's bottom
+        self.pass_events = self.npcs.mark_passed(
+            self.player_car.rect.bottom
+        ).tolist()
+        # Increase score
+        self.score += rules.PASS_SCORE * len(self.pass_events)
+
+    def reset(self, seed=None):
+        # Start the traffic again from the given seed, or a new one drawn
+        # from the generator, so every race can be replayed from its seed
+        if seed is None:
+            seed = self.rng.randrange(2**32)
+        self.seed = seed
+        self.rng.seed(seed)
+
+        # Reset variables back to starting values
+        self.game_over = False
+        self.score = 0
+        self.pass_events = []
+        self.road_offset = 0.0
+        self.previous_road_offset = 0.0
+
+        # Reset player position and road speed
+        self.player_car.reset_position()
+        self.player_car.horizontal_speed = 0
+        self.current_road_speed = 0
+
+        # Clear NPC cars and restart the spawn schedule
+        self.npcs.clear()
+        self.spawner.reset()